@@ -0,0 +1,67 @@
+"""
+Benchmark dos serializadores JSON para uma resposta com 5 mil certificados.
+
+Compara o serializador padrão do Powertools (json.dumps + Encoder) com os
+modos disponíveis em src.infrastructure.serialization.json_serializer.
+
+Uso:
+    python -m benchmarks.bench_json_serializer
+"""
+
+import json
+import timeit
+import uuid
+from functools import partial
+
+from aws_lambda_powertools.shared.json_encoder import Encoder
+
+from src.infrastructure.serialization import json_serializer
+
+CERTIFICATES = 5000
+ITERATIONS = 20
+
+
+def build_payload() -> list:
+    # Formato entregue ao serializer pelo resolver: dicts já convertidos para tipos JSON
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "order_id": 100000 + i,
+            "product_id": 1678,
+            "participant_name": f"Participante {i} da Silva",
+            "participant_email": f"participante{i}@example.com",
+            "participant_document": "123.456.789-00",
+            "certificate_url": f"https://bucket.s3.amazonaws.com/certificates/{i}.pdf",
+            "created_at": "2025-01-20T10:30:45",
+            "updated_at": "2025-01-20T10:30:45",
+            "success": True,
+            "email": f"participante{i}@example.com",
+            "product_name": "Workshop de Python Avançado",
+            "generated_date": "2025-01-20T10:30:45",
+            "time_checkin": "2025-01-15 09:00:00",
+        }
+        for i in range(CERTIFICATES)
+    ]
+
+
+def main() -> None:
+    payload = build_payload()
+
+    serializers = {
+        "powertools (json + Encoder)": partial(json.dumps, separators=(",", ":"), cls=Encoder),
+        "stdlib": json_serializer.dumps_stdlib,
+        "pydantic-core": json_serializer.dumps_pydantic,
+    }
+    if json_serializer.orjson is not None:
+        serializers["orjson"] = json_serializer.dumps_orjson
+    else:
+        print("orjson não instalado: modo orjson ignorado")
+
+    for name, serializer in serializers.items():
+        elapsed = timeit.timeit(lambda: serializer(payload), number=ITERATIONS)
+        size = len(serializer(payload).encode("utf-8"))
+        print(f"{name:<30} {elapsed / ITERATIONS * 1000:8.2f} ms/resposta  ({size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+Benchmark da conversão item do DynamoDB -> resposta HTTP para 10 mil certificados,
+em /certificate/fetch e em /users/<email>/certificates.
+
+Compara a cadeia antiga (Certificate(**item) -> DTO da aplicação -> DTO da
+apresentação, validando em cada salto) com o caminho atual: o repositório valida
+os itens em lote (TypeAdapter), o mapper projeta dicts sem validar e a
+apresentação valida a lista de respostas uma única vez.
+
+Uso:
+    python -m benchmarks.bench_read_path
+"""
+
+import os
+import timeit
+import uuid
+from typing import Optional
+
+from pydantic import BaseModel
+
+os.environ.setdefault("REGION", "us-east-1")
+os.environ.setdefault("BUILDER_QUEUE_URL", "https://example.com/queue")
+os.environ.setdefault("S3_BUCKET_NAME", "bucket")
+os.environ.setdefault("URL_SERVICE_TECH", "https://example.com")
+
+from src.application.mapper.certificate import CertificateResponseMapper
+from src.domain.entity.certificate import Certificate
+from src.infrastructure.repository.certificate_repository_impl import _to_certificates
+from src.main.handler.certificate import _USER_CERTIFICATE_ITEMS_ADAPTER, _to_fetch_responses
+from src.main.presentation.http_types.fetch_certificate import FetchCertificateResponse
+from src.main.presentation.http_types.list_user_certificates import UserCertificateItemResponse
+
+CERTIFICATES = 10000
+REPEAT = 7
+
+
+class LegacyFetchCertificateResponseDto(BaseModel):
+    """DTO da aplicação antes de virar dict tipado (um modelo validado por item)."""
+    id: Optional[str] = None
+    order_id: Optional[int] = None
+    product_id: Optional[int] = None
+    participant_name: Optional[str] = None
+    participant_email: Optional[str] = None
+    participant_document: Optional[str] = None
+    certificate_url: Optional[str] = None
+    certificate_key: Optional[str] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    email: Optional[str] = None
+    success: bool = True
+
+
+class LegacyUserCertificateItemDto(BaseModel):
+    """Item da listagem do participante antes de virar dict tipado."""
+    id: Optional[str] = None
+    order_id: Optional[int] = None
+    product_id: Optional[int] = None
+    participant_name: Optional[str] = None
+    participant_email: Optional[str] = None
+    participant_document: Optional[str] = None
+    certificate_url: Optional[str] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    success: Optional[bool] = None
+
+
+def build_items() -> list:
+    # Formato devolvido por DynamoDBService._convert_from_dynamodb_format (números como float)
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "order_id": float(100000 + i),
+            "order_date": "2025-01-10 12:00:00",
+            "product_id": 1678.0,
+            "product_name": "Workshop de Python Avançado",
+            "certificate_details": "Detalhes do certificado",
+            "certificate_logo": "https://example.com/logo.png",
+            "certificate_background": "https://example.com/background.png",
+            "certificate_key": f"certificates/{i}.pdf",
+            "certificate_url": f"https://bucket.s3.amazonaws.com/certificates/{i}.pdf",
+            "generated_date": "2025-01-20T10:30:45",
+            "success": True,
+            "participant_email": f"participante{i}@example.com",
+            "participant_first_name": "Participante",
+            "participant_last_name": f"{i} da Silva",
+            "participant_cpf": "123.456.789-00",
+            "participant_phone": "48999999999",
+            "participant_city": "Florianópolis",
+            "participant_email_product_key": f"participante{i}@example.com#1678",
+            "success_flag": 1,
+        }
+        for i in range(CERTIFICATES)
+    ]
+
+
+def legacy_path(items: list) -> list:
+    responses = []
+    for item in items:
+        certificate = Certificate(**item)
+        app_response = LegacyFetchCertificateResponseDto(
+            id=str(certificate.id),
+            order_id=certificate.order_id,
+            product_id=certificate.product_id,
+            participant_name=f"{certificate.participant_first_name or ''} {certificate.participant_last_name or ''}".strip(),
+            participant_email=certificate.participant_email,
+            participant_document=certificate.participant_cpf,
+            certificate_url=certificate.certificate_url,
+            certificate_key=certificate.certificate_key,
+            created_at=certificate.generated_date,
+            updated_at=certificate.generated_date,
+            email=certificate.participant_email,
+            success=certificate.success,
+        )
+        responses.append(FetchCertificateResponse(
+            id=app_response.id,
+            order_id=app_response.order_id,
+            product_id=app_response.product_id,
+            participant_name=app_response.participant_name,
+            participant_email=app_response.participant_email,
+            participant_document=app_response.participant_document,
+            certificate_url=app_response.certificate_url,
+            created_at=app_response.created_at,
+            updated_at=app_response.updated_at,
+            success=app_response.success,
+            email=app_response.email,
+        ))
+    return responses
+
+
+def current_path(items: list) -> list:
+    return _to_fetch_responses(CertificateResponseMapper.to_fetch_response_dtos(_to_certificates(items)))
+
+
+def legacy_list_path(items: list) -> list:
+    responses = []
+    for item in items:
+        certificate = Certificate(**item)
+        app_item = LegacyUserCertificateItemDto(
+            id=str(certificate.id),
+            order_id=certificate.order_id,
+            product_id=certificate.product_id,
+            participant_name=f"{certificate.participant_first_name or ''} {certificate.participant_last_name or ''}".strip(),
+            participant_email=certificate.participant_email,
+            participant_document=certificate.participant_cpf,
+            certificate_url=certificate.certificate_url,
+            created_at=certificate.generated_date,
+            updated_at=certificate.generated_date,
+            success=certificate.success,
+        )
+        responses.append(UserCertificateItemResponse(**vars(app_item)))
+    return responses
+
+
+def current_list_path(items: list) -> list:
+    return _USER_CERTIFICATE_ITEMS_ADAPTER.validate_python(
+        CertificateResponseMapper.to_user_certificate_item_dtos(_to_certificates(items))
+    )
+
+
+def main() -> None:
+    items = build_items()
+
+    benchmarks = (
+        ("fetch", legacy_path, current_path),
+        ("users/<email>", legacy_list_path, current_list_path),
+    )
+    for endpoint, legacy_path_fn, current_path_fn in benchmarks:
+        # Os dois caminhos precisam produzir a mesma resposta serializada
+        legacy = legacy_path_fn(items)
+        current = current_path_fn(items)
+        assert [r.model_dump() for r in legacy] == [r.model_dump() for r in current]
+
+        for name, path in (("validado em cada salto", legacy_path_fn), ("validado uma vez", current_path_fn)):
+            # Menor tempo entre as repetições, para reduzir o ruído do GC
+            elapsed = min(timeit.repeat(lambda: path(items), number=1, repeat=REPEAT))
+            print(f"{endpoint:<14} {name:<25} {elapsed * 1000:8.2f} ms/{CERTIFICATES} itens")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark de renderização das páginas de download.
+
+Compara o caminho antigo (Path.exists + open/read + formatação a cada
+requisição) com o TemplateLoader pré-compilado.
+
+Uso:
+    python -m benchmarks.bench_template_loader
+"""
+
+import timeit
+from pathlib import Path
+
+from src.main.presentation.template_loader import CompiledTemplate, TemplateLoader
+
+TEMPLATE_DIR = Path(__file__).resolve().parents[1] / "src" / "main" / "presentation" / "templates"
+CERTIFICATE_URL = "https://bucket.s3.amazonaws.com/certificates/123.pdf?X-Amz-Signature=abc&X-Amz-Expires=1800"
+ITERATIONS = 20000
+
+
+def legacy_load_template(template_name: str, **kwargs) -> str:
+    """Reproduz o custo por requisição do loader antigo: checagem, leitura do disco e formatação."""
+    template_path = TEMPLATE_DIR / template_name
+    if not template_path.exists():
+        raise FileNotFoundError(template_name)
+    with open(template_path, "r", encoding="utf-8") as file:
+        content = file.read()
+    return CompiledTemplate(template_name, content).render(**kwargs)
+
+
+def main() -> None:
+    loader = TemplateLoader(TEMPLATE_DIR)
+
+    cases = {
+        "download (legado)": lambda: legacy_load_template("certificate_download.html", certificate_url=CERTIFICATE_URL),
+        "download (compilado)": lambda: loader.load_template("certificate_download.html", certificate_url=CERTIFICATE_URL),
+        "not_found (legado)": lambda: legacy_load_template("certificate_not_found.html"),
+        "not_found (pré-renderizado)": lambda: loader.load_static_bytes("certificate_not_found.html"),
+        "not_found (pré-gzip)": lambda: loader.load_static_bytes("certificate_not_found.html", gzipped=True),
+    }
+
+    for name, case in cases.items():
+        elapsed = timeit.timeit(case, number=ITERATIONS)
+        print(f"{name:<30} {elapsed / ITERATIONS * 1_000_000:8.2f} µs/render")
+
+    raw = len(loader.load_static_bytes("certificate_not_found.html"))
+    gzipped = len(loader.load_static_bytes("certificate_not_found.html", gzipped=True))
+    print(f"certificate_not_found.html: {raw} bytes -> {gzipped} bytes (gzip)")
+
+
+if __name__ == "__main__":
+    main()
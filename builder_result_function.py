@@ -0,0 +1,8 @@
+from aws_lambda_powertools.utilities.typing import LambdaContext
+from src.main.handler.builder_result import builder_result_handler
+from src.infrastructure.retry.retry_policy import request_deadline
+
+# Entry point da Lambda acionada pela fila de resultados do builder
+def lambda_handler(event: dict, context: LambdaContext) -> dict:
+    with request_deadline(context):
+        return builder_result_handler(event)
@@ -1,10 +1,12 @@
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from src.infrastructure.aws.api_gateway_restr_resolver import app
+from src.infrastructure.retry.retry_policy import request_deadline
 
 # Importa os controladores para registrar as rotas
-from src.main.presentation.controller import certificate
+from src.main.presentation.controller import certificate, product
 
 def lambda_handler(event: dict, context: LambdaContext) -> dict:
-    return app.resolve(event, context)
+    with request_deadline(context):
+        return app.resolve(event, context)
     
 
@@ -0,0 +1,39 @@
+import logging
+
+from src.application.dto.apply_build_results_dto import ApplyBuildResultsRequestDto, ApplyBuildResultsResponseDto
+from src.domain.repository.certificate_repository import CertificateRepository
+from src.domain.response.build_result import BUILD_RESULT_FAILED, BUILD_RESULT_MISSING, BUILD_RESULT_UPDATED
+
+
+logger = logging.getLogger(__name__)
+
+
+class ApplyBuildResults:
+    """
+    Grava nos certificados os resultados publicados pelo builder (success,
+    certificate_key, certificate_url, generated_date) pelo caminho em lote do repositório.
+
+    Resultados sem certificado correspondente são apenas registrados: uma nova
+    tentativa não teria efeito. As falhas de gravação podem ser tentadas novamente.
+    """
+
+    def __init__(self, certificate_repository: CertificateRepository | None = None):
+        if certificate_repository is None:
+            from src.infrastructure.container.dependency_container import container
+
+            certificate_repository = container.get("certificate_repository")
+
+        self.certificate_repository = certificate_repository
+
+    def execute(self, request: ApplyBuildResultsRequestDto) -> ApplyBuildResultsResponseDto:
+        logger.info("Applying %s build results", len(request.results))
+        outcome = self.certificate_repository.apply_build_results(request.results)
+
+        response = ApplyBuildResultsResponseDto(
+            updated_order_ids=[order_id for order_id, status in outcome.items() if status == BUILD_RESULT_UPDATED],
+            missing_order_ids=[order_id for order_id, status in outcome.items() if status == BUILD_RESULT_MISSING],
+            failed_order_ids=[order_id for order_id, status in outcome.items() if status == BUILD_RESULT_FAILED],
+        )
+        if response.missing_order_ids:
+            logger.warning("Build results without certificate: %s", response.missing_order_ids)
+        return response
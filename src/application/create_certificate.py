@@ -1,6 +1,8 @@
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
+from src.domain.entity.certificate import Certificate
+from src.domain.entity.participant import Participant
 from src.domain.response.tech_floripa import TechOrdersResponse
 from src.domain.response.processed_orders import ProcessedOrdersResponse
 from src.application.mapper.tech_order import TechOrderMapper, TechProductMapper, TechParticipantMapper, CertificateMapper
@@ -9,7 +11,9 @@ from src.domain.repository.certificate_repository import CertificateRepository
 from src.domain.repository.participant_repository import ParticipantRepository
 from src.domain.repository.product_repository import ProductRepository
 from src.domain.repository.order_repository import OrderRepository
+from src.domain.repository.certified_orders_repository import CertifiedOrdersRepository
 
+from src.infrastructure.config.config import config
 from src.infrastructure.container.dependency_container import container
 
 logger = logging.getLogger()
@@ -24,6 +28,7 @@ class CreateCertificate:
         self.participant_repository:ParticipantRepository = container.get('participant_repository')
         self.product_repository:ProductRepository = container.get('product_repository')
         self.order_repository:OrderRepository = container.get('order_repository')
+        self.certified_orders_repository:CertifiedOrdersRepository = container.get('certified_orders_repository')
 
 
     def execute(self, tech_orders: List[TechOrdersResponse]) -> ProcessedOrdersResponse:
@@ -38,15 +43,47 @@ class CreateCertificate:
         # Valida e processa as ordens
         valid_orders, invalid_orders = self.__validate_tech_orders_with_time_checkin(tech_orders)
         
+        # Pedidos já certificados são pulados sem nenhuma leitura
+        certified_orders = self.__load_certified_orders(valid_orders)
+        pending_orders = [
+            order for order in valid_orders
+            if order.order_id not in certified_orders.get(order.product_id, set())
+        ]
+        if len(pending_orders) < len(valid_orders):
+            logger.info(f"Skipping {len(valid_orders) - len(pending_orders)} orders already certified.")
+
+        # Resolve de uma vez os certificados e participantes já cadastrados (BatchGetItem)
+        existing_certificates = self.certificate_repository.get_by_order_ids(
+            [order.order_id for order in pending_orders], projection=["success", "build_requested_at"]
+        )
+
+        # Pedidos enfileirados há pouco e ainda sem resultado não são reenviados
+        recently_requested = {
+            order_id for order_id, certificate in existing_certificates.items()
+            if not certificate.success and certificate.build_recently_requested(config.BUILD_REQUEST_SKIP_SECONDS)
+        }
+        if recently_requested:
+            logger.info(f"Skipping {len(recently_requested)} orders already sent to build.")
+            pending_orders = [order for order in pending_orders if order.order_id not in recently_requested]
+
+        known_participants = self.participant_repository.get_by_emails(order.email for order in pending_orders)
+
         # Processa as ordens válidas
         processed_orders = []
-        for order in valid_orders:
+        newly_certified: Dict[int, Set[int]] = {}
+        for order in pending_orders:
             try:
-                processed_order = self.__register_certificate(order)
+                processed_order = self.__register_certificate(
+                    order, known_participants, existing_certificates.get(order.order_id)
+                )
                 if processed_order:
                     processed_orders.append(processed_order)
+                else:
+                    newly_certified.setdefault(order.product_id, set()).add(order.order_id)
             except Exception as e:
                 logger.error(f"Error processing order {order.order_id}: {str(e)}")
+
+        self.__save_certified_orders(newly_certified)
         
 
         logger.info(f"Successfully processed {len(processed_orders)} certificates.")
@@ -77,7 +114,33 @@ class CreateCertificate:
         
         return valid_orders, invalid_orders
 
-    def __register_certificate(self, order: TechOrdersResponse) -> Optional[TechOrdersResponse]:
+    def __load_certified_orders(self, orders: List[TechOrdersResponse]) -> Dict[int, Set[int]]:
+        if not config.CERTIFIED_ORDERS_SKIP_ENABLED:
+            return {}
+        certified_orders = {}
+        for product_id in {order.product_id for order in orders}:
+            try:
+                certified_orders[product_id] = self.certified_orders_repository.get(product_id)
+            except Exception as e:
+                # Sem o conjunto, os pedidos do produto são verificados normalmente
+                logger.warning(f"Certified orders of product {product_id} unavailable: {str(e)}")
+        return certified_orders
+
+    def __save_certified_orders(self, newly_certified: Dict[int, Set[int]]) -> None:
+        if not config.CERTIFIED_ORDERS_SKIP_ENABLED:
+            return
+        for product_id, order_ids in newly_certified.items():
+            try:
+                self.certified_orders_repository.add(product_id, order_ids)
+            except Exception as e:
+                logger.warning(f"Error saving certified orders of product {product_id}: {str(e)}")
+
+    def __register_certificate(
+        self,
+        order: TechOrdersResponse,
+        known_participants: Dict[str, Participant],
+        certificate_exist: Optional[Certificate],
+    ) -> Optional[TechOrdersResponse]:
         
         
         logger.info(f"Registering certificate for order ID: {order.order_id} and product ID: {order.product_id}.")
@@ -89,16 +152,14 @@ class CreateCertificate:
             participant_entity = TechParticipantMapper.to_entity(order)            
 
 
-            # Verifica se existe um certificado para a ordem
-            certificate_exist = self.certificate_repository.get_by_order_id(order.order_id)
-            if certificate_exist and len(certificate_exist) > 0:
-                if certificate_exist[0].success:
-                    logger.info(f"Certificate already exists for order {order.order_id}, skipping certificate creation.")
-                    return None
+            # Verifica se existe um certificado gerado com sucesso para a ordem
+            if certificate_exist and certificate_exist.success:
+                logger.info(f"Certificate already exists for order {order.order_id}, skipping certificate creation.")
+                return None
            
 
             # Verifica se o participante já existe
-            participant_exist = self.participant_repository.get_by_email(order.email)
+            participant_exist = known_participants.get(order.email) or self.participant_repository.get_by_email(order.email)
             if not participant_exist:
                 logger.info(f"Participant not exists for order {order.order_id}, creating new participant.")
                 self.participant_repository.create(participant_entity)
@@ -122,8 +183,7 @@ class CreateCertificate:
                 logger.info(f"Order already exists for order {order.order_id}, skipping order.")
 
             certificate_entity = CertificateMapper.to_entity(order)
-            certificate_exist = self.certificate_repository.get_by_order_id(certificate_entity.order_id)
-            if not certificate_exist or len(certificate_exist) == 0:
+            if not certificate_exist:
                 logger.info(f"Certificate not exists for order {order.order_id}, creating new certificate.")
                 self.certificate_repository.create(certificate_entity)
             else:
@@ -0,0 +1,17 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+# Margem para escritas concorrentes e para a consistência eventual dos GSIs:
+# o próximo `since` recua alguns segundos, e o cliente pode receber um item repetido
+DELTA_POLL_SAFETY_SECONDS = 5
+
+
+def next_poll_time(now: Optional[datetime] = None) -> str:
+    """
+    Timestamp (UTC, ISO 8601) que o cliente deve enviar como `since` na próxima consulta.
+    Deve ser obtido antes da consulta ao DynamoDB.
+    """
+    if now is None:
+        now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(seconds=DELTA_POLL_SAFETY_SECONDS)
+    return cutoff.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
@@ -0,0 +1,15 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from src.domain.response.build_result import BuildResultResponse
+
+
+class ApplyBuildResultsRequestDto(BaseModel):
+    results: List[BuildResultResponse] = Field(default_factory=list)
+
+
+class ApplyBuildResultsResponseDto(BaseModel):
+    updated_order_ids: List[int] = Field(default_factory=list)
+    missing_order_ids: List[int] = Field(default_factory=list)
+    failed_order_ids: List[int] = Field(default_factory=list)
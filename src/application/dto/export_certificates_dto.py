@@ -0,0 +1,19 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+ExportFormat = Literal["ndjson", "csv"]
+
+
+class ExportCertificatesRequestDto(BaseModel):
+    product_id: int
+    format: ExportFormat = "ndjson"
+
+
+class ExportCertificatesResponseDto(BaseModel):
+    product_id: int
+    format: ExportFormat
+    key: str
+    download_url: str
+    expires_in: int
+    total: int
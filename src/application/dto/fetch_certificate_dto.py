@@ -1,4 +1,5 @@
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional, TypedDict
 from pydantic import BaseModel
 import uuid
 
@@ -7,6 +8,9 @@ class FetchCertificateRequestDto(BaseModel):
     order_id: Optional[int] = None
     email: Optional[str] = None
     product_id: Optional[int] = None
+    since: Optional[datetime] = None
+    # Campos da resposta pedidos pelo cliente (None = todos)
+    fields: Optional[List[str]] = None
     
     def __str__(self) -> str:
         params = []
@@ -16,26 +20,29 @@ class FetchCertificateRequestDto(BaseModel):
             params.append(f"email={self.email}")
         if self.product_id:
             params.append(f"product_id={self.product_id}")
+        if self.since:
+            params.append(f"since={self.since.isoformat()}")
+        if self.fields:
+            params.append(f"fields={','.join(self.fields)}")
         return f"FetchCertificateRequestDto({', '.join(params)})"
 
 
-class FetchCertificateResponseDto(BaseModel):
-    id: Optional[str] = None  # Mudando de UUID para string para compatibilidade
-    order_id: Optional[int] = None
-    product_id: Optional[int] = None
-    participant_name: Optional[str] = None
-    participant_email: Optional[str] = None
-    participant_document: Optional[str] = None
-    certificate_url: Optional[str] = None
-    certificate_key: Optional[str] = None
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
-    email: Optional[str] = None
-    success: bool = True
-    
-    
-    def __str__(self) -> str:
-        if self.success and self.id:
-            return f"FetchCertificateResponseDto(id={self.id}, order_id={self.order_id})"
-        else:
-            return f"FetchCertificateResponseDto(success={self.success})"
+class FetchCertificateResponseDto(TypedDict, total=False):
+    """
+    Certificado no formato de resposta, projetado de Certificates já validados
+    pelo repositório. É um dict tipado, e não um modelo, para a apresentação
+    validar cada item uma única vez ao montar a resposta HTTP.
+    Com `fields`, só os campos pedidos estão presentes.
+    """
+    id: Optional[str]  # Mudando de UUID para string para compatibilidade
+    order_id: Optional[int]
+    product_id: Optional[int]
+    participant_name: Optional[str]
+    participant_email: Optional[str]
+    participant_document: Optional[str]
+    certificate_url: Optional[str]
+    certificate_key: Optional[str]
+    created_at: Optional[str]
+    updated_at: Optional[str]
+    email: Optional[str]
+    success: bool
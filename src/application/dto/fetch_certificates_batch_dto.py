@@ -0,0 +1,18 @@
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from src.application.dto.fetch_certificate_dto import FetchCertificateResponseDto
+
+
+class FetchCertificatesBatchRequestDto(BaseModel):
+    order_ids: List[int] = Field(default_factory=list)
+    ids: List[str] = Field(default_factory=list)
+    fields: Optional[List[str]] = None
+
+
+class FetchCertificatesBatchResponseDto(BaseModel):
+    by_order_id: Dict[str, FetchCertificateResponseDto]
+    by_id: Dict[str, FetchCertificateResponseDto]
+    missing_order_ids: List[int]
+    missing_ids: List[str]
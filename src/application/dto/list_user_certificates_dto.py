@@ -1,4 +1,5 @@
-from typing import Optional
+from datetime import datetime
+from typing import Optional, TypedDict
 
 from pydantic import BaseModel
 
@@ -6,21 +7,28 @@ from pydantic import BaseModel
 class ListUserCertificatesRequestDto(BaseModel):
     email: str
     success: Optional[bool] = None
+    since: Optional[datetime] = None
 
 
-class UserCertificateItemDto(BaseModel):
-    id: Optional[str] = None
-    order_id: Optional[int] = None
-    product_id: Optional[int] = None
-    participant_name: Optional[str] = None
-    participant_email: Optional[str] = None
-    participant_document: Optional[str] = None
-    certificate_url: Optional[str] = None
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
-    success: Optional[bool] = None
+class UserCertificateItemDto(TypedDict):
+    """
+    Certificado do participante projetado de um Certificate já validado pelo
+    repositório. Assim como FetchCertificateResponseDto, é um dict tipado: a
+    apresentação valida cada item uma única vez ao montar a resposta HTTP.
+    """
+    id: Optional[str]
+    order_id: Optional[int]
+    product_id: Optional[int]
+    participant_name: Optional[str]
+    participant_email: Optional[str]
+    participant_document: Optional[str]
+    certificate_url: Optional[str]
+    created_at: Optional[str]
+    updated_at: Optional[str]
+    success: Optional[bool]
 
 
 class ListUserCertificatesResponseDto(BaseModel):
     email: str
     certificates: list[UserCertificateItemDto]
+    server_time: Optional[str] = None
@@ -0,0 +1,16 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ProductStatsRequestDto(BaseModel):
+    product_id: int
+
+
+class ProductStatsResponseDto(BaseModel):
+    product_id: int
+    total: int = 0
+    success: int = 0
+    failed: int = 0
+    pending: int = 0
+    updated_at: Optional[str] = None
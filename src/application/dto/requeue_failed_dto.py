@@ -0,0 +1,22 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class RequeueFailedRequestDto(BaseModel):
+    product_id: Optional[int] = None
+    limit: Optional[int] = None
+    # Cursor devolvido em next_start_after por uma execução anterior
+    start_after: Optional[str] = None
+
+
+class RequeueFailedResponseDto(BaseModel):
+    product_id: Optional[int] = None
+    requeued_order_ids: List[int] = Field(default_factory=list)
+    # Pedidos sem check-in gravado (ou sem pedido): não são reenviados
+    skipped_order_ids: List[int] = Field(default_factory=list)
+    messages_sent: int = 0
+    # Há mais certificados sem sucesso além do limite desta execução
+    truncated: bool = False
+    # Cursor para continuar de onde esta execução parou (só quando truncated)
+    next_start_after: Optional[str] = None
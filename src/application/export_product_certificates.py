@@ -0,0 +1,103 @@
+import csv
+import io
+import logging
+from datetime import datetime, timezone
+from typing import List
+
+from pydantic import TypeAdapter
+
+from src.application.dto.export_certificates_dto import (
+    ExportCertificatesRequestDto,
+    ExportCertificatesResponseDto,
+)
+from src.application.dto.fetch_certificate_dto import FetchCertificateResponseDto
+from src.application.mapper.certificate import CertificateResponseMapper
+from src.domain.repository.certificate_repository import CertificateRepository
+from src.infrastructure.aws.file_manager import FileManager
+from src.infrastructure.config.config import config
+
+
+logger = logging.getLogger(__name__)
+
+# Mesmas colunas de /certificate/fetch; a chave interna do S3 não é exportada
+EXPORT_FIELDS: List[str] = [
+    name for name in FetchCertificateResponseDto.__annotations__ if name != "certificate_key"
+]
+
+_EXPORT_INCLUDE = set(EXPORT_FIELDS)
+
+# Serializa cada linha do NDJSON (os dicts do mapper) direto para JSON
+_EXPORT_ROW_ADAPTER = TypeAdapter(FetchCertificateResponseDto)
+
+
+class ExportProductCertificates:
+    """
+    Exporta todos os certificados de um produto para um arquivo gzip no S3
+    e devolve um link pré-assinado para download.
+
+    Os certificados são lidos página a página de `certificates_by_product_idx`
+    e cada página é serializada e enviada antes da leitura da próxima, então o
+    uso de memória não cresce com o tamanho do evento.
+    """
+
+    def __init__(
+        self,
+        certificate_repository: CertificateRepository | None = None,
+        file_manager: FileManager | None = None,
+    ):
+        if certificate_repository is None or file_manager is None:
+            from src.infrastructure.container.dependency_container import container
+
+            certificate_repository = certificate_repository or container.get("certificate_repository")
+            file_manager = file_manager or container.get("file_manager")
+
+        self.certificate_repository = certificate_repository
+        self.file_manager = file_manager
+
+    def execute(self, request: ExportCertificatesRequestDto) -> ExportCertificatesResponseDto:
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        filename = f"certificates-{request.product_id}-{timestamp}.{request.format}.gz"
+        key = f"exports/products/{request.product_id}/{filename}"
+        logger.info(f"Exportando certificados do produto {request.product_id} para {key}")
+
+        total = 0
+        pages = self.certificate_repository.iter_by_product_id(
+            request.product_id,
+            page_size=config.EXPORT_PAGE_SIZE,
+        )
+        with self.file_manager.open_gzip_upload(key) as writer:
+            if request.format == "csv":
+                writer.write(_csv_lines([EXPORT_FIELDS]))
+            for certificates in pages:
+                dtos = CertificateResponseMapper.to_fetch_response_dtos(certificates)
+                if request.format == "csv":
+                    writer.write(_csv_lines(
+                        [[dto.get(field) for field in EXPORT_FIELDS] for dto in dtos]
+                    ))
+                else:
+                    writer.write(b"".join(
+                        _EXPORT_ROW_ADAPTER.dump_json(dto, include=_EXPORT_INCLUDE) + b"\n" for dto in dtos
+                    ))
+                total += len(dtos)
+
+        logger.info(f"Exportação do produto {request.product_id} concluída: {total} certificados")
+
+        download_url = self.file_manager.get_url(
+            key,
+            expires_in=config.EXPORT_URL_EXPIRES_IN,
+            disposition=f'attachment; filename="{filename}"',
+        )
+        return ExportCertificatesResponseDto(
+            product_id=request.product_id,
+            format=request.format,
+            key=key,
+            download_url=download_url,
+            expires_in=config.EXPORT_URL_EXPIRES_IN,
+            total=total,
+        )
+
+
+def _csv_lines(rows: List[list]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode("utf-8")
@@ -0,0 +1,54 @@
+import logging
+
+from src.application.dto.fetch_certificates_batch_dto import (
+    FetchCertificatesBatchRequestDto,
+    FetchCertificatesBatchResponseDto,
+)
+from src.application.mapper.certificate import CertificateResponseMapper
+from src.domain.repository.certificate_repository import CertificateRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+class FetchCertificatesBatch:
+    """
+    Resolve vários order_ids e/ou UUIDs de certificado numa única chamada.
+    Chaves repetidas são consultadas uma vez; as não encontradas são listadas em missing_*.
+    """
+
+    def __init__(self, certificate_repository: CertificateRepository | None = None):
+        if certificate_repository is None:
+            from src.infrastructure.container.dependency_container import container
+
+            certificate_repository = container.get("certificate_repository")
+
+        self.certificate_repository = certificate_repository
+
+    def execute(self, request: FetchCertificatesBatchRequestDto) -> FetchCertificatesBatchResponseDto:
+        order_ids = list(dict.fromkeys(request.order_ids))
+        ids = list(dict.fromkeys(request.ids))
+        logger.info("Fetching certificates batch: %s order_ids, %s ids", len(order_ids), len(ids))
+
+        projection = CertificateResponseMapper.projection_for(request.fields)
+        by_order_id = self.certificate_repository.get_by_order_ids(order_ids, projection=projection) if order_ids else {}
+        by_id = self.certificate_repository.find_by_ids(ids, projection=projection) if ids else {}
+
+        found_order_ids = [order_id for order_id in order_ids if order_id in by_order_id]
+        found_ids = [entity_id for entity_id in ids if entity_id in by_id]
+        order_id_dtos = CertificateResponseMapper.to_fetch_response_dtos(
+            [by_order_id[order_id] for order_id in found_order_ids],
+            request.fields,
+        )
+        id_dtos = CertificateResponseMapper.to_fetch_response_dtos(
+            [by_id[entity_id] for entity_id in found_ids],
+            request.fields,
+        )
+
+        # Os DTOs já vêm prontos do mapper; model_construct não os valida de novo
+        return FetchCertificatesBatchResponseDto.model_construct(
+            by_order_id={str(order_id): dto for order_id, dto in zip(found_order_ids, order_id_dtos)},
+            by_id=dict(zip(found_ids, id_dtos)),
+            missing_order_ids=[order_id for order_id in order_ids if order_id not in by_order_id],
+            missing_ids=[entity_id for entity_id in ids if entity_id not in by_id],
+        )
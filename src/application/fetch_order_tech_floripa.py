@@ -1,11 +1,15 @@
 import httpx
 import logging
 from typing import Dict, Any, List
-from retry import retry
 from src.infrastructure.config.config import config
+from src.infrastructure.retry.retry_policy import RetryPolicy, attempt_timeout
 
 logger = logging.getLogger(__name__)
 
+# Falhas de rede, timeouts, 429 e 5xx são repetidos dentro do prazo da invocação,
+# se ainda sobrarem 5s para a nova requisição
+FETCH_ORDERS_RETRY = RetryPolicy("fetch_orders", max_attempts=3, base_delay=2.0, max_delay=8.0, min_attempt_seconds=5.0)
+
 class FetchOrderTechFloripa:
     """
     Classe responsável por buscar ordens da API Tech Floripa.
@@ -33,13 +37,6 @@ class FetchOrderTechFloripa:
             'Pragma': 'no-cache'
         }
 
-    @retry(
-        exceptions=(httpx.RequestError, httpx.HTTPStatusError, httpx.TimeoutException),
-        tries=3,
-        delay=2,
-        backoff=2,
-        logger=logger
-    )
     def fetch_orders(self, product_id: str) -> List[Dict[str, Any]]:
         """
         Busca ordens para um product_id específico.
@@ -58,27 +55,7 @@ class FetchOrderTechFloripa:
         logger.info(f"Configurações de timeout: connect={self.timeout_config.connect}s, read={self.timeout_config.read}s")
 
         try:
-            # Configurações mais robustas para o cliente HTTP
-            with httpx.Client(
-                timeout=self.timeout_config,
-                headers=self.headers,
-                follow_redirects=True,
-                limits=httpx.Limits(max_keepalive_connections=0, max_connections=5)  # Desabilita keep-alive
-            ) as client:
-                logger.info("Iniciando requisição HTTP...")
-                response = client.get(url)
-                logger.info(f"Resposta recebida em {response.elapsed.total_seconds():.2f}s")
-
-                # Verifica se a resposta foi bem-sucedida
-                response.raise_for_status()
-
-                logger.info(f"Requisição bem-sucedida! Status: {response.status_code}")
-
-                # Processa e retorna os dados
-                data = response.json()
-                logger.info(f"Recebidas {len(data) if isinstance(data, list) else 1} ordem(s)")
-
-                return data
+            return FETCH_ORDERS_RETRY.call(self.__get_orders, url)
 
         except httpx.TimeoutException as e:
             logger.error(f"Timeout na conexão: {e}")
@@ -92,3 +69,35 @@ class FetchOrderTechFloripa:
         except Exception as e:
             logger.error(f"Erro inesperado ao buscar ordens: {e}")
             raise
+
+    def __get_orders(self, url: str) -> List[Dict[str, Any]]:
+        # Configurações mais robustas para o cliente HTTP
+        with httpx.Client(
+            timeout=self.__attempt_timeout(),
+            headers=self.headers,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=0, max_connections=5)  # Desabilita keep-alive
+        ) as client:
+            logger.info("Iniciando requisição HTTP...")
+            response = client.get(url)
+            logger.info(f"Resposta recebida em {response.elapsed.total_seconds():.2f}s")
+
+            # Verifica se a resposta foi bem-sucedida
+            response.raise_for_status()
+
+            logger.info(f"Requisição bem-sucedida! Status: {response.status_code}")
+
+            # Processa e retorna os dados
+            data = response.json()
+            logger.info(f"Recebidas {len(data) if isinstance(data, list) else 1} ordem(s)")
+
+            return data
+
+    def __attempt_timeout(self) -> httpx.Timeout:
+        # Cada fase da requisição termina antes do prazo da invocação
+        return httpx.Timeout(
+            connect=attempt_timeout(self.timeout_config.connect),
+            read=attempt_timeout(self.timeout_config.read),
+            write=attempt_timeout(self.timeout_config.write),
+            pool=attempt_timeout(self.timeout_config.pool),
+        )
@@ -0,0 +1,29 @@
+import logging
+
+from src.application.dto.product_stats_dto import ProductStatsRequestDto, ProductStatsResponseDto
+from src.domain.repository.product_stats_repository import ProductStatsRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+class GetProductStats:
+    """
+    Lê os contadores de certificados de um produto (um GetItem).
+    Produtos sem contadores ainda (nenhum certificado) retornam zeros.
+    """
+
+    def __init__(self, stats_repository: ProductStatsRepository | None = None):
+        if stats_repository is None:
+            from src.infrastructure.container.dependency_container import container
+
+            stats_repository = container.get("product_stats_repository")
+
+        self.stats_repository = stats_repository
+
+    def execute(self, request: ProductStatsRequestDto) -> ProductStatsResponseDto:
+        logger.info("Fetching certificate stats for product_id=%s", request.product_id)
+        stats = self.stats_repository.get(request.product_id)
+        if stats is None:
+            return ProductStatsResponseDto(product_id=request.product_id)
+        return ProductStatsResponseDto(**stats.model_dump())
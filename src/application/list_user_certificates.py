@@ -1,12 +1,11 @@
 import logging
-from datetime import datetime
 
+from src.application.delta_polling import next_poll_time
 from src.application.dto.list_user_certificates_dto import (
     ListUserCertificatesRequestDto,
     ListUserCertificatesResponseDto,
-    UserCertificateItemDto,
 )
-from src.domain.entity.certificate import Certificate
+from src.application.mapper.certificate import CertificateResponseMapper
 from src.domain.repository.certificate_repository import CertificateRepository
 
 
@@ -24,63 +23,30 @@ class ListUserCertificates:
 
     def execute(self, request: ListUserCertificatesRequestDto) -> ListUserCertificatesResponseDto:
         logger.info(
-            "Listing certificates for email=%s success=%s",
+            "Listing certificates for email=%s success=%s since=%s",
             request.email,
             request.success,
+            request.since,
         )
 
-        certificates = self.certificate_repository.get_by_participant_email(request.email)
-
-        if request.success is not None:
-            certificates = [
-                certificate for certificate in certificates if certificate.success is request.success
-            ]
-
-        sorted_certificates = sorted(
-            certificates,
-            key=self._sort_key,
-            reverse=True,
-        )
-
-        return ListUserCertificatesResponseDto(
+        server_time = next_poll_time()
+        if request.since is not None:
+            # Apenas o que mudou desde a última consulta do cliente
+            certificates = self.certificate_repository.get_by_participant_email_changed_since(
+                request.email,
+                request.since,
+                success=request.success,
+            )
+        else:
+            # Filtro e ordenação (generated_at decrescente) resolvidos pelos índices do DynamoDB
+            certificates = self.certificate_repository.list_by_participant_email(
+                request.email,
+                success=request.success,
+            )
+
+        # Os itens já saíram validados do repositório; a apresentação valida a resposta uma vez
+        return ListUserCertificatesResponseDto.model_construct(
             email=request.email,
-            certificates=[self._to_item_dto(certificate) for certificate in sorted_certificates],
-        )
-
-    def _to_item_dto(self, certificate: Certificate) -> UserCertificateItemDto:
-        return UserCertificateItemDto(
-            id=str(certificate.id),
-            order_id=certificate.order_id,
-            product_id=certificate.product_id,
-            participant_name=f"{certificate.participant_first_name or ''} {certificate.participant_last_name or ''}".strip(),
-            participant_email=certificate.participant_email,
-            participant_document=certificate.participant_cpf,
-            certificate_url=certificate.certificate_url,
-            created_at=certificate.generated_date,
-            updated_at=certificate.generated_date,
-            success=certificate.success,
+            certificates=CertificateResponseMapper.to_user_certificate_item_dtos(certificates),
+            server_time=server_time,
         )
-
-    def _sort_key(self, certificate: Certificate) -> tuple[bool, datetime]:
-        generated_at = self._parse_generated_date(certificate.generated_date)
-        return generated_at is not None, generated_at or datetime.min
-
-    def _parse_generated_date(self, value: str | None) -> datetime | None:
-        if not value:
-            return None
-
-        normalized_value = value.replace("Z", "+00:00")
-
-        try:
-            return datetime.fromisoformat(normalized_value)
-        except ValueError:
-            pass
-
-        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M:%S.%f"):
-            try:
-                return datetime.strptime(value, fmt)
-            except ValueError:
-                continue
-
-        logger.warning("Unable to parse generated_date=%s for sorting", value)
-        return None
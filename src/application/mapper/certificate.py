@@ -0,0 +1,89 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.application.dto.fetch_certificate_dto import FetchCertificateResponseDto
+from src.application.dto.list_user_certificates_dto import UserCertificateItemDto
+from src.domain.entity.certificate import Certificate
+
+# Atributos do certificado necessários para cada campo da resposta.
+# Campos sem atributo correspondente nunca são preenchidos na busca.
+RESPONSE_FIELD_ATTRIBUTES: Dict[str, Tuple[str, ...]] = {
+    "id": ("id",),
+    "order_id": ("order_id",),
+    "product_id": ("product_id",),
+    "participant_name": ("participant_first_name", "participant_last_name"),
+    "participant_email": ("participant_email",),
+    "participant_document": ("participant_cpf",),
+    "certificate_url": ("certificate_url",),
+    "created_at": ("generated_date",),
+    "updated_at": ("updated_at", "generated_date"),
+    "email": ("participant_email",),
+    "success": ("success",),
+    "product_name": (),
+    "generated_date": (),
+    "time_checkin": (),
+}
+
+
+class CertificateResponseMapper:
+    @staticmethod
+    def projection_for(fields: Optional[Iterable[str]]) -> Optional[List[str]]:
+        """
+        Converte os campos pedidos na resposta nos atributos a ler do DynamoDB.
+        Retorna None (todos os atributos) quando nenhum campo é informado.
+        """
+        if not fields:
+            return None
+        attributes = [attribute for field in fields for attribute in RESPONSE_FIELD_ATTRIBUTES[field]]
+        # Mesmo sem atributos mapeados, a leitura precisa de algo para indicar que o item existe
+        return list(dict.fromkeys(attributes)) or ["order_id"]
+
+    @staticmethod
+    def to_fetch_response_dtos(
+        certificates: List[Certificate],
+        fields: Optional[Iterable[str]] = None,
+    ) -> List[FetchCertificateResponseDto]:
+        """
+        Projeta os certificados no formato de resposta com um dict por item.
+        Os Certificates já foram validados ao sair do repositório, então os
+        dicts não são validados de novo aqui.
+        Com `fields`, só esses campos são preenchidos.
+        """
+        rows: List[FetchCertificateResponseDto] = [
+            {
+                "id": str(certificate.id) if certificate.id else None,
+                "order_id": certificate.order_id,
+                "product_id": certificate.product_id,
+                "participant_name": f"{certificate.participant_first_name or ''} {certificate.participant_last_name or ''}".strip(),
+                "participant_email": certificate.participant_email,
+                "participant_document": certificate.participant_cpf,
+                "certificate_url": certificate.certificate_url,
+                "certificate_key": certificate.certificate_key,
+                "created_at": certificate.generated_date,
+                "updated_at": certificate.updated_at or certificate.generated_date,
+                "email": certificate.participant_email,
+                "success": certificate.success,
+            }
+            for certificate in certificates
+        ]
+        if fields:
+            rows = [{field: row[field] for field in fields if field in row} for row in rows]
+        return rows
+
+    @staticmethod
+    def to_user_certificate_item_dtos(certificates: List[Certificate]) -> List[UserCertificateItemDto]:
+        """Projeta os certificados de um participante com um dict por item, sem validar de novo."""
+        return [
+            {
+                "id": str(certificate.id) if certificate.id else None,
+                "order_id": certificate.order_id,
+                "product_id": certificate.product_id,
+                "participant_name": f"{certificate.participant_first_name or ''} {certificate.participant_last_name or ''}".strip(),
+                "participant_email": certificate.participant_email,
+                "participant_document": certificate.participant_cpf,
+                "certificate_url": certificate.certificate_url,
+                "created_at": certificate.generated_date,
+                "updated_at": certificate.updated_at or certificate.generated_date,
+                "success": certificate.success,
+            }
+            for certificate in certificates
+        ]
@@ -3,6 +3,7 @@ from src.domain.entity.order import Order
 from src.domain.entity.product import Product
 from src.domain.entity.participant import Participant
 from src.domain.entity.certificate import Certificate
+from typing import Optional
 
 class TechOrderMapper:
     @staticmethod
@@ -69,4 +70,29 @@ class CertificateMapper:
             participant_cpf=tech_order_response.cpf,
             participant_phone=tech_order_response.phone,
             participant_city=tech_order_response.city
-        )
\ No newline at end of file
+        )
+
+    @staticmethod
+    def to_tech_order(certificate: Certificate, order: Optional[Order] = None) -> TechOrdersResponse:
+        """
+        Remonta a ordem enviada ao builder a partir do certificado gravado,
+        sem consultar a API da Tech Floripa. O check-in vem do pedido, quando houver.
+        """
+        return TechOrdersResponse(
+            order_id=certificate.order_id,
+            first_name=certificate.participant_first_name or "",
+            last_name=certificate.participant_last_name or "",
+            email=certificate.participant_email or "",
+            phone=certificate.participant_phone or "",
+            cpf=certificate.participant_cpf or "",
+            city=certificate.participant_city or "",
+            product_id=certificate.product_id,
+            product_name=certificate.product_name,
+            certificate_details=certificate.certificate_details,
+            certificate_logo=certificate.certificate_logo,
+            certificate_background=certificate.certificate_background,
+            order_date=certificate.order_date,
+            checkin_latitude=order.checkin_latitude if order else None,
+            checkin_longitude=order.checkin_longitude if order else None,
+            time_checkin=order.time_checkin if order else None,
+        )
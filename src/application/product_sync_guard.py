@@ -0,0 +1,95 @@
+import logging
+import time
+from typing import Callable, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from src.domain.entity.sync_lease import LEASE_DONE, SyncLease
+from src.domain.exception.sync_in_progress import SyncInProgress
+from src.domain.repository.sync_lease_repository import SyncLeaseRepository
+
+
+logger = logging.getLogger(__name__)
+
+# Intervalo entre as leituras da lease enquanto se espera outra execução
+LEASE_POLL_SECONDS = 0.5
+
+ResultT = TypeVar("ResultT", bound=BaseModel)
+
+
+class ProductSyncGuard:
+    """
+    Garante uma única execução por produto ao mesmo tempo, com uma lease distribuída.
+
+    Quem chega com outra execução em andamento espera até `wait_seconds` pelo
+    resultado dela e o devolve como seu; passado esse tempo, recebe SyncInProgress
+    com o job_id da execução em andamento. Se a execução em andamento falhar ou
+    expirar durante a espera, o chamador tenta assumir a lease.
+    """
+
+    def __init__(
+        self,
+        lease_repository: SyncLeaseRepository | None = None,
+        ttl_seconds: int | None = None,
+        wait_seconds: float | None = None,
+    ):
+        if lease_repository is None or ttl_seconds is None or wait_seconds is None:
+            from src.infrastructure.config.config import config
+            from src.infrastructure.container.dependency_container import container
+
+            lease_repository = lease_repository or container.get("sync_lease_repository")
+            ttl_seconds = config.SYNC_LEASE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+            wait_seconds = config.SYNC_LEASE_WAIT_SECONDS if wait_seconds is None else wait_seconds
+
+        self.lease_repository = lease_repository
+        self.ttl_seconds = ttl_seconds
+        self.wait_seconds = wait_seconds
+
+    def run(self, product_id: str, operation: Callable[[], ResultT], result_type: Type[ResultT]) -> ResultT:
+        lease_id = f"product#{product_id}"
+        deadline = time.monotonic() + self.wait_seconds
+
+        while True:
+            lease = self.lease_repository.acquire(lease_id, self.ttl_seconds)
+            if lease is not None:
+                return self._run_holding(lease, operation)
+
+            current = self.lease_repository.get(lease_id)
+            if current is None or not current.is_held():
+                # Liberada entre o put condicional e a leitura: tenta de novo
+                continue
+
+            logger.info("Product %s is being synced by job %s", product_id, current.job_id)
+            result = self._wait_for(current, deadline)
+            if result is not None:
+                logger.info("Returning result of job %s for product %s", current.job_id, product_id)
+                return result_type.model_validate_json(result)
+
+            if time.monotonic() >= deadline:
+                raise SyncInProgress(product_id, current.job_id)
+
+    def _run_holding(self, lease: SyncLease, operation: Callable[[], ResultT]) -> ResultT:
+        try:
+            result = operation()
+        except Exception:
+            self.lease_repository.fail(lease)
+            raise
+        try:
+            self.lease_repository.complete(lease, result.model_dump_json())
+        except Exception as e:
+            # A execução terminou; a lease expira sozinha
+            logger.warning("Error releasing lease %s: %s", lease.lease_id, str(e))
+        return result
+
+    def _wait_for(self, lease: SyncLease, deadline: float) -> Optional[str]:
+        """Resultado da execução `lease.job_id`, se ela terminar antes do prazo."""
+        while time.monotonic() < deadline:
+            time.sleep(min(LEASE_POLL_SECONDS, max(deadline - time.monotonic(), 0)))
+            current = self.lease_repository.get(lease.lease_id)
+            if current is None or current.job_id != lease.job_id:
+                return None
+            if current.status == LEASE_DONE:
+                return current.result
+            if not current.is_held():
+                return None
+        return None
@@ -0,0 +1,82 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+
+from src.domain.entity.product_stats import ProductStats, certificate_status
+from src.domain.repository.certificate_repository import CertificateRepository
+from src.domain.repository.product_stats_repository import ProductStatsRepository
+
+
+logger = logging.getLogger(__name__)
+
+# Segmentos do scan paralelo (uma thread por segmento)
+REBUILD_TOTAL_SEGMENTS = 8
+
+# Só o necessário para classificar o certificado
+_STATS_PROJECTION = ["product_id", "success", "generated_date"]
+
+_Counters = Dict[int, Dict[str, int]]
+
+
+class RebuildProductStats:
+    """
+    Recalcula os contadores por produto a partir de um scan paralelo da tabela
+    de certificados e grava o resultado, substituindo os valores atuais.
+
+    Incrementos feitos durante o scan podem ser sobrescritos, então o ideal é
+    rodar fora dos horários de emissão de certificados.
+    """
+
+    def __init__(
+        self,
+        certificate_repository: CertificateRepository | None = None,
+        stats_repository: ProductStatsRepository | None = None,
+    ):
+        if certificate_repository is None or stats_repository is None:
+            from src.infrastructure.container.dependency_container import container
+
+            certificate_repository = certificate_repository or container.get("certificate_repository")
+            stats_repository = stats_repository or container.get("product_stats_repository")
+
+        self.certificate_repository = certificate_repository
+        self.stats_repository = stats_repository
+
+    def execute(
+        self,
+        total_segments: int = REBUILD_TOTAL_SEGMENTS,
+        product_ids: Optional[Iterable[int]] = None,
+    ) -> Dict[int, ProductStats]:
+        only = set(product_ids) if product_ids else None
+        logger.info("Rebuilding product stats with %s scan segments (products: %s)", total_segments, only or "all")
+
+        with ThreadPoolExecutor(max_workers=total_segments) as executor:
+            partials = list(executor.map(self._count_segment, range(total_segments), [total_segments] * total_segments))
+
+        counters: _Counters = {}
+        for partial in partials:
+            for product_id, product_counters in partial.items():
+                merged = counters.setdefault(product_id, {})
+                for counter, value in product_counters.items():
+                    merged[counter] = merged.get(counter, 0) + value
+
+        results: Dict[int, ProductStats] = {}
+        for product_id in sorted(counters):
+            if only is not None and product_id not in only:
+                continue
+            results[product_id] = self.stats_repository.save(ProductStats(product_id=product_id, **counters[product_id]))
+
+        logger.info("Product stats rebuilt for %s products", len(results))
+        return results
+
+    def _count_segment(self, segment: int, total_segments: int) -> _Counters:
+        counters: _Counters = {}
+        pages = self.certificate_repository.iter_scan_segment(segment, total_segments, projection=_STATS_PROJECTION)
+        for certificates in pages:
+            for certificate in certificates:
+                if certificate.product_id is None:
+                    continue
+                product_counters = counters.setdefault(certificate.product_id, {})
+                status = certificate_status(certificate.success, certificate.generated_date)
+                product_counters["total"] = product_counters.get("total", 0) + 1
+                product_counters[status] = product_counters.get(status, 0) + 1
+        return counters
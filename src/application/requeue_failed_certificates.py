@@ -0,0 +1,135 @@
+import base64
+import json
+import logging
+from typing import Dict, List, Optional
+
+from src.application.dto.requeue_failed_dto import RequeueFailedRequestDto, RequeueFailedResponseDto
+from src.application.mapper.tech_order import CertificateMapper
+from src.application.send_for_build_certificate import SendForBuildCertificate
+from src.domain.entity.certificate import Certificate
+from src.domain.response.tech_floripa import TechOrdersResponse
+from src.domain.repository.certificate_repository import CertificateRepository
+from src.domain.repository.order_repository import OrderRepository
+from src.infrastructure.config.config import config
+
+
+logger = logging.getLogger(__name__)
+
+# 300 ordens = 10 mensagens de 30 = uma chamada de SendMessageBatch por página
+REQUEUE_PAGE_SIZE = 300
+
+
+class RequeueFailedCertificates:
+    """
+    Reenvia ao builder os certificados sem sucesso, remontando as ordens a partir
+    dos dados gravados (sem consultar a Tech Floripa). O check-in vem do pedido de
+    cada certificado; certificados sem pedido ou sem time_checkin não são reenviados
+    e voltam em `skipped_order_ids`.
+
+    Os certificados são lidos e enviados página a página, até o limite da execução
+    (REQUEUE_MAX_CERTIFICATES); `truncated` indica que ainda restam certificados e
+    `next_start_after` é o cursor para continuar de onde a execução parou.
+
+    O cursor marca o início da última página lida, então a próxima execução relê
+    os certificados já reenviados dessa página; eles (e os que o create acabou de
+    enviar) são ignorados por terem build_requested_at dentro de BUILD_REQUEST_SKIP_SECONDS.
+    """
+
+    def __init__(
+        self,
+        certificate_repository: CertificateRepository | None = None,
+        order_repository: OrderRepository | None = None,
+        send_for_build_certificate: SendForBuildCertificate | None = None,
+    ):
+        if certificate_repository is None or order_repository is None or send_for_build_certificate is None:
+            from src.infrastructure.container.dependency_container import container
+
+            certificate_repository = certificate_repository or container.get("certificate_repository")
+            order_repository = order_repository or container.get("order_repository")
+            send_for_build_certificate = send_for_build_certificate or container.get("send_for_build_certificate")
+
+        self.certificate_repository = certificate_repository
+        self.order_repository = order_repository
+        self.send_for_build_certificate = send_for_build_certificate
+
+    def execute(self, request: RequeueFailedRequestDto) -> RequeueFailedResponseDto:
+        cap = min(request.limit or config.REQUEUE_MAX_CERTIFICATES, config.REQUEUE_MAX_CERTIFICATES)
+        logger.info("Requeueing unsuccessful certificates (product_id=%s, cap=%s)", request.product_id, cap)
+
+        response = RequeueFailedResponseDto(product_id=request.product_id)
+        processed = 0
+        position = decode_cursor(request.start_after)
+        pages = self.certificate_repository.iter_unsuccessful(
+            request.product_id,
+            page_size=min(REQUEUE_PAGE_SIZE, cap),
+            start_after=position,
+        )
+        for certificates, next_position in pages:
+            page_start, position = position, next_position
+            certificates = [
+                certificate
+                for certificate in certificates
+                if not certificate.build_recently_requested(config.BUILD_REQUEST_SKIP_SECONDS)
+            ]
+            remaining = cap - processed
+            if len(certificates) > remaining:
+                # A página não cabe: a próxima execução recomeça nela
+                certificates = certificates[:remaining]
+                response.truncated = True
+                response.next_start_after = encode_cursor(page_start)
+            if not certificates:
+                continue
+
+            processed += len(certificates)
+            orders = self._tech_orders(certificates, response.skipped_order_ids)
+            if orders:
+                response.messages_sent += self.send_for_build_certificate.send_batched(orders)
+                response.requeued_order_ids.extend(order.order_id for order in orders)
+            if response.truncated:
+                break
+            if processed >= cap and position:
+                response.truncated = True
+                response.next_start_after = encode_cursor(position)
+                break
+
+        logger.info(
+            "Requeued %s certificates in %s messages, skipped %s without check-in (truncated=%s)",
+            len(response.requeued_order_ids),
+            response.messages_sent,
+            len(response.skipped_order_ids),
+            response.truncated,
+        )
+        return response
+
+    def _tech_orders(self, certificates: List[Certificate], skipped_order_ids: List[int]) -> List[TechOrdersResponse]:
+        """Ordens da página com o check-in do pedido de cada certificado (um BatchGetItem)."""
+        orders = self.order_repository.get_by_order_ids(certificate.order_id for certificate in certificates)
+        tech_orders = []
+        for certificate in certificates:
+            order = orders.get(certificate.order_id)
+            if order is None or not order.time_checkin:
+                skipped_order_ids.append(certificate.order_id)
+                continue
+            tech_orders.append(CertificateMapper.to_tech_order(certificate, order))
+        return tech_orders
+
+
+def encode_cursor(position: Optional[Dict]) -> str:
+    """Posição de leitura de iter_unsuccessful como cursor opaco (None: desde o início)."""
+    return base64.urlsafe_b64encode(json.dumps(position, separators=(",", ":")).encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Dict]:
+    """
+    Raises:
+        ValueError: Se o cursor não foi gerado por encode_cursor
+    """
+    if not cursor:
+        return None
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Cursor inválido: {cursor}") from e
+    if position is not None and not isinstance(position, dict):
+        raise ValueError(f"Cursor inválido: {cursor}")
+    return position
@@ -1,43 +1,95 @@
 import logging
-from typing import List
-from retry import retry
+from datetime import datetime, timezone
+from typing import List, Optional
 from src.infrastructure.aws.sqs_service import SQSService
+from src.domain.repository.certificate_repository import CertificateRepository
 from src.domain.response.tech_floripa import TechOrdersResponse
+from src.infrastructure.config.config import config
+from src.infrastructure.retry.retry_policy import RetryPolicy
 
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Throttling, 5xx e falhas de rede do SQS; em fila FIFO, o reenvio é deduplicado
+SEND_TO_SQS_RETRY = RetryPolicy("send_to_sqs", max_attempts=2, base_delay=2.0)
+
 
 class SendForBuildCertificate:
-    def __init__(self, sqs_service: SQSService):
+    """
+    Envia as ordens para a fila do builder. Com `certificate_repository`, os
+    certificados das ordens enviadas recebem build_requested_at, usado por
+    CreateCertificate para não reenviar ordens recém-enfileiradas.
+
+    Envios prioritários vão para BUILDER_PRIORITY_QUEUE_URL, quando configurada.
+    Sem flag explícita, é prioritário o envio com até BUILDER_PRIORITY_MAX_ORDERS
+    ordens; assim, pedidos interativos não esperam atrás de um produto inteiro.
+    """
+
+    def __init__(self, sqs_service: SQSService, certificate_repository: Optional[CertificateRepository] = None):
         self.sqs_service = sqs_service
+        self.certificate_repository = certificate_repository
         self.parts = 30
     
-    def execute(self, orders: List[TechOrdersResponse]):
+    def execute(self, orders: List[TechOrdersResponse], priority: Optional[bool] = None):
+        queue_url = self.__queue_url(orders, priority)
         processed_orders = self.__processed_orders_dict(orders)
         for part in processed_orders:
-            self.__send_to_sqs(part)   
+            self.__send_to_sqs(part, queue_url)
+            self.__mark_build_requested(part)
 
 
+    def send_batched(self, orders: List[TechOrdersResponse], priority: Optional[bool] = False) -> int:
+        """
+        Envia as ordens em partes de `self.parts` usando SendMessageBatch
+        (até 10 partes por chamada). Retorna a quantidade de mensagens enviadas.
+        Por padrão vai para a fila normal (reenvios em massa).
+        """
+        processed_orders = self.__processed_orders_dict(orders)
+        if not processed_orders:
+            return 0
+        logger.info(f"Sending {len(orders)} orders to build certificate in {len(processed_orders)} messages.")
+        sent = self.sqs_service.send_message_batch(processed_orders, queue_url=self.__queue_url(orders, priority))
+        self.__mark_build_requested([order for part in processed_orders for order in part])
+        return sent
+
+    def __queue_url(self, orders: List[TechOrdersResponse], priority: Optional[bool]) -> Optional[str]:
+        if priority is None:
+            priority = len(orders) <= config.BUILDER_PRIORITY_MAX_ORDERS
+        if priority and config.BUILDER_PRIORITY_QUEUE_URL:
+            logger.info(f"Sending {len(orders)} orders to the priority build queue.")
+            return config.BUILDER_PRIORITY_QUEUE_URL
+        # None: fila padrão do SQSService (BUILDER_QUEUE_URL)
+        return None
+
     def __processed_orders_dict(self, orders: List[TechOrdersResponse]) -> List[List[dict]]:
         # Divide as ordens em partes para enviar para a fila de build de certificado,
+        # uma parte só com ordens de um produto (o produto é o grupo da mensagem em fila FIFO)
+        by_product = {}
+        for order in orders:
+            by_product.setdefault(order.product_id, []).append(order)
         parts = []
-        for i in range(0, len(orders), self.parts):
-            parts.append([order.model_dump() for order in orders[i:i+self.parts]])
+        for product_orders in by_product.values():
+            for i in range(0, len(product_orders), self.parts):
+                parts.append([order.model_dump() for order in product_orders[i:i+self.parts]])
         return parts
+
+    def __mark_build_requested(self, orders: List[dict]) -> None:
+        if self.certificate_repository is None or not orders:
+            return
+        try:
+            self.certificate_repository.mark_build_requested(
+                [order["order_id"] for order in orders], datetime.now(timezone.utc)
+            )
+        except Exception as e:
+            # As mensagens já foram enviadas; sem a marca, as ordens só podem ser reenviadas antes da hora
+            logger.warning(f"Error marking build requested for {len(orders)} orders: {e}")
     
-    @retry(
-            exceptions=Exception,
-            tries=2,
-            delay=2,
-            backoff=2,
-            logger=logger
-    )
-    def __send_to_sqs(self, orders: List[dict]):
+    @SEND_TO_SQS_RETRY
+    def __send_to_sqs(self, orders: List[dict], queue_url: Optional[str] = None):
         try:
             logger.info(f"Sending {len(orders)} orders to build certificate.")            
-            self.sqs_service.send_message(orders)
+            self.sqs_service.send_message(orders, queue_url=queue_url)
             logger.info(f"Orders sent to build certificate.")
         except Exception as e:
             logger.error(f"Error sending orders to build certificate: {e}")
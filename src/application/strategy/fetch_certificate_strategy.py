@@ -5,11 +5,12 @@ Implementa o padrão Strategy para eliminar múltiplos if/elif na lógica de bus
 
 import logging
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 from src.domain.entity.certificate import Certificate
 from src.domain.repository.certificate_repository import CertificateRepository
 from src.application.dto.fetch_certificate_dto import FetchCertificateRequestDto, FetchCertificateResponseDto
+from src.application.mapper.certificate import CertificateResponseMapper
 
 
 logger = logging.getLogger(__name__)
@@ -18,6 +19,9 @@ logger = logging.getLogger(__name__)
 class FetchCertificateStrategy(ABC):
     """Classe base para estratégias de busca de certificados."""
     
+    # Estratégias que aceitam `since` (consulta incremental por updated_at)
+    supports_since: bool = False
+    
     def __init__(self, certificate_repository: CertificateRepository):
         self.certificate_repository = certificate_repository
     
@@ -45,22 +49,16 @@ class FetchCertificateStrategy(ABC):
         
         if len(certificates) == 0:
             logger.info(f"No certificates found for request: {request}")
+            if request.since is not None and self.supports_since:
+                # Consulta incremental: nenhuma alteração não é erro
+                return []
             return [self.create_error_response(request)]
         
-        return [FetchCertificateResponseDto(
-            id=str(certificate.id),
-            order_id=certificate.order_id,
-            product_id=certificate.product_id,
-            participant_name=f"{certificate.participant_first_name or ''} {certificate.participant_last_name or ''}".strip(),
-            participant_email=certificate.participant_email,
-            participant_document=certificate.participant_cpf,
-            certificate_url=certificate.certificate_url,
-            certificate_key=certificate.certificate_key,
-            created_at=certificate.generated_date,
-            updated_at=certificate.generated_date,  # Assumindo que não temos updated_at separado
-            email=certificate.participant_email,
-            success=certificate.success
-        ) for certificate in certificates]
+        return CertificateResponseMapper.to_fetch_response_dtos(certificates, request.fields)
+    
+    def projection(self, request: FetchCertificateRequestDto) -> Optional[List[str]]:
+        """Atributos a ler do DynamoDB conforme os campos pedidos (None = todos)."""
+        return CertificateResponseMapper.projection_for(request.fields)
 
 
 class FetchByOrderIdStrategy(FetchCertificateStrategy):
@@ -80,7 +78,7 @@ class FetchByOrderIdStrategy(FetchCertificateStrategy):
     
     def fetch_certificates(self, request: FetchCertificateRequestDto) -> List[Certificate]:
         logger.info(f"Fetching certificate for order_id: {request.order_id}")
-        certificates = self.certificate_repository.get_by_order_id(request.order_id)
+        certificates = self.certificate_repository.get_by_order_id(request.order_id, projection=self.projection(request))
         logger.info(f"Found {len(certificates)} certificates for order_id: {request.order_id}")
         return certificates
     
@@ -106,7 +104,9 @@ class FetchByEmailAndProductIdStrategy(FetchCertificateStrategy):
     
     def fetch_certificates(self, request: FetchCertificateRequestDto) -> List[Certificate]:
         logger.info(f"Fetching certificate for email: {request.email} and product_id: {request.product_id}")
-        certificates = self.certificate_repository.get_by_email_and_product_id(request.email, request.product_id)
+        certificates = self.certificate_repository.get_by_email_and_product_id(
+            request.email, request.product_id, projection=self.projection(request)
+        )
         logger.info(f"Found {len(certificates)} certificates for email: {request.email} and product_id: {request.product_id}")
         return certificates
     
@@ -125,15 +125,23 @@ class FetchByEmailStrategy(FetchCertificateStrategy):
     Condição: APENAS email presente, sem product_id nem order_id.
     Exemplo aceito: ?email=user@email.com
     Exemplos rejeitados: ?email=user@email.com&product_id=456
+    Aceita `since` para retornar apenas o que mudou.
     """
     
+    supports_since = True
+    
     def can_handle(self, request: FetchCertificateRequestDto) -> bool:
         # Estratégia mutuamente exclusiva: apenas email, sem outros parâmetros
         return request.email is not None and request.product_id is None and request.order_id is None
     
     def fetch_certificates(self, request: FetchCertificateRequestDto) -> List[Certificate]:
         logger.info(f"Fetching certificate for email: {request.email}")
-        certificates = self.certificate_repository.get_by_participant_email(request.email)
+        if request.since is not None:
+            certificates = self.certificate_repository.get_by_participant_email_changed_since(
+                request.email, request.since, projection=self.projection(request)
+            )
+        else:
+            certificates = self.certificate_repository.get_by_participant_email(request.email, projection=self.projection(request))
         logger.info(f"Found {len(certificates)} certificates for email: {request.email}")
         return certificates
     
@@ -151,15 +159,23 @@ class FetchByProductIdStrategy(FetchCertificateStrategy):
     Condição: APENAS product_id presente, sem email nem order_id.
     Exemplo aceito: ?product_id=456
     Exemplos rejeitados: ?product_id=456&email=user@email.com
+    Aceita `since` para retornar apenas o que mudou.
     """
     
+    supports_since = True
+    
     def can_handle(self, request: FetchCertificateRequestDto) -> bool:
         # Estratégia mutuamente exclusiva: apenas product_id, sem outros parâmetros
         return request.product_id is not None and request.email is None and request.order_id is None
     
     def fetch_certificates(self, request: FetchCertificateRequestDto) -> List[Certificate]:
         logger.info(f"Fetching certificate for product_id: {request.product_id}")
-        certificates = self.certificate_repository.get_by_product_id(request.product_id)
+        if request.since is not None:
+            certificates = self.certificate_repository.get_by_product_id_changed_since(
+                request.product_id, request.since, projection=self.projection(request)
+            )
+        else:
+            certificates = self.certificate_repository.get_by_product_id(request.product_id, projection=self.projection(request))
         logger.info(f"Found {len(certificates)} certificates for product_id: {request.product_id}")
         return certificates
     
@@ -1,3 +1,4 @@
+from datetime import datetime, timedelta, timezone
 from pydantic import BaseModel, Field
 from typing import Optional
 import uuid
@@ -8,6 +9,10 @@ class Certificate(BaseModel):
     certificate_key: Optional[str] = None
     certificate_url: Optional[str] = None
     generated_date: Optional[str] = None
+    # Momento (UTC) da última gravação, mantido pelo repositório
+    updated_at: Optional[str] = None
+    # Momento (UTC) do último envio do pedido para a fila do builder
+    build_requested_at: Optional[str] = None
     order_id: int
     order_date: str
     product_id: int
@@ -21,3 +26,14 @@ class Certificate(BaseModel):
     participant_cpf: Optional[str]
     participant_phone: Optional[str]
     participant_city: Optional[str]
+
+    def build_recently_requested(self, window_seconds: float, now: Optional[datetime] = None) -> bool:
+        """Se o pedido foi enviado ao builder há menos de `window_seconds` (build_requested_at)."""
+        if not self.build_requested_at or not window_seconds:
+            return False
+        try:
+            requested_at = datetime.strptime(self.build_requested_at, "%Y-%m-%dT%H:%M:%S.%fZ")
+        except ValueError:
+            return False
+        now = now or datetime.now(timezone.utc)
+        return now - requested_at.replace(tzinfo=timezone.utc) < timedelta(seconds=window_seconds)
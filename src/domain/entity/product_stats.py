@@ -0,0 +1,29 @@
+from pydantic import BaseModel
+from typing import Optional
+
+# Situações de um certificado contabilizadas por produto
+STATUS_SUCCESS = "success"
+STATUS_FAILED = "failed"
+STATUS_PENDING = "pending"
+CERTIFICATE_STATUSES = (STATUS_SUCCESS, STATUS_FAILED, STATUS_PENDING)
+
+
+def certificate_status(success: Optional[bool], generated_date: Optional[str]) -> str:
+    """
+    Situação do certificado: gerado com sucesso, processado sem sucesso
+    (o builder preencheu generated_date) ou ainda aguardando o builder.
+    """
+    if success:
+        return STATUS_SUCCESS
+    if generated_date:
+        return STATUS_FAILED
+    return STATUS_PENDING
+
+
+class ProductStats(BaseModel):
+    product_id: int
+    total: int = 0
+    success: int = 0
+    failed: int = 0
+    pending: int = 0
+    updated_at: Optional[str] = None
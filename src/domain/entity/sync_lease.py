@@ -0,0 +1,27 @@
+import time
+from typing import Optional
+
+from pydantic import BaseModel
+
+# Situação da execução que detém (ou deteve) a lease
+LEASE_RUNNING = "running"
+LEASE_DONE = "done"
+LEASE_FAILED = "failed"
+
+
+class SyncLease(BaseModel):
+    """
+    Lease de uma execução exclusiva (ex.: sincronização de um produto).
+    O job_id identifica o dono; o resultado da execução concluída fica
+    serializado (JSON) para quem esperava por ela.
+    """
+    lease_id: str
+    job_id: str
+    status: str = LEASE_RUNNING
+    # Instante (epoch, segundos) em que a lease deixa de valer se não for liberada
+    expires_at: int
+    result: Optional[str] = None
+
+    def is_held(self, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        return self.status == LEASE_RUNNING and self.expires_at > now
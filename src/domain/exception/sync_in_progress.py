@@ -0,0 +1,9 @@
+class SyncInProgress(Exception):
+    def __init__(self, product_id: str, job_id: str):
+        self.message = "Sync in progress"
+        self.product_id = product_id
+        self.job_id = job_id
+        super().__init__(self.__str__())
+
+    def __str__(self) -> str:
+        return f"Sync already in progress for product_id: {self.product_id} (job_id: {self.job_id})"
@@ -1,35 +1,113 @@
 from abc import abstractmethod
-from typing import List, Optional, Union
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from src.domain.entity.certificate import Certificate
 from src.domain.repository.base_repository import BaseRepository
+from src.domain.response.build_result import BuildResultResponse
 import uuid
 
 class CertificateRepository(BaseRepository[Certificate]):
     """
     Repositório específico para Certificate com métodos adicionais.
     Segue Clean Architecture mantendo a interface no domínio.
+    
+    Nos métodos de busca, `projection` limita os atributos lidos; os
+    certificados retornados ficam parciais (atributos não lidos = None).
     """
     
     @abstractmethod
-    def get_by_order_id(self, order_id: int) -> List[Certificate]:
+    def get_by_order_id(self, order_id: int, projection: Optional[List[str]] = None) -> List[Certificate]:
         """Busca certificados por order_id"""
         pass
     
     @abstractmethod
-    def get_by_participant_email(self, email: str) -> List[Certificate]:
+    def get_by_order_ids(
+        self, order_ids: Iterable[int], projection: Optional[List[str]] = None
+    ) -> Dict[int, Certificate]:
+        """Busca vários certificados por order_id; os ausentes ficam fora do dicionário"""
+        pass
+    
+    @abstractmethod
+    def find_by_ids(
+        self, entity_ids: Iterable[Union[str, uuid.UUID]], projection: Optional[List[str]] = None
+    ) -> Dict[str, Certificate]:
+        """Busca vários certificados por UUID; os ausentes ficam fora do dicionário"""
+        pass
+    
+    @abstractmethod
+    def get_by_participant_email(self, email: str, projection: Optional[List[str]] = None) -> List[Certificate]:
         """Busca certificados por email do participante"""
         pass
     
     @abstractmethod
-    def get_by_product_id(self, product_id: int) -> List[Certificate]:
+    def list_by_participant_email(self, email: str, success: Optional[bool] = None) -> List[Certificate]:
+        """Lista certificados do email, mais recentes primeiro, opcionalmente filtrando por success"""
+        pass
+    
+    @abstractmethod
+    def get_by_participant_email_changed_since(
+        self,
+        email: str,
+        since: datetime,
+        success: Optional[bool] = None,
+        projection: Optional[List[str]] = None,
+    ) -> List[Certificate]:
+        """Busca certificados do email criados ou alterados depois de `since`"""
+        pass
+    
+    @abstractmethod
+    def get_by_product_id_changed_since(
+        self, product_id: int, since: datetime, projection: Optional[List[str]] = None
+    ) -> List[Certificate]:
+        """Busca certificados do produto criados ou alterados depois de `since`"""
+        pass
+    
+    @abstractmethod
+    def get_by_product_id(self, product_id: int, projection: Optional[List[str]] = None) -> List[Certificate]:
         """Busca certificados por product_id"""
         pass
     
     @abstractmethod
-    def get_by_email_and_product_id(self, email: str, product_id: int) -> List[Certificate]:
+    def iter_by_product_id(
+        self, product_id: int, projection: Optional[List[str]] = None, page_size: Optional[int] = None
+    ) -> Iterator[List[Certificate]]:
+        """Percorre os certificados de um produto página a página, sem carregar todos em memória"""
+        pass
+    
+    @abstractmethod
+    def iter_unsuccessful(
+        self, product_id: Optional[int] = None, page_size: Optional[int] = None, start_after: Optional[Dict] = None
+    ) -> Iterator[Tuple[List[Certificate], Dict]]:
+        """
+        Percorre os certificados sem sucesso (opcionalmente de um produto), página a página,
+        com a posição de leitura depois de cada página ({} na última), aceita em `start_after`
+        """
+        pass
+    
+    @abstractmethod
+    def iter_scan_segment(
+        self, segment: int, total_segments: int, projection: Optional[List[str]] = None
+    ) -> Iterator[List[Certificate]]:
+        """Percorre um segmento de um scan paralelo de todos os certificados, página a página"""
+        pass
+    
+    @abstractmethod
+    def get_by_email_and_product_id(
+        self, email: str, product_id: int, projection: Optional[List[str]] = None
+    ) -> List[Certificate]:
         """Busca certificados por email do participante e product_id"""
         pass
     
+    @abstractmethod
+    def apply_build_results(self, results: Iterable[BuildResultResponse]) -> Dict[int, str]:
+        """Aplica em lote os resultados do builder; retorna a situação (BUILD_RESULT_*) por order_id"""
+        pass
+    
+    @abstractmethod
+    def mark_build_requested(self, order_ids: Iterable[int], requested_at: datetime) -> None:
+        """Grava build_requested_at nos certificados enviados para o builder"""
+        pass
+    
     @abstractmethod
     def get_successful_certificates(self) -> List[Certificate]:
         """Busca apenas certificados com sucesso=True"""
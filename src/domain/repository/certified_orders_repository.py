@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Set
+
+class CertifiedOrdersRepository(ABC):
+    """
+    Conjunto, por produto, dos order_ids que já têm certificado gerado com sucesso.
+    Permite pular esses pedidos sem ler os certificados um a um.
+    Segue Clean Architecture mantendo a interface no domínio.
+    """
+    
+    @abstractmethod
+    def get(self, product_id: int) -> Set[int]:
+        """Busca os order_ids certificados do produto (vazio se ainda não houver)"""
+        pass
+    
+    @abstractmethod
+    def add(self, product_id: int, order_ids: Iterable[int]) -> None:
+        """Acrescenta order_ids ao conjunto do produto, sem perder gravações concorrentes"""
+        pass
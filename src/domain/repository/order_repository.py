@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 from src.domain.entity.order import Order
 from src.domain.repository.base_repository import BaseRepository
 
@@ -14,6 +14,11 @@ class OrderRepository(BaseRepository[Order]):
         """Busca pedido por order_id"""
         pass
     
+    @abstractmethod
+    def get_by_order_ids(self, order_ids: Iterable[int]) -> Dict[int, Order]:
+        """Busca vários pedidos por order_id; os inexistentes ficam fora do dicionário"""
+        pass
+    
     @abstractmethod
     def get_by_participant_email(self, email: str) -> List[Order]:
         """Busca pedidos por email do participante"""
@@ -28,3 +33,14 @@ class OrderRepository(BaseRepository[Order]):
     def get_orders_by_date_range(self, start_date: str, end_date: str) -> List[Order]:
         """Busca pedidos por intervalo de datas"""
         pass
+
+    @abstractmethod
+    def iter_orders_by_date_range(
+        self,
+        start_date: str,
+        end_date: str,
+        limit: Optional[int] = None,
+        page_size: Optional[int] = None,
+    ) -> Iterator[Order]:
+        """Percorre os pedidos do intervalo em ordem de data, parando após `limit` pedidos"""
+        pass
@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from src.domain.entity.participant import Participant
 from src.domain.repository.base_repository import BaseRepository
 
@@ -14,6 +14,11 @@ class ParticipantRepository(BaseRepository[Participant]):
         """Busca participante por email"""
         pass
     
+    @abstractmethod
+    def get_by_emails(self, emails: Iterable[str]) -> Dict[str, Participant]:
+        """Busca vários participantes por email, indexados pelo email informado"""
+        pass
+    
     @abstractmethod
     def get_by_cpf(self, cpf: str) -> Optional[Participant]:
         """Busca participante por CPF"""
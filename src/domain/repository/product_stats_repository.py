@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+from src.domain.entity.product_stats import ProductStats
+
+class ProductStatsRepository(ABC):
+    """
+    Contadores agregados de certificados por produto (total, success, failed, pending).
+    Segue Clean Architecture mantendo a interface no domínio.
+    """
+    
+    @abstractmethod
+    def get(self, product_id: int) -> Optional[ProductStats]:
+        """Busca os contadores de um produto"""
+        pass
+    
+    @abstractmethod
+    def increment(self, product_id: int, deltas: Dict[str, int]) -> None:
+        """Soma (atomicamente) os deltas informados aos contadores do produto"""
+        pass
+    
+    @abstractmethod
+    def save(self, stats: ProductStats) -> ProductStats:
+        """Grava os contadores do produto, substituindo os valores atuais"""
+        pass
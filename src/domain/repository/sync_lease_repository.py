@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from src.domain.entity.sync_lease import SyncLease
+
+class SyncLeaseRepository(ABC):
+    """
+    Leases distribuídas para execuções que não podem rodar em paralelo.
+    Segue Clean Architecture mantendo a interface no domínio.
+    """
+    
+    @abstractmethod
+    def acquire(self, lease_id: str, ttl_seconds: int) -> Optional[SyncLease]:
+        """Obtém a lease se ela estiver livre (ou expirada); None se outra execução a detém"""
+        pass
+    
+    @abstractmethod
+    def get(self, lease_id: str) -> Optional[SyncLease]:
+        """Busca a situação atual da lease (leitura fortemente consistente)"""
+        pass
+    
+    @abstractmethod
+    def complete(self, lease: SyncLease, result: str) -> None:
+        """Libera a lease gravando o resultado da execução"""
+        pass
+    
+    @abstractmethod
+    def fail(self, lease: SyncLease) -> None:
+        """Libera a lease de uma execução que falhou"""
+        pass
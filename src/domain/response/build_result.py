@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+from typing import Optional
+
+# Resultado da aplicação de um BuildResultResponse no certificado
+BUILD_RESULT_UPDATED = "updated"
+BUILD_RESULT_MISSING = "missing"
+BUILD_RESULT_FAILED = "failed"
+
+
+class BuildResultResponse(BaseModel):
+    """Resultado da geração de um certificado, publicado pelo builder."""
+    order_id: int
+    success: bool
+    certificate_key: Optional[str] = None
+    certificate_url: Optional[str] = None
+    generated_date: Optional[str] = None
@@ -0,0 +1,6 @@
+from src.domain.response.failed import FailedResponse
+
+class SyncInProgressResponse(FailedResponse):
+    """Resposta (409) quando outra execução já sincroniza o produto."""
+    product_id: str
+    job_id: str
@@ -1,7 +1,44 @@
+from typing import Any, Dict
+
 from aws_lambda_powertools.event_handler import APIGatewayRestResolver
+from aws_lambda_powertools.utilities.typing import LambdaContext
 
-app: APIGatewayRestResolver = APIGatewayRestResolver(
-    enable_validation=True,
-)
+from src.infrastructure.aws.response_compression import compress_response
+from src.infrastructure.config.config import config
+from src.infrastructure.serialization.json_serializer import get_json_serializer
+
+
+class CompressingAPIGatewayRestResolver(APIGatewayRestResolver):
+    """
+    APIGatewayRestResolver que comprime (br/gzip) as respostas JSON e HTML
+    conforme o Accept-Encoding da requisição, acima de um tamanho mínimo.
+    """
+
+    def __init__(self, *args, compression_enabled: bool = True, compression_min_size: int = 1024, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.compression_enabled = compression_enabled
+        self.compression_min_size = compression_min_size
 
+    def resolve(self, event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
+        response = super().resolve(event, context)
+        if not self.compression_enabled:
+            return response
+        return compress_response(response, _accept_encoding(event), self.compression_min_size)
 
+
+def _accept_encoding(event: Dict[str, Any]) -> str:
+    for name, value in (event.get("headers") or {}).items():
+        if name.lower() == "accept-encoding":
+            return value or ""
+    for name, values in (event.get("multiValueHeaders") or {}).items():
+        if name.lower() == "accept-encoding":
+            return ",".join(values or [])
+    return ""
+
+
+app: APIGatewayRestResolver = CompressingAPIGatewayRestResolver(
+    enable_validation=True,
+    serializer=get_json_serializer(config.JSON_SERIALIZER),
+    compression_enabled=config.RESPONSE_COMPRESSION_ENABLED,
+    compression_min_size=config.RESPONSE_COMPRESSION_MIN_SIZE,
+)
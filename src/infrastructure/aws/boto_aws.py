@@ -1,4 +1,5 @@
 from boto3 import client
+from botocore.config import Config as BotoConfig
 from enum import Enum
 from src.infrastructure.config.config import config
 
@@ -8,7 +9,15 @@ class ServiceNameAWS(Enum):
     S3 = 's3'
 
 def get_instance_aws(service_name: ServiceNameAWS):
+    kwargs = {}
+    if service_name is ServiceNameAWS.DYNAMODB and config.DYNAMODB_ENDPOINT_URL:
+        # Permite apontar para o DynamoDB Local em testes e migrações
+        kwargs["endpoint_url"] = config.DYNAMODB_ENDPOINT_URL
+    if service_name is ServiceNameAWS.DYNAMODB and config.DYNAMODB_ADAPTIVE_THROTTLING_ENABLED:
+        # As tentativas (inclusive falhas de conexão) ficam com o ThrottledDynamoDBClient, pelo bucket da tabela
+        kwargs["config"] = BotoConfig(retries={"mode": "standard", "total_max_attempts": 1})
     return client(
         service_name.value,
-        region_name=config.REGION
+        region_name=config.REGION,
+        **kwargs
     )
\ No newline at end of file
@@ -1,33 +1,68 @@
 import logging
 import json
+import random
+import time
 from botocore.exceptions import ClientError
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from decimal import Decimal
 import uuid
 
 from src.infrastructure.aws.boto_aws import get_instance_aws, ServiceNameAWS
+from src.infrastructure.aws.dynamodb_throttling import TableRateLimiters, ThrottledDynamoDBClient
 from src.infrastructure.config.config import config
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Limite de chaves por chamada do BatchGetItem
+BATCH_GET_MAX_KEYS = 100
+
+# Limite de itens por chamada do BatchWriteItem
+BATCH_WRITE_MAX_ITEMS = 25
+
+# Compartilhado entre instâncias: todas as chamadas a uma tabela dividem o mesmo bucket
+_table_rate_limiters = TableRateLimiters(
+    min_rate=config.DYNAMODB_RATE_MIN,
+    max_rate=config.DYNAMODB_RATE_MAX,
+    increase=config.DYNAMODB_RATE_INCREASE,
+)
+
 class DynamoDBService:
     """
     Serviço para operações com DynamoDB.
     Implementa operações CRUD básicas e integra com a configuração da infraestrutura Terraform.
+    Com DYNAMODB_ADAPTIVE_THROTTLING_ENABLED, as chamadas passam pelo controle de
+    vazão por tabela (ver dynamodb_throttling).
     """
     
     def __init__(self):
         self.aws = get_instance_aws(ServiceNameAWS.DYNAMODB)
+        if config.DYNAMODB_ADAPTIVE_THROTTLING_ENABLED:
+            self.aws = ThrottledDynamoDBClient(
+                self.aws, _table_rate_limiters, max_attempts=config.DYNAMODB_THROTTLE_MAX_ATTEMPTS
+            )
         self.config = config
 
-    def put_item(self, item: Dict, table_name: str) -> Dict:
+    def put_item(
+        self,
+        item: Dict,
+        table_name: str,
+        return_values: Optional[str] = None,
+        condition_expression: Optional[str] = None,
+        expression_values: Optional[Dict] = None,
+        expression_attribute_names: Optional[Dict] = None,
+    ) -> Dict:
         """
         Adiciona um item na tabela DynamoDB.
         
         Args:
             item: Item a ser adicionado
             table_name: Nome da tabela
+            return_values: "ALL_OLD" para receber em Attributes o item substituído (opcional)
+            condition_expression: Condição para gravar (opcional, ex.: attribute_not_exists(id));
+                quando falsa, o boto3 levanta ConditionalCheckFailedException
+            expression_values: Valores usados na condição (opcional)
+            expression_attribute_names: Nomes usados na condição (opcional)
             
         Returns:
             Dict: Resposta da operação
@@ -37,23 +72,40 @@ class DynamoDBService:
             item = self._convert_to_dynamodb_format(item)
             
             logger.info(f"Adicionando item na tabela {table_name}: {item}")
-            response = self.aws.put_item(
+            put_kwargs = dict(
                 TableName=self.build_table_name(table_name),
                 Item=item
             )
+            if return_values:
+                put_kwargs["ReturnValues"] = return_values
+            if condition_expression:
+                put_kwargs["ConditionExpression"] = condition_expression
+            if expression_values:
+                put_kwargs["ExpressionAttributeValues"] = self._convert_to_dynamodb_format(expression_values)
+            if expression_attribute_names:
+                put_kwargs["ExpressionAttributeNames"] = expression_attribute_names
+            response = self.aws.put_item(**put_kwargs)
             logger.info(f"Item adicionado com sucesso: {response}")
             return response
         except ClientError as e:
             logger.error(f"Erro ao adicionar item na tabela {table_name}: {str(e)}")
             raise
 
-    def get_item(self, key: Dict, table_name: str) -> Optional[Dict]:
+    def get_item(
+        self,
+        key: Dict,
+        table_name: str,
+        projection: Optional[List[str]] = None,
+        consistent_read: bool = False,
+    ) -> Optional[Dict]:
         """
         Busca um item na tabela DynamoDB.
         
         Args:
             key: Chave primária do item
             table_name: Nome da tabela
+            projection: Atributos a retornar (opcional, padrão: todos)
+            consistent_read: Leitura fortemente consistente (padrão: eventual)
             
         Returns:
             Optional[Dict]: Item encontrado ou None
@@ -65,7 +117,9 @@ class DynamoDBService:
             logger.info(f"Buscando item na tabela {table_name} com chave: {key}")
             response = self.aws.get_item(
                 TableName=self.build_table_name(table_name),
-                Key=dynamodb_key
+                Key=dynamodb_key,
+                ConsistentRead=consistent_read,
+                **self._projection_kwargs(projection)
             )
             
             if 'Item' in response:
@@ -87,6 +141,8 @@ class DynamoDBService:
         expression_values: Dict,
         table_name: str,
         expression_attribute_names: Dict = None,
+        condition_expression: str = None,
+        return_values: str = "ALL_NEW",
     ) -> Dict:
         """
         Atualiza um item na tabela DynamoDB.
@@ -96,6 +152,9 @@ class DynamoDBService:
             update_expression: Expressão de atualização
             expression_values: Valores para a expressão
             table_name: Nome da tabela
+            condition_expression: Condição para aplicar a atualização (opcional);
+                quando falsa, o boto3 levanta ConditionalCheckFailedException
+            return_values: Versão do item devolvida em Attributes (ex.: "ALL_NEW", "ALL_OLD")
             
         Returns:
             Dict: Resposta da operação
@@ -114,7 +173,9 @@ class DynamoDBService:
             )
             if expression_attribute_names:
                 update_kwargs["ExpressionAttributeNames"] = expression_attribute_names
-            update_kwargs["ReturnValues"] = "ALL_NEW"
+            if condition_expression:
+                update_kwargs["ConditionExpression"] = condition_expression
+            update_kwargs["ReturnValues"] = return_values
             response = self.aws.update_item(**update_kwargs)
             logger.info(f"Item atualizado com sucesso: {response}")
             return response
@@ -189,6 +250,92 @@ class DynamoDBService:
             logger.error(f"Erro ao escanear tabela {table_name}: {str(e)}")
             raise
 
+    def iterate_scan_pages(
+        self,
+        table_name: str,
+        segment: Optional[int] = None,
+        total_segments: Optional[int] = None,
+        projection: Optional[List[str]] = None,
+    ) -> Iterator[List[Dict]]:
+        """
+        Escaneia uma tabela DynamoDB devolvendo uma página por vez.
+        Com `segment`/`total_segments`, lê apenas um segmento (scan paralelo).
+        
+        Args:
+            table_name: Nome da tabela
+            segment: Segmento a ler (0 a total_segments - 1)
+            total_segments: Quantidade de segmentos do scan paralelo
+            projection: Atributos a retornar (opcional, padrão: todos)
+            
+        Yields:
+            List[Dict]: Itens de cada página (páginas vazias são omitidas)
+        """
+        pages = self.iterate_scan_pages_with_keys(
+            table_name,
+            segment=segment,
+            total_segments=total_segments,
+            projection=projection,
+        )
+        for items, _ in pages:
+            if items:
+                yield items
+
+    def iterate_scan_pages_with_keys(
+        self,
+        table_name: str,
+        segment: Optional[int] = None,
+        total_segments: Optional[int] = None,
+        projection: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        exclusive_start_key: Optional[Dict] = None,
+    ) -> Iterator[Tuple[List[Dict], Optional[Dict]]]:
+        """
+        Como iterate_scan_pages, mas devolve junto de cada página o LastEvaluatedKey
+        (no formato do DynamoDB, serializável em JSON), para retomar o scan depois
+        a partir de `exclusive_start_key`. Páginas vazias também são devolvidas.
+        
+        Args:
+            table_name: Nome da tabela
+            segment: Segmento a ler (0 a total_segments - 1)
+            total_segments: Quantidade de segmentos do scan paralelo
+            projection: Atributos a retornar (opcional, padrão: todos)
+            page_size: Máximo de itens lidos por chamada (Limit)
+            exclusive_start_key: Chave em que o scan parou (opcional)
+            
+        Yields:
+            Tuple[List[Dict], Optional[Dict]]: Itens da página e chave para continuar (None na última)
+        """
+        try:
+            scan_kwargs = {'TableName': self.build_table_name(table_name)}
+
+            if total_segments:
+                scan_kwargs['Segment'] = segment
+                scan_kwargs['TotalSegments'] = total_segments
+
+            if page_size:
+                scan_kwargs['Limit'] = page_size
+
+            if exclusive_start_key:
+                scan_kwargs['ExclusiveStartKey'] = exclusive_start_key
+
+            scan_kwargs.update(self._projection_kwargs(projection))
+
+            while True:
+                response = self.aws.scan(**scan_kwargs)
+
+                items = [self._convert_from_dynamodb_format(item) for item in response.get('Items', [])]
+                last_evaluated_key = response.get('LastEvaluatedKey')
+                yield items, last_evaluated_key
+
+                if not last_evaluated_key:
+                    break
+
+                scan_kwargs['ExclusiveStartKey'] = last_evaluated_key
+
+        except ClientError as e:
+            logger.error(f"Erro ao escanear tabela {table_name} (segmento {segment}): {str(e)}")
+            raise
+
     def query_table(
         self,
         table_name: str,
@@ -198,6 +345,7 @@ class DynamoDBService:
         filter_expression: str = None,
         expression_attribute_names: Dict = None,
         scan_index_forward: bool = True,
+        projection: Optional[List[str]] = None,
     ) -> List[Dict]:
         """
         Consulta uma tabela DynamoDB.
@@ -206,10 +354,89 @@ class DynamoDBService:
             table_name: Nome da tabela
             key_condition_expression: Expressão de condição da chave
             expression_values: Valores para a expressão
+            projection: Atributos a retornar (opcional, padrão: todos)
             
         Returns:
             List[Dict]: Lista de itens encontrados
         """
+        items = []
+        for page in self.iterate_query_pages(
+            table_name,
+            key_condition_expression,
+            expression_values,
+            index_name=index_name,
+            filter_expression=filter_expression,
+            expression_attribute_names=expression_attribute_names,
+            scan_index_forward=scan_index_forward,
+            projection=projection,
+        ):
+            items.extend(page)
+
+        logger.info(f"Encontrados {len(items)} itens na consulta")
+        return items
+
+    def iterate_query_pages(
+        self,
+        table_name: str,
+        key_condition_expression: str,
+        expression_values: Dict,
+        index_name: str = None,
+        filter_expression: str = None,
+        expression_attribute_names: Dict = None,
+        scan_index_forward: bool = True,
+        projection: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+    ) -> Iterator[List[Dict]]:
+        """
+        Consulta uma tabela DynamoDB devolvendo uma página por vez.
+        Só a página atual fica em memória, o que permite percorrer partições grandes.
+        
+        Args:
+            table_name: Nome da tabela
+            key_condition_expression: Expressão de condição da chave
+            expression_values: Valores para a expressão
+            projection: Atributos a retornar (opcional, padrão: todos)
+            page_size: Limite de itens lidos por chamada (opcional, padrão: até 1 MB)
+            
+        Yields:
+            List[Dict]: Itens de cada página (páginas vazias são omitidas)
+        """
+        pages = self.iterate_query_pages_with_keys(
+            table_name,
+            key_condition_expression,
+            expression_values,
+            index_name=index_name,
+            filter_expression=filter_expression,
+            expression_attribute_names=expression_attribute_names,
+            scan_index_forward=scan_index_forward,
+            projection=projection,
+            page_size=page_size,
+        )
+        for items, _ in pages:
+            if items:
+                yield items
+
+    def iterate_query_pages_with_keys(
+        self,
+        table_name: str,
+        key_condition_expression: str,
+        expression_values: Dict,
+        index_name: str = None,
+        filter_expression: str = None,
+        expression_attribute_names: Dict = None,
+        scan_index_forward: bool = True,
+        projection: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        exclusive_start_key: Optional[Dict] = None,
+    ) -> Iterator[Tuple[List[Dict], Optional[Dict]]]:
+        """
+        Como iterate_query_pages, mas devolve junto de cada página o LastEvaluatedKey
+        (no formato do DynamoDB, serializável em JSON), para retomar a consulta
+        depois a partir de `exclusive_start_key`. Páginas vazias também são devolvidas.
+        
+        Yields:
+            Tuple[List[Dict], Optional[Dict]]: Itens da página e chave para continuar (None na última)
+        """
         try:
             query_kwargs = {
                 "TableName": self.build_table_name(table_name),
@@ -227,27 +454,152 @@ class DynamoDBService:
             if expression_attribute_names:
                 query_kwargs['ExpressionAttributeNames'] = expression_attribute_names
 
+            if page_size:
+                query_kwargs['Limit'] = page_size
+
+            if exclusive_start_key:
+                query_kwargs['ExclusiveStartKey'] = exclusive_start_key
+
+            query_kwargs.update(self._projection_kwargs(projection, expression_attribute_names))
+
             logger.info(f"Consultando tabela {table_name} com expressão: {key_condition_expression}")
-            items = []
             while True:
                 response = self.aws.query(**query_kwargs)
 
-                if 'Items' in response:
-                    for item in response['Items']:
-                        items.append(self._convert_from_dynamodb_format(item))
+                items = [self._convert_from_dynamodb_format(item) for item in response.get('Items', [])]
+                last_evaluated_key = response.get('LastEvaluatedKey')
+                yield items, last_evaluated_key
 
-                if 'LastEvaluatedKey' not in response:
+                if not last_evaluated_key:
                     break
 
-                query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+                query_kwargs['ExclusiveStartKey'] = last_evaluated_key
+
+        except ClientError as e:
+            logger.error(f"Erro ao consultar tabela {table_name}: {str(e)}")
+            raise
+
+    def batch_get_items(
+        self,
+        keys: List[Dict],
+        table_name: str,
+        max_attempts: int = 5,
+        projection: Optional[List[str]] = None,
+        consistent_read: bool = False,
+    ) -> List[Dict]:
+        """
+        Busca vários itens pela chave primária com BatchGetItem.
+        
+        As chaves são enviadas em lotes de até 100; chaves devolvidas em
+        UnprocessedKeys (throttling) são reenviadas com backoff exponencial.
+        
+        Args:
+            keys: Chaves primárias dos itens
+            table_name: Nome da tabela
+            max_attempts: Tentativas por lote antes de desistir das chaves pendentes
+            projection: Atributos a retornar (opcional, padrão: todos)
+            consistent_read: Leitura fortemente consistente (padrão: eventual)
             
-            logger.info(f"Encontrados {len(items)} itens na consulta")
+        Returns:
+            List[Dict]: Itens encontrados, sem ordem garantida; chaves inexistentes são omitidas
+        """
+        physical_table_name = self.build_table_name(table_name)
+        items = []
+        try:
+            for start in range(0, len(keys), BATCH_GET_MAX_KEYS):
+                request_items = {
+                    physical_table_name: {
+                        "Keys": [self._convert_to_dynamodb_format(key) for key in keys[start:start + BATCH_GET_MAX_KEYS]],
+                        "ConsistentRead": consistent_read,
+                        **self._projection_kwargs(projection),
+                    }
+                }
+                attempt = 0
+                while request_items:
+                    if attempt > 0:
+                        # Full jitter: espera aleatória até o teto exponencial
+                        time.sleep(random.uniform(0, min(1.0, 0.05 * 2 ** attempt)))
+                    response = self.aws.batch_get_item(RequestItems=request_items)
+                    for item in response.get("Responses", {}).get(physical_table_name, []):
+                        items.append(self._convert_from_dynamodb_format(item))
+
+                    request_items = response.get("UnprocessedKeys") or {}
+                    attempt += 1
+                    if request_items and attempt >= max_attempts:
+                        pending = len(request_items[physical_table_name]["Keys"])
+                        raise RuntimeError(f"{pending} chaves não processadas em {table_name} após {max_attempts} tentativas")
+
+            logger.info(f"Encontrados {len(items)} de {len(keys)} itens na tabela {table_name}")
             return items
+
+        except ClientError as e:
+            logger.error(f"Erro ao buscar itens em lote na tabela {table_name}: {str(e)}")
+            raise
+
+    def batch_write_items(self, items: List[Dict], table_name: str, max_attempts: int = 5) -> int:
+        """
+        Grava (PutItem) vários itens com BatchWriteItem, substituindo os existentes.
+        
+        Os itens são enviados em lotes de até 25; itens devolvidos em
+        UnprocessedItems (throttling) são reenviados com backoff exponencial.
+        
+        Args:
+            items: Itens completos a gravar
+            table_name: Nome da tabela
+            max_attempts: Tentativas por lote antes de desistir dos itens pendentes
             
+        Returns:
+            int: Quantidade de itens gravados
+        """
+        physical_table_name = self.build_table_name(table_name)
+        try:
+            for start in range(0, len(items), BATCH_WRITE_MAX_ITEMS):
+                request_items = {
+                    physical_table_name: [
+                        {"PutRequest": {"Item": self._convert_to_dynamodb_format(item)}}
+                        for item in items[start:start + BATCH_WRITE_MAX_ITEMS]
+                    ]
+                }
+                attempt = 0
+                while request_items:
+                    if attempt > 0:
+                        # Full jitter: espera aleatória até o teto exponencial
+                        time.sleep(random.uniform(0, min(1.0, 0.05 * 2 ** attempt)))
+                    response = self.aws.batch_write_item(RequestItems=request_items)
+
+                    request_items = response.get("UnprocessedItems") or {}
+                    attempt += 1
+                    if request_items and attempt >= max_attempts:
+                        pending = len(request_items[physical_table_name])
+                        raise RuntimeError(f"{pending} itens não gravados em {table_name} após {max_attempts} tentativas")
+
+            logger.info(f"Gravados {len(items)} itens em lote na tabela {table_name}")
+            return len(items)
+
         except ClientError as e:
-            logger.error(f"Erro ao consultar tabela {table_name}: {str(e)}")
+            logger.error(f"Erro ao gravar itens em lote na tabela {table_name}: {str(e)}")
             raise
 
+    @staticmethod
+    def _projection_kwargs(projection: Optional[List[str]], expression_attribute_names: Dict = None) -> Dict:
+        """
+        Monta ProjectionExpression com placeholders (#p0, #p1...), já que vários
+        atributos (ex.: id, success) são palavras reservadas do DynamoDB.
+        Os nomes existentes da consulta são preservados.
+        """
+        if not projection:
+            return {}
+        names = dict(expression_attribute_names or {})
+        placeholders = []
+        for index, attribute in enumerate(dict.fromkeys(projection)):
+            placeholder = f"#p{index}"
+            names[placeholder] = attribute
+            placeholders.append(placeholder)
+        return {
+            "ProjectionExpression": ", ".join(placeholders),
+            "ExpressionAttributeNames": names,
+        }
+
     def _convert_to_dynamodb_format(self, data: Any) -> Any:
         """
         Converte dados para o formato aceito pelo DynamoDB.
@@ -0,0 +1,270 @@
+"""
+Controle de vazão adaptativo para as chamadas ao DynamoDB.
+
+Cada tabela tem um token bucket compartilhado por todas as threads e por todas
+as instâncias do DynamoDBService. Enquanto a tabela nunca recusou uma chamada, o
+bucket não limita nada (só mede a vazão). No primeiro throttling (erro de
+capacidade ou itens devolvidos em Unprocessed*), a taxa passa a ser metade da
+vazão medida e segue AIMD: cresce com os itens processados sem recusa e cai pela
+metade a cada novo throttling. Ao voltar ao teto, o limite é desligado de novo.
+Assim, tabelas on-demand sem recusas não esperam nada, e scans paralelos e
+gravações em lote não viram uma tempestade de retries quando a capacidade acaba.
+
+A unidade é item por segundo: GetItem/PutItem/UpdateItem/DeleteItem contam 1,
+BatchGetItem e BatchWriteItem contam as chaves/itens enviados, Query e Scan
+contam os itens lidos na página (ScannedCount), cobrados depois da resposta.
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from botocore.exceptions import ClientError, ConnectionError as BotoConnectionError, HTTPClientError
+
+logger = logging.getLogger(__name__)
+
+# Erros que indicam falta de capacidade: reduzem a taxa da tabela e são repetidos
+THROTTLING_ERROR_CODES = (
+    "ProvisionedThroughputExceededException",
+    "ThrottlingException",
+    "RequestLimitExceeded",
+)
+
+# Erros transitórios do serviço: são repetidos sem alterar a taxa
+TRANSIENT_ERROR_CODES = ("InternalServerError", "ServiceUnavailable")
+
+# Falhas de conexão e timeouts de leitura (os mesmos que o modo standard do
+# botocore repete): também são repetidas sem alterar a taxa
+TRANSIENT_EXCEPTIONS = (BotoConnectionError, HTTPClientError)
+
+# Operações do cliente que passam pelo controle de vazão
+THROTTLED_OPERATIONS = (
+    "get_item",
+    "put_item",
+    "update_item",
+    "delete_item",
+    "query",
+    "scan",
+    "batch_get_item",
+    "batch_write_item",
+)
+
+# Intervalo mínimo entre duas reduções da taxa de uma tabela: recusas simultâneas
+# de várias threads são efeito da mesma sobrecarga e reduzem uma vez só
+AIMD_DECREASE_COOLDOWN_SECONDS = 1.0
+
+
+class AdaptiveTokenBucket:
+    """
+    Token bucket com taxa ajustada por AIMD, desligado até o primeiro throttling.
+
+    Args:
+        min_rate: Piso da taxa (itens por segundo)
+        max_rate: Teto da taxa; ao alcançá-lo, o limite é desligado
+        increase: Quanto a taxa cresce a cada `rate` itens processados sem recusa
+            (com a tabela na taxa limite, `increase` itens/s a cada segundo)
+        decrease_factor: Fator aplicado à taxa a cada throttling
+    """
+
+    def __init__(
+        self,
+        min_rate: float,
+        max_rate: float,
+        increase: float,
+        decrease_factor: float = 0.5,
+    ):
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        # None: sem limite
+        self.rate: Optional[float] = None
+        self._tokens = 0.0
+        self._updated_at = time.monotonic()
+        self._last_decrease = float("-inf")
+        # Vazão medida em janelas de um segundo, base da taxa no primeiro throttling
+        self._window_start = self._updated_at
+        self._window_units = 0.0
+        self._observed_rate = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def limited(self) -> bool:
+        return self.rate is not None
+
+    def acquire(self, cost: float = 1) -> float:
+        """
+        Reserva `cost` tokens, esperando se o bucket estiver vazio.
+        As reservas são feitas em ordem: quem chega depois espera mais.
+
+        Returns:
+            float: Segundos esperados
+        """
+        with self._lock:
+            wait = self._take(cost)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def charge(self, cost: float) -> None:
+        """Cobra itens conhecidos só depois da chamada; a espera fica para a próxima reserva."""
+        if cost > 0:
+            with self._lock:
+                self._take(cost)
+
+    def on_success(self, cost: float = 1) -> None:
+        with self._lock:
+            if self.rate is None:
+                return
+            self.rate += self.increase * cost / self.rate
+            if self.rate >= self.max_rate:
+                logger.info("Taxa do DynamoDB voltou ao teto; limite desligado")
+                self.rate = None
+
+    def on_throttle(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_decrease < AIMD_DECREASE_COOLDOWN_SECONDS:
+                return
+            self._last_decrease = now
+            self._refill(now)
+            if self.rate is None:
+                observed = max(self._observed_rate, self._window_units / max(now - self._window_start, 1.0))
+                base = min(observed or self.max_rate, self.max_rate)
+            else:
+                base = self.rate
+            self.rate = max(self.min_rate, base * self.decrease_factor)
+            # Descarta o acúmulo para a nova taxa valer já nas próximas chamadas
+            self._tokens = min(self._tokens, 0.0)
+
+    def _take(self, cost: float) -> float:
+        now = time.monotonic()
+        self._measure(now, cost)
+        if self.rate is None:
+            return 0.0
+        self._refill(now)
+        self._tokens -= cost
+        return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def _measure(self, now: float, cost: float) -> None:
+        if now - self._window_start >= 1.0:
+            self._observed_rate = self._window_units / (now - self._window_start)
+            self._window_start, self._window_units = now, 0.0
+        self._window_units += cost
+
+    def _refill(self, now: float) -> None:
+        if self.rate is None:
+            self._tokens = 0.0
+        else:
+            # Capacidade de um segundo na taxa atual
+            self._tokens = min(self.rate, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+
+class TableRateLimiters:
+    """Um AdaptiveTokenBucket por tabela física, criado no primeiro uso."""
+
+    def __init__(self, min_rate: float, max_rate: float, increase: float):
+        self._settings = dict(min_rate=min_rate, max_rate=max_rate, increase=increase)
+        self._buckets: Dict[str, AdaptiveTokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def for_table(self, table_name: str) -> AdaptiveTokenBucket:
+        bucket = self._buckets.get(table_name)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.setdefault(table_name, AdaptiveTokenBucket(**self._settings))
+        return bucket
+
+
+def _request_table_and_cost(kwargs: Dict[str, Any]) -> Tuple[Optional[str], int]:
+    request_items = kwargs.get("RequestItems")
+    if request_items:
+        # Os serviços deste projeto enviam uma tabela por chamada de lote
+        table_name, requests = next(iter(request_items.items()))
+        return table_name, max(len(requests["Keys"] if isinstance(requests, dict) else requests), 1)
+    return kwargs.get("TableName"), 1
+
+
+def _read_cost(operation: str, response: Dict[str, Any]) -> int:
+    """Itens lidos por Query/Scan (os filtrados também consomem capacidade)."""
+    if operation not in ("query", "scan"):
+        return 0
+    return int(response.get("ScannedCount", response.get("Count", 0)))
+
+
+def _unprocessed(response: Dict[str, Any]) -> bool:
+    return bool(response.get("UnprocessedKeys") or response.get("UnprocessedItems"))
+
+
+def _transient_backoff(attempt: int) -> None:
+    """Espera com full jitter antes de repetir um erro que não é de capacidade."""
+    time.sleep(random.uniform(0, min(1.0, 0.05 * 2 ** attempt)))
+
+
+class ThrottledDynamoDBClient:
+    """
+    Envolve o cliente boto3 do DynamoDB: cada operação de THROTTLED_OPERATIONS
+    reserva tokens no bucket da tabela antes da chamada e informa o resultado
+    ao bucket. Throttling, erros transitórios e falhas de conexão são repetidos
+    até `max_attempts` vezes, sempre passando pelo bucket. Esse é o espaçamento entre tentativas;
+    os retries do botocore devem ficar desligados para não somar esperas.
+    As demais propriedades e métodos do cliente são repassados sem alteração.
+    """
+
+    def __init__(self, client: Any, limiters: TableRateLimiters, max_attempts: int):
+        self._client = client
+        self._limiters = limiters
+        self._max_attempts = max_attempts
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._client, name)
+        if name not in THROTTLED_OPERATIONS:
+            return attribute
+        return lambda **kwargs: self._call(name, attribute, kwargs)
+
+    def _call(self, operation: str, method: Callable[..., Dict], kwargs: Dict[str, Any]) -> Dict:
+        table_name, cost = _request_table_and_cost(kwargs)
+        bucket = self._limiters.for_table(table_name or "")
+        attempt = 1
+        while True:
+            bucket.acquire(cost)
+            try:
+                response = method(**kwargs)
+            except ClientError as e:
+                code = e.response.get("Error", {}).get("Code")
+                if code not in THROTTLING_ERROR_CODES and code not in TRANSIENT_ERROR_CODES:
+                    raise
+                if code in THROTTLING_ERROR_CODES:
+                    bucket.on_throttle()
+                if attempt >= self._max_attempts:
+                    raise
+                if code in TRANSIENT_ERROR_CODES:
+                    # Erro do serviço, não de capacidade: o bucket não segura a nova tentativa
+                    _transient_backoff(attempt)
+                logger.warning(
+                    f"{operation} em {table_name} recusado ({code}), tentativa {attempt}/{self._max_attempts}; "
+                    f"taxa atual {bucket.rate or 0:.1f}/s"
+                )
+                attempt += 1
+                continue
+            except TRANSIENT_EXCEPTIONS as e:
+                if attempt >= self._max_attempts:
+                    raise
+                _transient_backoff(attempt)
+                logger.warning(f"{operation} em {table_name} falhou ({e}), tentativa {attempt}/{self._max_attempts}")
+                attempt += 1
+                continue
+
+            # Query/Scan reservaram 1 item; o restante da página é cobrado agora
+            read_cost = _read_cost(operation, response)
+            bucket.charge(read_cost - cost)
+
+            # Itens devolvidos sem processar também são throttling; o reenvio fica com quem chamou
+            if _unprocessed(response):
+                bucket.on_throttle()
+            else:
+                bucket.on_success(max(cost, read_cost))
+            return response
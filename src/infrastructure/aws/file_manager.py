@@ -1,65 +1,181 @@
 import logging
+from typing import Dict, Iterable, Optional, Tuple
+
+from botocore.exceptions import ClientError
+
 from src.infrastructure.aws.boto_aws import get_instance_aws, ServiceNameAWS
+from src.infrastructure.aws.s3_multipart_writer import S3MultipartGzipWriter
+from src.infrastructure.cache.ttl_cache import MISSING, TTLCache
 from src.infrastructure.config.config import config
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Validade das URLs de download de certificados (30 minutos)
+CERTIFICATE_DOWNLOAD_EXPIRES_IN = 1800
+
+# Compartilhado entre instâncias para sobreviver a invocações "quentes" da Lambda
+_presigned_url_cache = TTLCache(max_size=config.PRESIGNED_URL_CACHE_MAX_SIZE)
+
+
 class FileManager:
     """
     Gerencia operações de arquivos no S3.
     """
 
-    def __init__(self):
+    def __init__(self, url_cache: Optional[TTLCache] = None):
         self.aws = get_instance_aws(ServiceNameAWS.S3)
         self.bucket_name = config.S3_BUCKET_NAME
+        self.url_cache = url_cache if url_cache is not None else _presigned_url_cache
+        self.reuse_fraction = config.PRESIGNED_URL_REUSE_FRACTION
 
-    def get_url(self, key: str, expires_in: int = 604800) -> str:
+    def get_url(self, key: str, expires_in: int = 604800, disposition: str = "inline") -> str:
         """
         Gera uma URL pré-assinada para acessar (GET) um objeto no S3.
-        Configura response-content-disposition=inline para visualização direta no navegador.
-        
+        Configura response-content-disposition (padrão: inline) para visualização direta no navegador.
+
+        A URL assinada é reaproveitada enquanto não tiver passado a fração
+        PRESIGNED_URL_REUSE_FRACTION da sua validade, evitando reassinar
+        a mesma chave em rajadas de downloads.
+
         Args:
             key: Chave do objeto no S3
             expires_in: Tempo de expiração em segundos (padrão: 7 dias)
-            
+            disposition: Valor de response-content-disposition (inline ou attachment)
+
         Returns:
             URL pré-assinada para acesso ao objeto
-            
+
         Raises:
             Exception: Se houver erro ao gerar a URL
         """
+        cache_key = (key, disposition, expires_in)
+        cached_url = self.url_cache.get(cache_key)
+        if cached_url is not MISSING:
+            logger.info(f"Reusing cached URL for key {key}")
+            return cached_url
+
         try:
             logger.info(f"Getting URL for key {key} with expiration {expires_in} seconds")
-            
-            # Gera URL pré-assinada para GET com response-content-disposition=inline
+
+            # Gera URL pré-assinada para GET com response-content-disposition
             presigned_url = self.aws.generate_presigned_url(
                 'get_object',
                 Params={
                     'Bucket': self.bucket_name,
                     'Key': key,
-                    'ResponseContentDisposition': 'inline'
+                    'ResponseContentDisposition': disposition
                 },
                 ExpiresIn=expires_in
             )
-            
+
             logger.info(f"Successfully retrieved URL for key {key}")
+            self.url_cache.set(cache_key, presigned_url, ttl=expires_in * self.reuse_fraction)
             return presigned_url
-            
+
         except Exception as e:
             logger.error(f"Error generating presigned URL for key {key}: {e}")
             return None
-    
+
+    def get_urls(
+        self,
+        keys: Iterable[str],
+        expires_in: int = CERTIFICATE_DOWNLOAD_EXPIRES_IN,
+        disposition: str = "inline",
+    ) -> Dict[str, Optional[str]]:
+        """
+        Gera (ou reaproveita do cache) URLs pré-assinadas para várias chaves.
+        Útil para endpoints de listagem.
+
+        Args:
+            keys: Chaves dos objetos no S3 (duplicadas e vazias são ignoradas)
+            expires_in: Tempo de expiração em segundos (padrão: 30 minutos)
+            disposition: Valor de response-content-disposition
+
+        Returns:
+            Dicionário chave -> URL pré-assinada (None quando a assinatura falhar)
+        """
+        urls: Dict[str, Optional[str]] = {}
+        for key in keys:
+            if key and key not in urls:
+                urls[key] = self.get_url(key, expires_in=expires_in, disposition=disposition)
+        return urls
+
+    def open_gzip_upload(self, key: str, content_type: str = "application/gzip") -> S3MultipartGzipWriter:
+        """
+        Abre um writer que comprime e envia o objeto ao S3 em partes (multipart upload).
+        Use com `with`: o upload é concluído ao sair do bloco, ou abortado em caso de erro.
+
+        Args:
+            key: Chave do objeto no S3
+            content_type: Content-Type gravado no objeto
+
+        Returns:
+            S3MultipartGzipWriter pronto para receber bytes
+        """
+        return S3MultipartGzipWriter(
+            self.aws,
+            self.bucket_name,
+            key,
+            content_type=content_type,
+            part_size=config.EXPORT_PART_SIZE_BYTES,
+        )
+
+    def read_object(self, key: str) -> Optional[Tuple[bytes, str]]:
+        """
+        Lê um objeto do S3.
+
+        Args:
+            key: Chave do objeto no S3
+
+        Returns:
+            Conteúdo e ETag do objeto, ou None se ele não existir
+        """
+        try:
+            response = self.aws.get_object(Bucket=self.bucket_name, Key=key)
+            return response["Body"].read(), response["ETag"]
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == "NoSuchKey":
+                return None
+            logger.error(f"Error reading object {key}: {e}")
+            raise
+
+    def write_object(
+        self,
+        key: str,
+        body: bytes,
+        content_type: str = "application/octet-stream",
+        if_match: Optional[str] = None,
+    ) -> None:
+        """
+        Grava um objeto no S3 com escrita condicional: com `if_match`, só substitui
+        o objeto se o ETag atual for esse; sem ele, só cria se o objeto não existir.
+        Se a condição falhar, o boto3 levanta ClientError (PreconditionFailed).
+
+        Args:
+            key: Chave do objeto no S3
+            body: Conteúdo do objeto
+            content_type: Content-Type gravado no objeto
+            if_match: ETag lido antes da alteração (opcional)
+        """
+        condition = {"IfMatch": if_match} if if_match else {"IfNoneMatch": "*"}
+        self.aws.put_object(
+            Bucket=self.bucket_name,
+            Key=key,
+            Body=body,
+            ContentType=content_type,
+            **condition,
+        )
+
     def get_certificate_download_url(self, certificate_key: str) -> str:
         """
         Gera URL pré-assinada específica para download de certificados.
         URL válida por 30 minutos.
-        
+
         Args:
             certificate_key: Chave do certificado no S3
-            
+
         Returns:
             URL pré-assinada para download do certificado (válida por 30 minutos)
         """
-        return self.get_url(certificate_key, expires_in=1800)  # 30 minutos em segundos
-    
\ No newline at end of file
+        return self.get_url(certificate_key, expires_in=CERTIFICATE_DOWNLOAD_EXPIRES_IN)
@@ -0,0 +1,121 @@
+"""
+Compressão das respostas da Lambda conforme o Accept-Encoding do cliente.
+O API Gateway exige que corpos binários sejam enviados em base64.
+"""
+
+import base64
+import gzip
+import logging
+from typing import Any, Dict, Optional
+
+try:
+    import brotli
+except ImportError:  # dependência opcional
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE_CONTENT_TYPES = ("application/json", "text/html", "text/plain", "text/csv", "application/x-ndjson")
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+def supported_encodings() -> tuple:
+    """Encodings disponíveis, em ordem de preferência do servidor."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Escolhe o encoding a partir do header Accept-Encoding.
+    Respeita q=0 e, em caso de empate, prefere a ordem de supported_encodings().
+    """
+    if not accept_encoding:
+        return None
+
+    accepted: Dict[str, float] = {}
+    for token in accept_encoding.split(","):
+        name, _, params = token.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in supported_encodings():
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def compress_response(response: Dict[str, Any], accept_encoding: Optional[str], min_size: int) -> Dict[str, Any]:
+    """
+    Comprime o corpo de uma resposta já montada pelo resolver.
+
+    Respostas sem corpo, menores que `min_size`, já codificadas em base64
+    (binárias ou pré-comprimidas) ou com content type não textual são
+    devolvidas sem alteração.
+
+    Args:
+        response: Resposta no formato de integração proxy do API Gateway
+        accept_encoding: Valor do header Accept-Encoding da requisição
+        min_size: Tamanho mínimo, em bytes, para valer a pena comprimir
+
+    Returns:
+        A mesma resposta, com corpo comprimido em base64 quando aplicável
+    """
+    body = response.get("body")
+    if not body or response.get("isBase64Encoded"):
+        return response
+
+    headers_key = "multiValueHeaders" if "multiValueHeaders" in response else "headers"
+    headers = response.get(headers_key) or {}
+    lower_headers = {name.lower(): value for name, value in headers.items()}
+    if "content-encoding" in lower_headers:
+        return response
+
+    content_type = lower_headers.get("content-type", "")
+    if isinstance(content_type, list):
+        content_type = ",".join(content_type)
+    if not content_type.startswith(COMPRESSIBLE_CONTENT_TYPES):
+        return response
+
+    raw_body = body.encode("utf-8") if isinstance(body, str) else body
+    if len(raw_body) < min_size:
+        return response
+
+    encoding = negotiate_encoding(accept_encoding)
+    if encoding is None:
+        return response
+
+    compressed = compress_body(raw_body, encoding)
+    logger.debug(f"Resposta comprimida com {encoding}: {len(raw_body)} -> {len(compressed)} bytes")
+
+    headers = dict(headers)
+    if headers_key == "multiValueHeaders":
+        headers["Content-Encoding"] = [encoding]
+        headers["Vary"] = ["Accept-Encoding"]
+    else:
+        headers["Content-Encoding"] = encoding
+        headers["Vary"] = "Accept-Encoding"
+
+    response = dict(response)
+    response[headers_key] = headers
+    response["body"] = base64.b64encode(compressed).decode()
+    response["isBase64Encoded"] = True
+    return response
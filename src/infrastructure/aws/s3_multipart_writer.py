@@ -0,0 +1,128 @@
+"""
+Escrita de objetos gzip no S3 em streaming, via multipart upload.
+Só o buffer da parte atual (comprimido) fica em memória, qualquer que seja o tamanho total.
+"""
+
+import logging
+import zlib
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# O S3 exige partes de pelo menos 5 MiB (exceto a última)
+MULTIPART_MIN_PART_SIZE = 5 * 1024 * 1024
+
+GZIP_LEVEL = 6
+
+
+class S3MultipartGzipWriter:
+    """
+    Comprime (gzip) o que for escrito e envia ao S3 em partes de `part_size` bytes.
+
+    Objetos que não chegam a uma parte são enviados com um único put_object.
+    Em caso de erro dentro do `with`, o multipart upload é abortado para não
+    deixar partes órfãs cobradas no bucket.
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        bucket: str,
+        key: str,
+        content_type: str = "application/gzip",
+        part_size: int = MULTIPART_MIN_PART_SIZE,
+    ):
+        if part_size < MULTIPART_MIN_PART_SIZE:
+            raise ValueError(f"part_size deve ser de pelo menos {MULTIPART_MIN_PART_SIZE} bytes")
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.key = key
+        self.content_type = content_type
+        self.part_size = part_size
+        self.bytes_written = 0
+        self.bytes_uploaded = 0
+        # wbits=31: cabeçalho e trailer gzip
+        self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        self._buffer = bytearray()
+        self._upload_id: Optional[str] = None
+        self._parts: List[Dict] = []
+        self._closed = False
+
+    def __enter__(self) -> "S3MultipartGzipWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, data: bytes) -> None:
+        self.bytes_written += len(data)
+        self._buffer += self._compressor.compress(data)
+        if len(self._buffer) >= self.part_size:
+            self._upload_part()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._buffer += self._compressor.flush()
+
+        if self._upload_id is None:
+            self.s3_client.put_object(
+                Bucket=self.bucket,
+                Key=self.key,
+                Body=bytes(self._buffer),
+                ContentType=self.content_type,
+            )
+            self.bytes_uploaded += len(self._buffer)
+        else:
+            if self._buffer:
+                self._upload_part()
+            self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self._upload_id,
+                MultipartUpload={"Parts": self._parts},
+            )
+
+        self._buffer = bytearray()
+        self._closed = True
+        logger.info(
+            f"Objeto {self.key} enviado: {self.bytes_written} bytes -> {self.bytes_uploaded} bytes gzip "
+            f"em {max(len(self._parts), 1)} parte(s)"
+        )
+
+    def abort(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._buffer = bytearray()
+        if self._upload_id is None:
+            return
+        try:
+            self.s3_client.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=self._upload_id)
+            logger.warning(f"Multipart upload de {self.key} abortado")
+        except Exception as e:
+            logger.error(f"Erro ao abortar multipart upload de {self.key}: {e}")
+
+    def _upload_part(self) -> None:
+        if self._upload_id is None:
+            response = self.s3_client.create_multipart_upload(
+                Bucket=self.bucket,
+                Key=self.key,
+                ContentType=self.content_type,
+            )
+            self._upload_id = response["UploadId"]
+
+        part_number = len(self._parts) + 1
+        response = self.s3_client.upload_part(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=bytes(self._buffer),
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+        self.bytes_uploaded += len(self._buffer)
+        self._buffer = bytearray()
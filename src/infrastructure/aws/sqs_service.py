@@ -1,29 +1,122 @@
-import json
+import hashlib
 import logging
+import random
+import time
 import uuid
 from botocore.exceptions import ClientError
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from src.infrastructure.aws.boto_aws import get_instance_aws, ServiceNameAWS
 from src.infrastructure.config.config import config
+from src.infrastructure.serialization.json_serializer import get_json_serializer
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Limites do SendMessageBatch: 10 mensagens e 256 KiB somando todos os corpos
+SEND_BATCH_MAX_ENTRIES = 10
+SEND_BATCH_MAX_BYTES = 256 * 1024
+
+
+def _fifo_attributes(orders: List[Dict]) -> Dict[str, str]:
+    """
+    MessageGroupId e MessageDeduplicationId de uma mensagem para fila FIFO.
+    O grupo é o produto (as mensagens de um produto são entregues em ordem) e a
+    deduplicação vem dos order_ids ordenados: reenviar os mesmos pedidos dentro
+    da janela de deduplicação do SQS (5 minutos) não gera uma nova mensagem.
+    """
+    order_ids = sorted(str(order.get("order_id")) for order in orders)
+    product_id = orders[0].get("product_id") if orders else None
+    return {
+        "MessageGroupId": f"product-{product_id}",
+        "MessageDeduplicationId": hashlib.sha256(",".join(order_ids).encode("utf-8")).hexdigest(),
+    }
+
+
 class SQSService:
     def __init__(self):
         self.aws = get_instance_aws(ServiceNameAWS.SQS)
-        self.queue_url = config.BUILDER_QUEUE_URL        
+        self.queue_url = config.BUILDER_QUEUE_URL
+        self.serializer = get_json_serializer(config.JSON_SERIALIZER)
 
-    def send_message(self, messagens: List[Dict]):
+    def send_message(self, messagens: List[Dict], queue_url: Optional[str] = None):
+        queue_url = queue_url or self.queue_url
         try:
-            logger.info(f"Enviando mensagem para a fila {self.queue_url} com {len(messagens)} mensagens")
+            logger.info(f"Enviando mensagem para a fila {queue_url} com {len(messagens)} mensagens")
             response = self.aws.send_message(
-                QueueUrl=self.queue_url,
-                MessageBody=json.dumps(messagens),
+                QueueUrl=queue_url,
+                MessageBody=self.serializer(messagens),
+                **(_fifo_attributes(messagens) if queue_url.endswith(".fifo") else {}),
             )
             logger.info(f"Mensagem enviada com sucesso: {response['MessageId']}")
             return response
         except ClientError as e:
-            logger.error(f"Erro ao enviar mensagem para a fila {self.queue_url}: {str(e)}")
-            raise
\ No newline at end of file
+            logger.error(f"Erro ao enviar mensagem para a fila {queue_url}: {str(e)}")
+            raise
+
+    def send_message_batch(
+        self,
+        messages: List[List[Dict]],
+        max_attempts: int = 3,
+        queue_url: Optional[str] = None,
+    ) -> int:
+        """
+        Envia várias mensagens com SendMessageBatch, respeitando os limites de
+        quantidade e de tamanho por chamada. Entradas recusadas pelo SQS são
+        reenviadas com backoff exponencial com jitter. Em fila FIFO, cada
+        mensagem leva os ids de grupo e de deduplicação (ver _fifo_attributes).
+
+        Args:
+            messages: Corpos das mensagens (cada um é uma lista de ordens, como em send_message)
+            max_attempts: Tentativas por lote antes de desistir das entradas recusadas
+            queue_url: Fila de destino (padrão: BUILDER_QUEUE_URL)
+
+        Returns:
+            int: Quantidade de mensagens enviadas
+
+        Raises:
+            RuntimeError: Se alguma entrada continuar recusada após max_attempts
+        """
+        queue_url = queue_url or self.queue_url
+        try:
+            sent = 0
+            attributes = [_fifo_attributes(message) for message in messages] if queue_url.endswith(".fifo") else None
+            for entries in self._batch_entries([self.serializer(message) for message in messages], attributes):
+                for attempt in range(max_attempts):
+                    response = self.aws.send_message_batch(QueueUrl=queue_url, Entries=entries)
+                    sent += len(response.get("Successful", []))
+                    failed_ids = {failure["Id"] for failure in response.get("Failed", [])}
+                    if not failed_ids:
+                        break
+                    entries = [entry for entry in entries if entry["Id"] in failed_ids]
+                    logger.warning(
+                        f"{len(entries)} mensagens recusadas pela fila {queue_url} "
+                        f"(tentativa {attempt + 1}/{max_attempts})"
+                    )
+                    if attempt + 1 < max_attempts:
+                        time.sleep(random.uniform(0, min(1.0, 0.05 * 2 ** attempt)))
+                else:
+                    raise RuntimeError(
+                        f"{len(entries)} mensagens não enviadas para a fila {queue_url} após {max_attempts} tentativas"
+                    )
+
+            logger.info(f"{sent} mensagens enviadas em lote para a fila {queue_url}")
+            return sent
+        except ClientError as e:
+            logger.error(f"Erro ao enviar mensagens em lote para a fila {queue_url}: {str(e)}")
+            raise
+
+    def _batch_entries(self, bodies: List[str], attributes: Optional[List[Dict]] = None) -> List[List[Dict]]:
+        batches: List[List[Dict]] = []
+        current: List[Dict] = []
+        current_size = 0
+        for position, body in enumerate(bodies):
+            size = len(body.encode("utf-8"))
+            if current and (len(current) == SEND_BATCH_MAX_ENTRIES or current_size + size > SEND_BATCH_MAX_BYTES):
+                batches.append(current)
+                current, current_size = [], 0
+            current.append({"Id": uuid.uuid4().hex, "MessageBody": body, **(attributes[position] if attributes else {})})
+            current_size += size
+        if current:
+            batches.append(current)
+        return batches
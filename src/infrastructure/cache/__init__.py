@@ -0,0 +1 @@
+# Caches em memória do processo (sobrevivem entre invocações "quentes" da Lambda)
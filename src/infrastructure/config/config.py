@@ -1,6 +1,6 @@
 import logging
 from pydantic_settings import BaseSettings
-from typing import Dict
+from typing import Dict, Optional
 from pydantic import Field
 
 logger = logging.getLogger(__name__)
@@ -8,11 +8,75 @@ logger = logging.getLogger(__name__)
 class Config(BaseSettings):
     REGION: str
     BUILDER_QUEUE_URL: str
+    # Fila do builder para envios interativos (poucos pedidos); sem ela, tudo vai para BUILDER_QUEUE_URL
+    BUILDER_PRIORITY_QUEUE_URL: Optional[str] = Field(default=None)
+    # Envios com até essa quantidade de pedidos vão para a fila prioritária, salvo flag explícita
+    BUILDER_PRIORITY_MAX_ORDERS: int = Field(default=30, ge=0)
     S3_BUCKET_NAME: str
     ENVIRONMENT: str = Field(default="dev")
     PROJECT_NAME: str = Field(default="certified-builder-api-py")
     URL_SERVICE_TECH: str
     PREFIX_API_VERSION: str = Field(default="/api/v1")
+    # Cache de leitura dos repositórios (mantido entre invocações "quentes" da Lambda)
+    CACHE_ENABLED: bool = Field(default=True)
+    CACHE_MAX_SIZE: int = Field(default=1024)
+    CACHE_PRODUCT_TTL_SECONDS: int = Field(default=3600)
+    CACHE_CERTIFICATE_TTL_SECONDS: int = Field(default=30)
+    CACHE_NEGATIVE_TTL_SECONDS: int = Field(default=5)
+    # URLs pré-assinadas são reaproveitadas até essa fração da validade ter passado
+    PRESIGNED_URL_REUSE_FRACTION: float = Field(default=0.5, ge=0, le=1)
+    PRESIGNED_URL_CACHE_MAX_SIZE: int = Field(default=2048)
+    # Quando habilitado, /certificate/download responde 302 para a URL do S3 em vez da página HTML
+    DOWNLOAD_REDIRECT_MODE: bool = Field(default=False)
+    # Compressão (br/gzip) das respostas conforme Accept-Encoding; só ligar com */* nos binary media types do stage
+    RESPONSE_COMPRESSION_ENABLED: bool = Field(default=False)
+    RESPONSE_COMPRESSION_MIN_SIZE: int = Field(default=1024)
+    # Serializador JSON das respostas e mensagens SQS: auto, orjson, pydantic ou stdlib
+    JSON_SERIALIZER: str = Field(default="auto")
+    # Máximo de chaves (order_ids + ids) aceitas por POST /certificate/fetch-batch
+    FETCH_BATCH_MAX_KEYS: int = Field(default=300)
+    # Exportação de certificados: tamanho das partes do multipart upload (mínimo do S3: 5 MiB),
+    # itens lidos por página do DynamoDB e validade do link de download
+    EXPORT_PART_SIZE_BYTES: int = Field(default=8 * 1024 * 1024, ge=5 * 1024 * 1024)
+    EXPORT_PAGE_SIZE: int = Field(default=500, ge=1)
+    EXPORT_URL_EXPIRES_IN: int = Field(default=3600)
+    # Máximo de certificados reenviados ao builder por execução de POST /certificate/requeue-failed
+    REQUEUE_MAX_CERTIFICATES: int = Field(default=2000, ge=1)
+    # Shards por GSI de baixa cardinalidade, pelo nome do índice original (JSON),
+    # ex.: {"certificates_by_product_idx": 8, "certificates_by_success_idx": 4}.
+    # Índices ausentes continuam sendo consultados sem sharding
+    GSI_SHARD_COUNTS: Dict[str, int] = Field(default_factory=dict)
+    # Consulta o participants_by_email_idx quando não há item de lookup do e-mail;
+    # pode ser desligado depois do backfill dos lookups (backfill_derived_keys --table participants)
+    PARTICIPANT_EMAIL_LOOKUP_FALLBACK: bool = Field(default=True)
+    # Conjunto de pedidos já certificados por produto (S3), usado por /certificate/create
+    # para pular esses pedidos sem ler os certificados
+    CERTIFIED_ORDERS_SKIP_ENABLED: bool = Field(default=True)
+    # Janela em que um pedido já enviado ao builder (build_requested_at) não é
+    # reenviado por /certificate/create enquanto não houver resultado (0: desliga)
+    BUILD_REQUEST_SKIP_SECONDS: int = Field(default=600, ge=0)
+    # Lease por produto em /certificate/create: validade (deve cobrir o timeout da Lambda)
+    # e quanto tempo uma chamada concorrente espera o resultado da execução em andamento
+    # antes de responder 409 (0: responde na hora)
+    SYNC_LEASE_TTL_SECONDS: int = Field(default=900, ge=1)
+    SYNC_LEASE_WAIT_SECONDS: float = Field(default=10, ge=0)
+    # Endpoint alternativo do DynamoDB (ex.: DynamoDB Local em http://localhost:8000)
+    DYNAMODB_ENDPOINT_URL: Optional[str] = Field(default=None)
+    # Controle de vazão adaptativo (AIMD) por tabela do DynamoDB, em itens por segundo:
+    # sem limite até o primeiro throttling; depois, piso, teto (volta a não limitar)
+    # e crescimento por segundo sem throttling. Ligado, os retries do botocore ficam
+    # desligados e as tentativas (throttling, 5xx e falhas de conexão) seguem o bucket da tabela
+    DYNAMODB_ADAPTIVE_THROTTLING_ENABLED: bool = Field(default=True)
+    DYNAMODB_RATE_MIN: float = Field(default=5, gt=0)
+    DYNAMODB_RATE_MAX: float = Field(default=5000, gt=0)
+    DYNAMODB_RATE_INCREASE: float = Field(default=20, ge=0)
+    DYNAMODB_THROTTLE_MAX_ATTEMPTS: int = Field(default=8, ge=1)
+    # Folga, antes do timeout da Lambda, a partir da qual não se fazem novas tentativas
+    RETRY_DEADLINE_MARGIN_SECONDS: float = Field(default=2.0, ge=0)
+    # Tempo mínimo que precisa sobrar, depois da espera, para fazer uma nova tentativa
+    RETRY_MIN_ATTEMPT_SECONDS: float = Field(default=1.0, ge=0)
+    # Namespace das métricas (CloudWatch EMF) publicadas pela aplicação
+    METRICS_NAMESPACE: str = Field(default="CertifiedBuilderApi")
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -42,6 +106,14 @@ class Config(BaseSettings):
             "products": {
                 "name": f"{base_name}-products-{environment}",
                 "arn": f"arn:aws:dynamodb:{self.REGION}:*:table/{base_name}-products-{environment}"
+            },
+            "product_stats": {
+                "name": f"{base_name}-product-stats-{environment}",
+                "arn": f"arn:aws:dynamodb:{self.REGION}:*:table/{base_name}-product-stats-{environment}"
+            },
+            "sync_leases": {
+                "name": f"{base_name}-sync-leases-{environment}",
+                "arn": f"arn:aws:dynamodb:{self.REGION}:*:table/{base_name}-sync-leases-{environment}"
             }
         }
     
@@ -50,7 +122,7 @@ class Config(BaseSettings):
         Retorna o nome da tabela para uma entidade específica.
         
         Args:
-            entity: Nome da entidade (certificates, orders, participants, products)
+            entity: Nome da entidade (certificates, orders, participants, products, product_stats, sync_leases)
             
         Returns:
             str: Nome da tabela no DynamoDB
@@ -66,7 +138,7 @@ class Config(BaseSettings):
         Retorna o ARN da tabela para uma entidade específica.
         
         Args:
-            entity: Nome da entidade (certificates, orders, participants, products)
+            entity: Nome da entidade (certificates, orders, participants, products, product_stats, sync_leases)
             
         Returns:
             str: ARN da tabela no DynamoDB
@@ -11,6 +11,11 @@ from src.infrastructure.repository.certificate_repository_impl import Certificat
 from src.infrastructure.repository.participant_repository_impl import ParticipantRepositoryImpl
 from src.infrastructure.repository.product_repository_impl import ProductRepositoryImpl
 from src.infrastructure.repository.order_repository_impl import OrderRepositoryImpl
+from src.infrastructure.repository.product_stats_repository_impl import ProductStatsRepositoryImpl
+from src.infrastructure.repository.certified_orders_repository_impl import CertifiedOrdersRepositoryImpl
+from src.infrastructure.repository.sync_lease_repository_impl import SyncLeaseRepositoryImpl
+from src.infrastructure.repository.cached_repository import CachedRepository
+from src.infrastructure.config.config import config
 
 
 class DependencyContainer:
@@ -46,11 +51,21 @@ class DependencyContainer:
         self._services['participant_repository'] = self._create_participant_repository
         self._services['product_repository'] = self._create_product_repository
         self._services['order_repository'] = self._create_order_repository
+        self._services['product_stats_repository'] = self._create_product_stats_repository
+        self._services['certified_orders_repository'] = self._create_certified_orders_repository
+        self._services['sync_lease_repository'] = self._create_sync_lease_repository
         # Registra serviços de aplicação
         self._services['send_for_build_certificate'] = self._create_send_for_build_certificate
         self._services['create_certificate'] = self._create_create_certificate
+        self._services['product_sync_guard'] = self._create_product_sync_guard
         self._services['fetch_certificate'] = self._create_fetch_certificate
         self._services['list_user_certificates'] = self._create_list_user_certificates
+        self._services['fetch_certificates_batch'] = self._create_fetch_certificates_batch
+        self._services['export_product_certificates'] = self._create_export_product_certificates
+        self._services['get_product_stats'] = self._create_get_product_stats
+        self._services['rebuild_product_stats'] = self._create_rebuild_product_stats
+        self._services['apply_build_results'] = self._create_apply_build_results
+        self._services['requeue_failed_certificates'] = self._create_requeue_failed_certificates
         self._services['fetch_order_tech_floripa'] = self._create_fetch_order_tech_floripa
         self._services['download_certificate'] = self._create_download_certificate
 
@@ -102,9 +117,18 @@ class DependencyContainer:
     
     # Métodos de criação de repositórios
     def _create_certificate_repository(self) -> CertificateRepositoryImpl:
-        """Cria uma instância do CertificateRepositoryImpl."""
+        """Cria uma instância do CertificateRepositoryImpl (com cache de leitura, se habilitado)."""
         dynamodb_service = self.get('dynamodb_service')
-        return CertificateRepositoryImpl(dynamodb_service, "certificates")
+        repository = CertificateRepositoryImpl(
+            dynamodb_service,
+            "certificates",
+            stats_repository=self.get('product_stats_repository'),
+        )
+        return self._with_cache(
+            repository,
+            entity_key=lambda certificate: certificate.id,
+            ttl=config.CACHE_CERTIFICATE_TTL_SECONDS,
+        )
     
     def _create_participant_repository(self) -> ParticipantRepositoryImpl:
         """Cria uma instância do ParticipantRepositoryImpl."""
@@ -112,15 +136,49 @@ class DependencyContainer:
         return ParticipantRepositoryImpl(dynamodb_service, "participants")
     
     def _create_product_repository(self) -> ProductRepositoryImpl:
-        """Cria uma instância do ProductRepositoryImpl."""
+        """Cria uma instância do ProductRepositoryImpl (com cache de leitura, se habilitado)."""
         dynamodb_service = self.get('dynamodb_service')
-        return ProductRepositoryImpl(dynamodb_service, "products")
+        repository = ProductRepositoryImpl(dynamodb_service, "products")
+        return self._with_cache(
+            repository,
+            entity_key=lambda product: product.product_id,
+            ttl=config.CACHE_PRODUCT_TTL_SECONDS,
+        )
     
     def _create_order_repository(self) -> OrderRepositoryImpl:
         """Cria uma instância do OrderRepositoryImpl."""
         dynamodb_service = self.get('dynamodb_service')
         return OrderRepositoryImpl(dynamodb_service, "orders")
     
+    def _create_product_stats_repository(self) -> ProductStatsRepositoryImpl:
+        """Cria uma instância do ProductStatsRepositoryImpl."""
+        dynamodb_service = self.get('dynamodb_service')
+        return ProductStatsRepositoryImpl(dynamodb_service, "product_stats")
+    
+    def _create_certified_orders_repository(self) -> CertifiedOrdersRepositoryImpl:
+        """Cria uma instância do CertifiedOrdersRepositoryImpl."""
+        return CertifiedOrdersRepositoryImpl(self.get('file_manager'))
+    
+    def _create_sync_lease_repository(self) -> SyncLeaseRepositoryImpl:
+        """Cria uma instância do SyncLeaseRepositoryImpl."""
+        dynamodb_service = self.get('dynamodb_service')
+        return SyncLeaseRepositoryImpl(dynamodb_service, "sync_leases")
+    
+    def _with_cache(self, repository, entity_key, ttl: int):
+        """
+        Envolve o repositório com o CachedRepository.
+        Como o container é global, o cache sobrevive entre invocações "quentes".
+        """
+        if not config.CACHE_ENABLED:
+            return repository
+        return CachedRepository(
+            repository,
+            entity_key=entity_key,
+            ttl=ttl,
+            negative_ttl=config.CACHE_NEGATIVE_TTL_SECONDS,
+            max_size=config.CACHE_MAX_SIZE,
+        )
+    
     def _create_send_for_build_certificate(self):
         """
         Cria uma instância do SendForBuildCertificate.
@@ -129,13 +187,22 @@ class DependencyContainer:
         from src.application.send_for_build_certificate import SendForBuildCertificate
         # Injeta o SQSService via construtor para evitar dependência circular
         sqs_service = self.get('sqs_service')
-        return SendForBuildCertificate(sqs_service)
+        return SendForBuildCertificate(sqs_service, self.get('certificate_repository'))
 
     def _create_create_certificate(self):
         """Cria uma instância do CreateCertificate."""
         from src.application.create_certificate import CreateCertificate
         return CreateCertificate()
 
+    def _create_product_sync_guard(self):
+        """Cria uma instância do ProductSyncGuard."""
+        from src.application.product_sync_guard import ProductSyncGuard
+        return ProductSyncGuard(
+            self.get('sync_lease_repository'),
+            ttl_seconds=config.SYNC_LEASE_TTL_SECONDS,
+            wait_seconds=config.SYNC_LEASE_WAIT_SECONDS,
+        )
+
     def _create_fetch_certificate(self):
         """Cria uma instância do FetchCertificate."""
         from src.application.fetch_certificate import FetchCertificate
@@ -147,6 +214,43 @@ class DependencyContainer:
         certificate_repository = self.get('certificate_repository')
         return ListUserCertificates(certificate_repository)
 
+    def _create_fetch_certificates_batch(self):
+        """Cria uma instância do FetchCertificatesBatch."""
+        from src.application.fetch_certificates_batch import FetchCertificatesBatch
+        certificate_repository = self.get('certificate_repository')
+        return FetchCertificatesBatch(certificate_repository)
+
+    def _create_export_product_certificates(self):
+        """Cria uma instância do ExportProductCertificates."""
+        from src.application.export_product_certificates import ExportProductCertificates
+        certificate_repository = self.get('certificate_repository')
+        file_manager = self.get('file_manager')
+        return ExportProductCertificates(certificate_repository, file_manager)
+
+    def _create_get_product_stats(self):
+        """Cria uma instância do GetProductStats."""
+        from src.application.get_product_stats import GetProductStats
+        return GetProductStats(self.get('product_stats_repository'))
+
+    def _create_rebuild_product_stats(self):
+        """Cria uma instância do RebuildProductStats."""
+        from src.application.rebuild_product_stats import RebuildProductStats
+        return RebuildProductStats(self.get('certificate_repository'), self.get('product_stats_repository'))
+
+    def _create_apply_build_results(self):
+        """Cria uma instância do ApplyBuildResults."""
+        from src.application.apply_build_results import ApplyBuildResults
+        return ApplyBuildResults(self.get('certificate_repository'))
+
+    def _create_requeue_failed_certificates(self):
+        """Cria uma instância do RequeueFailedCertificates."""
+        from src.application.requeue_failed_certificates import RequeueFailedCertificates
+        return RequeueFailedCertificates(
+            self.get('certificate_repository'),
+            self.get('order_repository'),
+            self.get('send_for_build_certificate'),
+        )
+
     def _create_download_certificate(self):
         """Cria uma instância do DownloadCertificate."""
         from src.application.download_certificate import DownloadCertificate
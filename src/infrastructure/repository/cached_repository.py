@@ -0,0 +1,92 @@
+import logging
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from src.infrastructure.cache.ttl_cache import MISSING, TTLCache
+
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+class CachedRepository:
+    """
+    Decorator de leitura (read-through) para repositórios.
+
+    Intercepta as buscas por identificador (get_by_id/find_by_id), guarda o
+    resultado num TTLCache e invalida as entradas em create/update/delete.
+    Buscas sem resultado também são armazenadas (cache negativo) com um TTL
+    próprio, normalmente menor. Qualquer outro método é delegado diretamente
+    ao repositório decorado.
+    """
+
+    CACHED_METHODS: Tuple[str, ...] = ("get_by_id", "find_by_id")
+
+    def __init__(
+        self,
+        repository: Any,
+        entity_key: Callable[[Any], Any],
+        ttl: float,
+        negative_ttl: float = 0,
+        max_size: int = 1024,
+        cache: Optional[TTLCache] = None,
+    ):
+        self.repository = repository
+        self.entity_key = entity_key
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.cache = cache if cache is not None else TTLCache(max_size=max_size, default_ttl=ttl)
+
+    def get_by_id(self, entity_id: Any, *args, **kwargs) -> Optional[Any]:
+        # Parâmetros extras (ex.: order_id em certificados) mudam o resultado, então não usam cache
+        if args or kwargs:
+            return self.repository.get_by_id(entity_id, *args, **kwargs)
+        return self._read_through("get_by_id", entity_id)
+
+    def find_by_id(self, entity_id: Any) -> Optional[Any]:
+        return self._read_through("find_by_id", entity_id)
+
+    def create(self, entity: Any) -> Any:
+        result = self.repository.create(entity)
+        self.invalidate(self.entity_key(entity))
+        return result
+
+    def update(self, entity_id: Any, entity: Any) -> Optional[Any]:
+        try:
+            return self.repository.update(entity_id, entity)
+        finally:
+            self.invalidate(entity_id)
+            self.invalidate(self.entity_key(entity))
+
+    def delete(self, entity_id: Any, *args, **kwargs) -> bool:
+        try:
+            return self.repository.delete(entity_id, *args, **kwargs)
+        finally:
+            self.invalidate(entity_id)
+
+    def invalidate(self, entity_id: Any) -> None:
+        """Remove do cache todas as buscas associadas ao identificador."""
+        for method in self.CACHED_METHODS:
+            self.cache.invalidate(self._cache_key(method, entity_id))
+
+    def cache_stats(self) -> Dict[str, int]:
+        return self.cache.stats()
+
+    def __getattr__(self, name: str) -> Any:
+        # Só é chamado para atributos que não existem no decorator
+        return getattr(self.repository, name)
+
+    def _read_through(self, method: str, entity_id: Any) -> Optional[Any]:
+        key = self._cache_key(method, entity_id)
+        cached = self.cache.get(key)
+        if cached is not MISSING:
+            return cached
+
+        result = getattr(self.repository, method)(entity_id)
+        if result is None:
+            self.cache.set(key, None, ttl=self.negative_ttl)
+        else:
+            self.cache.set(key, result, ttl=self.ttl)
+        return result
+
+    @staticmethod
+    def _cache_key(method: str, entity_id: Any) -> Hashable:
+        return method, str(entity_id)
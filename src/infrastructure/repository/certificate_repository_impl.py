@@ -1,10 +1,29 @@
 import logging
 import uuid
-from typing import List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from botocore.exceptions import ClientError
+from pydantic import TypeAdapter
 
 from src.domain.entity.certificate import Certificate
+from src.domain.entity.product_stats import certificate_status
 from src.domain.repository.certificate_repository import CertificateRepository
+from src.domain.repository.product_stats_repository import ProductStatsRepository
+from src.domain.response.build_result import (
+    BUILD_RESULT_FAILED,
+    BUILD_RESULT_MISSING,
+    BUILD_RESULT_UPDATED,
+    BuildResultResponse,
+)
 from src.infrastructure.aws.dynamodb_service import DynamoDBService
+from src.infrastructure.repository.sharding import (
+    ShardedIndex,
+    iterate_sharded_pages,
+    iterate_sharded_pages_with_keys,
+    query_sharded,
+)
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -27,15 +46,160 @@ def _success_flag(success: Optional[bool]) -> int:
     return 1 if success else 0
 
 
+# Certificados sem generated_date (ou com formato desconhecido) ficam no fim da ordenação decrescente
+GENERATED_AT_MISSING = "0000-00-00T00:00:00.000000"
+
+
+def _parse_timestamp(value: str) -> Optional[datetime]:
+    """Interpreta os formatos de data usados nos certificados, convertendo para UTC sem tzinfo."""
+    parsed = None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M:%S.%f"):
+            try:
+                parsed = datetime.strptime(value, fmt)
+                break
+            except ValueError:
+                continue
+
+    if parsed is not None and parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _generated_at(generated_date: Optional[str]) -> str:
+    """
+    Normaliza generated_date para uma chave ordenável (UTC, precisão fixa),
+    usada como sort key dos índices por email.
+    """
+    if not generated_date:
+        return GENERATED_AT_MISSING
+
+    parsed = _parse_timestamp(generated_date)
+    if parsed is None:
+        logger.warning(f"Formato de generated_date não suportado: {generated_date}")
+        return GENERATED_AT_MISSING
+    return parsed.strftime("%Y-%m-%dT%H:%M:%S.%f")
+
+
+def _updated_at(value: Optional[datetime] = None) -> str:
+    """
+    Formata um instante como sort key dos índices de alterações (UTC, precisão fixa).
+    Datas sem timezone são tratadas como UTC.
+    """
+    if value is None:
+        value = datetime.now(timezone.utc)
+    elif value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _email_success_key(email: Optional[str], success: Optional[bool]) -> Optional[str]:
+    normalized_email = _normalize_email(email)
+    if not normalized_email:
+        return None
+    return f"{normalized_email}#{_success_flag(success)}"
+
+
+# Validador pré-compilado (pydantic-core): converte a lista inteira numa única chamada
+_CERTIFICATES_ADAPTER = TypeAdapter(List[Certificate])
+
+
+def _to_certificates(items: List[dict], projection: Optional[List[str]] = None) -> List[Certificate]:
+    """
+    Converte os itens decodificados do DynamoDB em Certificates de uma vez,
+    sem montar e validar um modelo por item em Python.
+    Com `projection`, os itens são parciais e viram Certificates incompletos.
+    """
+    if projection:
+        return [_to_partial_certificate(item) for item in items]
+    return _CERTIFICATES_ADAPTER.validate_python(items)
+
+
+_INT_ATTRIBUTES = ("order_id", "product_id")
+
+# Índices com write sharding; o shard de cada certificado vem do order_id
+CERTIFICATES_BY_PRODUCT = ShardedIndex(
+    "certificates_by_product_idx", "product_id",
+    "certificates_by_product_shard_idx", "product_shard_key", sort_attribute="generated_at",
+)
+# Mesma chave (product_shard_key) do índice por produto, então a mesma quantidade de shards
+CERTIFICATES_BY_PRODUCT_UPDATED = ShardedIndex(
+    "certificates_by_product_updated_idx", "product_id",
+    "certificates_by_product_updated_shard_idx", "product_shard_key", sort_attribute="updated_at",
+    shard_count_index=CERTIFICATES_BY_PRODUCT.legacy_index,
+)
+CERTIFICATES_BY_SUCCESS = ShardedIndex(
+    "certificates_by_success_idx", "success_flag",
+    "certificates_by_success_shard_idx", "success_shard_key", sort_attribute="generated_at",
+)
+
+
+def _stats_deltas(old: Optional[dict], new: Optional[dict]) -> Dict[int, Dict[str, int]]:
+    """
+    Variação dos contadores por produto entre a versão anterior e a nova de um certificado.
+    Sem versão anterior é uma criação; sem versão nova, uma remoção.
+    """
+    deltas: Dict[int, Dict[str, int]] = {}
+    for item, sign in ((old, -1), (new, 1)):
+        if not item or item.get("product_id") is None:
+            continue
+        product_deltas = deltas.setdefault(int(item["product_id"]), {})
+        status = certificate_status(item.get("success"), item.get("generated_date"))
+        for counter in ("total", status):
+            product_deltas[counter] = product_deltas.get(counter, 0) + sign
+    return deltas
+
+
+def _to_partial_certificate(item: dict) -> Certificate:
+    """
+    Monta um Certificate a partir de um item projetado (ProjectionExpression).
+    Atributos não lidos ficam None; só os tipos que o DynamoDB devolve
+    diferente (números como float, UUID como texto) são ajustados.
+    """
+    values = {name: item.get(name) for name in Certificate.model_fields}
+    for name in _INT_ATTRIBUTES:
+        if values[name] is not None:
+            values[name] = int(values[name])
+    if values["id"] is not None:
+        values["id"] = uuid.UUID(values["id"])
+    return Certificate.model_construct(**values)
+
+
+# Consultas simultâneas ao certificate_id_idx em find_by_ids
+FIND_BY_IDS_MAX_WORKERS = 8
+
+# Gravações paralelas em apply_build_results; acompanha o pool padrão de conexões do botocore (10)
+BULK_UPDATE_MAX_WORKERS = 10
+
+# Atributos lidos antes de aplicar um resultado do builder
+_BUILD_RESULT_PROJECTION = ["product_id", "participant_email", "success", "generated_date", "updated_at"]
+
+
 class CertificateRepositoryImpl(CertificateRepository):
-    def __init__(self, dynamodb_service: DynamoDBService, table_name: str = "certificates"):
+    def __init__(
+        self,
+        dynamodb_service: DynamoDBService,
+        table_name: str = "certificates",
+        stats_repository: Optional[ProductStatsRepository] = None,
+    ):
         self.dynamodb_service = dynamodb_service
         self.table_name = table_name
+        # Quando informado, os contadores por produto acompanham create/update/delete
+        self.stats_repository = stats_repository
 
     def create(self, entity: Certificate) -> Certificate:
         try:
+            entity.updated_at = _updated_at()
             item = self._prepare_item(entity)
-            self.dynamodb_service.put_item(item, self.table_name)
+            response = self.dynamodb_service.put_item(item, self.table_name, return_values="ALL_OLD")
+
+            # Um put sobre um order_id existente substitui o item: desconta a versão anterior
+            old_item = None
+            if response and "Attributes" in response:
+                old_item = self.dynamodb_service._convert_from_dynamodb_format(response["Attributes"])
+            self._update_stats(old_item, item)
 
             logger.info(f"Certificado criado com sucesso: {entity.id}")
             return entity
@@ -62,7 +226,7 @@ class CertificateRepositoryImpl(CertificateRepository):
     def get_all(self) -> List[Certificate]:
         try:
             items = self.dynamodb_service.scan_table(self.table_name)
-            return [Certificate(**item) for item in items]
+            return _to_certificates(items)
 
         except Exception as e:
             logger.error(f"Erro ao buscar todos os certificados: {str(e)}")
@@ -74,6 +238,7 @@ class CertificateRepositoryImpl(CertificateRepository):
             if not existing_certificate:
                 return None
 
+            entity.updated_at = _updated_at()
             update_data = self._prepare_item(entity)
             update_data.pop("id", None)
             update_data.pop("order_id", None)
@@ -90,18 +255,31 @@ class CertificateRepositoryImpl(CertificateRepository):
 
             update_expression = update_expression.rstrip(", ")
 
-            response = self.dynamodb_service.update_item(
-                {"order_id": existing_certificate.order_id},
-                update_expression,
-                expression_values,
-                self.table_name,
-                expression_attribute_names=expression_names,
-            )
-
-            if "Attributes" in response:
-                result_dict = self.dynamodb_service._convert_from_dynamodb_format(response["Attributes"])
-                return Certificate(**result_dict)
-            return None
+            # O índice por id só serve para achar o order_id: a versão anterior vem do
+            # próprio update (ALL_OLD), lida de forma consistente, e o item ainda
+            # precisa ser o mesmo certificado
+            expression_values[":expected_id"] = str(entity_id)
+            expression_names["#id"] = "id"
+            try:
+                response = self.dynamodb_service.update_item(
+                    {"order_id": existing_certificate.order_id},
+                    update_expression,
+                    expression_values,
+                    self.table_name,
+                    expression_attribute_names=expression_names,
+                    condition_expression="attribute_exists(order_id) AND #id = :expected_id",
+                    return_values="ALL_OLD",
+                )
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+                    logger.warning(f"Certificado {entity_id} removido ou substituído antes da atualização")
+                    return None
+                raise
+
+            old_item = self.dynamodb_service._convert_from_dynamodb_format(response.get("Attributes") or {})
+            new_item = {**old_item, **{key: value for key, value in update_data.items() if value is not None}}
+            self._update_stats(old_item, new_item)
+            return Certificate(**new_item)
 
         except Exception as e:
             logger.error(f"Erro ao atualizar certificado {entity_id}: {str(e)}")
@@ -114,6 +292,7 @@ class CertificateRepositoryImpl(CertificateRepository):
                 return False
 
             self.dynamodb_service.delete_item({"order_id": certificate.order_id}, self.table_name)
+            self._update_stats(certificate.model_dump(), None)
             logger.info(f"Certificado {entity_id} removido com sucesso")
             return True
 
@@ -131,33 +310,89 @@ class CertificateRepositoryImpl(CertificateRepository):
 
     def find_by_id(self, entity_id: Union[str, uuid.UUID]) -> Optional[Certificate]:
         try:
-            normalized_id = str(entity_id)
-            items = self.dynamodb_service.query_table(
-                self.table_name,
-                "id = :id",
-                {":id": normalized_id},
-                index_name="certificate_id_idx",
-            )
-            if items:
-                return Certificate(**items[0])
-            return None
+            return self._query_by_id(entity_id)
 
         except Exception as e:
             logger.error(f"Erro ao buscar certificado por UUID {entity_id}: {str(e)}")
             raise
 
-    def get_by_order_id(self, order_id: int) -> List[Certificate]:
+    def _query_by_id(self, entity_id: Union[str, uuid.UUID], projection: Optional[List[str]] = None) -> Optional[Certificate]:
+        items = self.dynamodb_service.query_table(
+            self.table_name,
+            "id = :id",
+            {":id": str(entity_id)},
+            index_name="certificate_id_idx",
+            projection=projection,
+        )
+        if items:
+            return _to_certificates(items[:1], projection)[0]
+        return None
+
+    def get_by_order_id(self, order_id: int, projection: Optional[List[str]] = None) -> List[Certificate]:
         try:
-            item = self.dynamodb_service.get_item({"order_id": order_id}, self.table_name)
+            item = self.dynamodb_service.get_item({"order_id": order_id}, self.table_name, projection=projection)
             if not item:
                 return []
-            return [Certificate(**item)]
+            return _to_certificates([item], projection)
 
         except Exception as e:
             logger.error(f"Erro ao buscar certificados por order_id {order_id}: {str(e)}")
             raise
 
-    def get_by_participant_email(self, email: str) -> List[Certificate]:
+    def get_by_order_ids(
+        self,
+        order_ids: Iterable[int],
+        projection: Optional[List[str]] = None,
+    ) -> Dict[int, Certificate]:
+        """
+        Busca vários certificados pela chave primária (order_id) com BatchGetItem.
+        Order_ids sem certificado ficam fora do dicionário.
+        """
+        try:
+            unique_order_ids = list(dict.fromkeys(order_ids))
+            if not unique_order_ids:
+                return {}
+            if projection:
+                # order_id é necessário para montar o dicionário de retorno
+                projection = ["order_id", *projection]
+            items = self.dynamodb_service.batch_get_items(
+                [{"order_id": order_id} for order_id in unique_order_ids],
+                self.table_name,
+                projection=projection,
+            )
+            return {certificate.order_id: certificate for certificate in _to_certificates(items, projection)}
+
+        except Exception as e:
+            logger.error(f"Erro ao buscar certificados em lote por order_id: {str(e)}")
+            raise
+
+    def find_by_ids(
+        self,
+        entity_ids: Iterable[Union[str, uuid.UUID]],
+        projection: Optional[List[str]] = None,
+    ) -> Dict[str, Certificate]:
+        """
+        Busca vários certificados pelo UUID.
+        O id só existe no GSI certificate_id_idx, que não aceita BatchGetItem,
+        então as consultas são feitas em paralelo.
+        """
+        try:
+            unique_ids = list(dict.fromkeys(str(entity_id) for entity_id in entity_ids))
+            if not unique_ids:
+                return {}
+            with ThreadPoolExecutor(max_workers=min(FIND_BY_IDS_MAX_WORKERS, len(unique_ids))) as executor:
+                certificates = executor.map(lambda entity_id: self._query_by_id(entity_id, projection), unique_ids)
+            return {
+                entity_id: certificate
+                for entity_id, certificate in zip(unique_ids, certificates)
+                if certificate is not None
+            }
+
+        except Exception as e:
+            logger.error(f"Erro ao buscar certificados em lote por UUID: {str(e)}")
+            raise
+
+    def get_by_participant_email(self, email: str, projection: Optional[List[str]] = None) -> List[Certificate]:
         try:
             items = self.dynamodb_service.query_table(
                 self.table_name,
@@ -165,14 +400,110 @@ class CertificateRepositoryImpl(CertificateRepository):
                 {":email": _normalize_email(email)},
                 index_name="certificates_by_email_idx",
                 scan_index_forward=False,
+                projection=projection,
             )
-            return [Certificate(**item) for item in items]
+            return _to_certificates(items, projection)
 
         except Exception as e:
             logger.error(f"Erro ao buscar certificados por email {email}: {str(e)}")
             raise
 
-    def get_by_email_and_product_id(self, email: str, product_id: int) -> List[Certificate]:
+    def list_by_participant_email(self, email: str, success: Optional[bool] = None) -> List[Certificate]:
+        """
+        Lista os certificados do email já ordenados por generated_at decrescente.
+        Com `success` informado, usa o índice composto email#success_flag,
+        então o filtro também é resolvido pelo DynamoDB.
+        """
+        try:
+            if success is None:
+                items = self.dynamodb_service.query_table(
+                    self.table_name,
+                    "participant_email = :email",
+                    {":email": _normalize_email(email)},
+                    index_name="certificates_by_email_generated_idx",
+                    scan_index_forward=False,
+                )
+            else:
+                items = self.dynamodb_service.query_table(
+                    self.table_name,
+                    "participant_email_success_key = :email_success_key",
+                    {":email_success_key": _email_success_key(email, success)},
+                    index_name="certificates_by_email_success_idx",
+                    scan_index_forward=False,
+                )
+            return _to_certificates(items)
+
+        except Exception as e:
+            logger.error(f"Erro ao listar certificados por email {email} e success {success}: {str(e)}")
+            raise
+
+    def get_by_participant_email_changed_since(
+        self,
+        email: str,
+        since: datetime,
+        success: Optional[bool] = None,
+        projection: Optional[List[str]] = None,
+    ) -> List[Certificate]:
+        """
+        Certificados do email criados ou alterados depois de `since`,
+        em ordem crescente de updated_at.
+        """
+        try:
+            expression_values = {
+                ":email": _normalize_email(email),
+                ":since": _updated_at(since),
+            }
+            filter_expression = None
+            if success is not None:
+                filter_expression = "success_flag = :success_flag"
+                expression_values[":success_flag"] = _success_flag(success)
+
+            items = self.dynamodb_service.query_table(
+                self.table_name,
+                "participant_email = :email AND updated_at > :since",
+                expression_values,
+                index_name="certificates_by_email_updated_idx",
+                filter_expression=filter_expression,
+                projection=projection,
+            )
+            return _to_certificates(items, projection)
+
+        except Exception as e:
+            logger.error(f"Erro ao buscar alterações de certificados por email {email} desde {since}: {str(e)}")
+            raise
+
+    def get_by_product_id_changed_since(
+        self,
+        product_id: int,
+        since: datetime,
+        projection: Optional[List[str]] = None,
+    ) -> List[Certificate]:
+        """
+        Certificados do produto criados ou alterados depois de `since`,
+        em ordem crescente de updated_at.
+        """
+        try:
+            items = query_sharded(
+                self.dynamodb_service,
+                self.table_name,
+                CERTIFICATES_BY_PRODUCT_UPDATED,
+                product_id,
+                expression_values={":since": _updated_at(since)},
+                projection=projection,
+                range_condition="updated_at > :since",
+            )
+            return _to_certificates(items, projection)
+
+        except Exception as e:
+            logger.error(f"Erro ao buscar alterações de certificados por product_id {product_id} desde {since}: {str(e)}")
+            raise
+
+    def get_by_email_and_product_id(
+        self,
+        email: str,
+        product_id: int,
+        projection: Optional[List[str]] = None,
+    ) -> List[Certificate]:
         try:
             items = self.dynamodb_service.query_table(
                 self.table_name,
@@ -180,8 +511,9 @@ class CertificateRepositoryImpl(CertificateRepository):
                 {":email_product_key": _email_product_key(email, product_id)},
                 index_name="certificates_by_email_product_idx",
                 scan_index_forward=False,
+                projection=projection,
             )
-            certificates = [Certificate(**item) for item in items]
+            certificates = _to_certificates(items, projection)
             logger.info(
                 "Encontrados %s certificados para email %s e product_id %s",
                 len(certificates),
@@ -194,36 +526,266 @@ class CertificateRepositoryImpl(CertificateRepository):
             logger.error(f"Erro ao buscar certificados por email {email} e product_id {product_id}: {str(e)}")
             raise
 
-    def get_by_product_id(self, product_id: int) -> List[Certificate]:
+    def get_by_product_id(self, product_id: int, projection: Optional[List[str]] = None) -> List[Certificate]:
         try:
-            items = self.dynamodb_service.query_table(
+            items = query_sharded(
+                self.dynamodb_service,
                 self.table_name,
-                "product_id = :product_id",
-                {":product_id": product_id},
-                index_name="certificates_by_product_idx",
+                CERTIFICATES_BY_PRODUCT,
+                product_id,
                 scan_index_forward=False,
+                projection=projection,
             )
-            return [Certificate(**item) for item in items]
+            return _to_certificates(items, projection)
 
         except Exception as e:
             logger.error(f"Erro ao buscar certificados por product_id {product_id}: {str(e)}")
             raise
 
+    def iter_by_product_id(
+        self,
+        product_id: int,
+        projection: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+    ) -> Iterator[List[Certificate]]:
+        """
+        Certificados do produto, uma página do DynamoDB por vez.
+        Cada página é convertida de uma vez e descartada antes da leitura da próxima.
+        """
+        try:
+            pages = iterate_sharded_pages(
+                self.dynamodb_service,
+                self.table_name,
+                CERTIFICATES_BY_PRODUCT,
+                product_id,
+                scan_index_forward=False,
+                projection=projection,
+                page_size=page_size,
+            )
+            for items in pages:
+                yield _to_certificates(items, projection)
+
+        except Exception as e:
+            logger.error(f"Erro ao percorrer certificados por product_id {product_id}: {str(e)}")
+            raise
+
+    def iter_unsuccessful(
+        self,
+        product_id: Optional[int] = None,
+        page_size: Optional[int] = None,
+        start_after: Optional[Dict] = None,
+    ) -> Iterator[Tuple[List[Certificate], Dict]]:
+        """
+        Certificados com success_flag = 0 (falhos ou ainda pendentes), uma página por vez,
+        cada uma com a posição de leitura logo depois dela ({} na última).
+        Sem produto, usa o índice por success_flag; com produto, a partição do
+        produto no índice por produto filtrada por success_flag.
+        Com `start_after` (uma posição devolvida antes), continua dali.
+        """
+        try:
+            if product_id is None:
+                pages = iterate_sharded_pages_with_keys(
+                    self.dynamodb_service,
+                    self.table_name,
+                    CERTIFICATES_BY_SUCCESS,
+                    0,
+                    page_size=page_size,
+                    start_keys=start_after,
+                )
+            else:
+                pages = iterate_sharded_pages_with_keys(
+                    self.dynamodb_service,
+                    self.table_name,
+                    CERTIFICATES_BY_PRODUCT,
+                    product_id,
+                    filter_expression="success_flag = :success_flag",
+                    expression_values={":success_flag": 0},
+                    page_size=page_size,
+                    start_keys=start_after,
+                )
+            for items, position in pages:
+                yield _to_certificates(items), position
+
+        except Exception as e:
+            logger.error(f"Erro ao percorrer certificados sem sucesso (product_id={product_id}): {str(e)}")
+            raise
+
+    def iter_scan_segment(
+        self,
+        segment: int,
+        total_segments: int,
+        projection: Optional[List[str]] = None,
+    ) -> Iterator[List[Certificate]]:
+        """Percorre um segmento de um scan paralelo da tabela, uma página por vez."""
+        try:
+            pages = self.dynamodb_service.iterate_scan_pages(
+                self.table_name,
+                segment=segment,
+                total_segments=total_segments,
+                projection=projection,
+            )
+            for items in pages:
+                yield _to_certificates(items, projection)
+
+        except Exception as e:
+            logger.error(f"Erro ao escanear certificados (segmento {segment}/{total_segments}): {str(e)}")
+            raise
+
     def get_successful_certificates(self) -> List[Certificate]:
         try:
-            items = self.dynamodb_service.query_table(
+            items = query_sharded(
+                self.dynamodb_service,
                 self.table_name,
-                "success_flag = :success_flag",
-                {":success_flag": 1},
-                index_name="certificates_by_success_idx",
+                CERTIFICATES_BY_SUCCESS,
+                1,
                 scan_index_forward=False,
             )
-            return [Certificate(**item) for item in items]
+            return _to_certificates(items)
 
         except Exception as e:
             logger.error(f"Erro ao buscar certificados bem-sucedidos: {str(e)}")
             raise
 
+    def apply_build_results(self, results: Iterable[BuildResultResponse]) -> Dict[int, str]:
+        """
+        Aplica em lote os resultados publicados pelo builder.
+
+        Os certificados são lidos com BatchGetItem e gravados com update_item
+        condicional em paralelo. A condição sobre updated_at impede sobrescrever
+        uma gravação feita entre a leitura e a escrita; esses casos voltam como
+        falha para nova tentativa. Para o mesmo order_id vale o último resultado.
+        Os contadores por produto são somados e aplicados uma vez por produto.
+
+        Returns:
+            order_id -> BUILD_RESULT_UPDATED, BUILD_RESULT_MISSING ou BUILD_RESULT_FAILED
+        """
+        latest = {result.order_id: result for result in results}
+        if not latest:
+            return {}
+
+        existing = self.get_by_order_ids(latest, projection=_BUILD_RESULT_PROJECTION)
+        outcome = {order_id: BUILD_RESULT_MISSING for order_id in latest if order_id not in existing}
+        pending = [result for order_id, result in latest.items() if order_id in existing]
+
+        def apply(result: BuildResultResponse) -> Optional[dict]:
+            try:
+                return self._apply_build_result(existing[result.order_id], result)
+            except Exception as e:
+                logger.warning(f"Resultado do builder não aplicado ao pedido {result.order_id}: {str(e)}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=BULK_UPDATE_MAX_WORKERS) as executor:
+            new_items = list(executor.map(apply, pending))
+
+        stats_deltas: Dict[int, Dict[str, int]] = {}
+        for result, new_item in zip(pending, new_items):
+            if new_item is None:
+                outcome[result.order_id] = BUILD_RESULT_FAILED
+                continue
+            outcome[result.order_id] = BUILD_RESULT_UPDATED
+            certificate = existing[result.order_id]
+            old_item = {
+                "product_id": certificate.product_id,
+                "success": certificate.success,
+                "generated_date": certificate.generated_date,
+            }
+            for product_id, deltas in _stats_deltas(old_item, new_item).items():
+                merged = stats_deltas.setdefault(product_id, {})
+                for counter, delta in deltas.items():
+                    merged[counter] = merged.get(counter, 0) + delta
+        self._increment_stats(stats_deltas)
+
+        logger.info(
+            f"Resultados do builder aplicados: {len(outcome)} pedidos, "
+            f"{sum(1 for status in outcome.values() if status == BUILD_RESULT_FAILED)} falhas, "
+            f"{sum(1 for status in outcome.values() if status == BUILD_RESULT_MISSING)} sem certificado"
+        )
+        return outcome
+
+    def mark_build_requested(self, order_ids: Iterable[int], requested_at: datetime) -> None:
+        """
+        Grava build_requested_at nos certificados, em paralelo. Só esse atributo
+        muda (updated_at fica como está, para não invalidar a condição de
+        apply_build_results); pedidos sem certificado são ignorados.
+        """
+        value = _updated_at(requested_at)
+
+        def mark(order_id: int) -> bool:
+            try:
+                self.dynamodb_service.update_item(
+                    {"order_id": order_id},
+                    "SET #build_requested_at = :build_requested_at",
+                    {":build_requested_at": value},
+                    self.table_name,
+                    expression_attribute_names={"#build_requested_at": "build_requested_at"},
+                    condition_expression="attribute_exists(order_id)",
+                )
+                return True
+            except Exception as e:
+                logger.warning(f"build_requested_at não gravado no pedido {order_id}: {str(e)}")
+                return False
+
+        unique_order_ids = list(dict.fromkeys(order_ids))
+        if not unique_order_ids:
+            return
+        with ThreadPoolExecutor(max_workers=BULK_UPDATE_MAX_WORKERS) as executor:
+            marked = sum(executor.map(mark, unique_order_ids))
+        logger.info(f"build_requested_at gravado em {marked} de {len(unique_order_ids)} certificados")
+
+    def _apply_build_result(self, certificate: Certificate, result: BuildResultResponse) -> dict:
+        values = {
+            "success": result.success,
+            "success_flag": _success_flag(result.success),
+            "success_shard_key": CERTIFICATES_BY_SUCCESS.key(_success_flag(result.success), certificate.order_id),
+            "certificate_key": result.certificate_key,
+            "certificate_url": result.certificate_url,
+            "generated_date": result.generated_date,
+            "generated_at": _generated_at(result.generated_date),
+            "participant_email_success_key": _email_success_key(certificate.participant_email, result.success),
+            "updated_at": _updated_at(),
+        }
+        # Atributos de índice não aceitam NULL, então valores ausentes não são gravados
+        values = {name: value for name, value in values.items() if value is not None}
+
+        expression_names = {f"#{name}": name for name in values}
+        # Com o resultado em mãos, a marca de envio deixa de valer (uma falha pode ser reenviada na hora)
+        expression_names["#build_requested_at"] = "build_requested_at"
+        expression_values = {f":{name}": value for name, value in values.items()}
+        if certificate.updated_at:
+            condition = "attribute_exists(order_id) AND #updated_at = :expected_updated_at"
+            expression_values[":expected_updated_at"] = certificate.updated_at
+        else:
+            condition = "attribute_exists(order_id) AND attribute_not_exists(#updated_at)"
+
+        response = self.dynamodb_service.update_item(
+            {"order_id": certificate.order_id},
+            "SET " + ", ".join(f"#{name} = :{name}" for name in values) + " REMOVE #build_requested_at",
+            expression_values,
+            self.table_name,
+            expression_attribute_names=expression_names,
+            condition_expression=condition,
+        )
+        return self.dynamodb_service._convert_from_dynamodb_format(response["Attributes"])
+
+    def _update_stats(self, old: Optional[dict], new: Optional[dict]) -> None:
+        """
+        Aplica nos contadores por produto a mudança de situação do certificado.
+        Uma falha aqui não desfaz a gravação do certificado; o rebuild corrige a divergência.
+        """
+        self._increment_stats(_stats_deltas(old, new))
+
+    def _increment_stats(self, stats_deltas: Dict[int, Dict[str, int]]) -> None:
+        if self.stats_repository is None:
+            return
+        for product_id, deltas in stats_deltas.items():
+            try:
+                self.stats_repository.increment(product_id, deltas)
+            except Exception as e:
+                logger.error(
+                    f"Contadores do produto {product_id} não atualizados ({deltas}): {str(e)}. "
+                    f"Execute src.main.command.rebuild_product_stats para reconciliar."
+                )
+
     def _prepare_item(self, entity: Certificate) -> dict:
         item = entity.model_dump()
         item["id"] = str(entity.id)
@@ -233,4 +795,11 @@ class CertificateRepositoryImpl(CertificateRepository):
             item.get("product_id"),
         )
         item["success_flag"] = _success_flag(item.get("success"))
+        item["participant_email_success_key"] = _email_success_key(
+            item.get("participant_email"),
+            item.get("success"),
+        )
+        item["generated_at"] = _generated_at(item.get("generated_date"))
+        item["product_shard_key"] = CERTIFICATES_BY_PRODUCT.key(item.get("product_id"), item.get("order_id"))
+        item["success_shard_key"] = CERTIFICATES_BY_SUCCESS.key(item["success_flag"], item.get("order_id"))
         return item
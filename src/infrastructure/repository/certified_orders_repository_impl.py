@@ -0,0 +1,99 @@
+import logging
+import sys
+import zlib
+from array import array
+from typing import Iterable, Set
+
+from botocore.exceptions import ClientError
+
+from src.domain.repository.certified_orders_repository import CertifiedOrdersRepository
+from src.infrastructure.aws.file_manager import FileManager
+
+logger = logging.getLogger(__name__)
+
+# Tentativas de gravação quando outro processo altera o objeto ao mesmo tempo
+CERTIFIED_ORDERS_MAX_ATTEMPTS = 5
+
+_CONFLICT_ERROR_CODES = ("PreconditionFailed", "ConditionalRequestConflict")
+
+
+def _encode(order_ids: Iterable[int]) -> bytes:
+    """
+    Serializa os order_ids ordenados como diferenças entre vizinhos (uint64
+    little-endian) comprimidas com zlib. Como os ids de um produto são próximos,
+    as diferenças são pequenas e o objeto fica com poucos bytes por pedido.
+    """
+    previous = 0
+    deltas = array("Q")
+    for order_id in sorted(set(order_ids)):
+        deltas.append(order_id - previous)
+        previous = order_id
+    if sys.byteorder != "little":
+        deltas.byteswap()
+    return zlib.compress(deltas.tobytes())
+
+
+def _decode(data: bytes) -> Set[int]:
+    deltas = array("Q")
+    deltas.frombytes(zlib.decompress(data))
+    if sys.byteorder != "little":
+        deltas.byteswap()
+    order_ids = set()
+    current = 0
+    for delta in deltas:
+        current += delta
+        order_ids.add(current)
+    return order_ids
+
+
+class CertifiedOrdersRepositoryImpl(CertifiedOrdersRepository):
+    """
+    Um objeto no S3 por produto (certified-orders/products/<product_id>.bin).
+    As gravações são condicionais ao ETag lido, então acréscimos concorrentes
+    são mesclados em vez de sobrescritos.
+    """
+
+    def __init__(self, file_manager: FileManager, prefix: str = "certified-orders/products"):
+        self.file_manager = file_manager
+        self.prefix = prefix
+
+    def get(self, product_id: int) -> Set[int]:
+        try:
+            stored = self.file_manager.read_object(self._key(product_id))
+            if stored is None:
+                return set()
+            return _decode(stored[0])
+
+        except Exception as e:
+            logger.error(f"Erro ao buscar pedidos certificados do produto {product_id}: {str(e)}")
+            raise
+
+    def add(self, product_id: int, order_ids: Iterable[int]) -> None:
+        order_ids = set(order_ids)
+        if not order_ids:
+            return
+        key = self._key(product_id)
+        try:
+            for attempt in range(1, CERTIFIED_ORDERS_MAX_ATTEMPTS + 1):
+                stored = self.file_manager.read_object(key)
+                current, etag = (_decode(stored[0]), stored[1]) if stored else (set(), None)
+                if order_ids <= current:
+                    return
+                try:
+                    self.file_manager.write_object(key, _encode(current | order_ids), if_match=etag)
+                    logger.info(f"{len(order_ids - current)} pedidos certificados acrescentados ao produto {product_id}")
+                    return
+                except ClientError as e:
+                    if e.response.get("Error", {}).get("Code") not in _CONFLICT_ERROR_CODES:
+                        raise
+                    logger.info(f"Conflito ao gravar pedidos certificados do produto {product_id} (tentativa {attempt})")
+            raise RuntimeError(
+                f"Pedidos certificados do produto {product_id} não gravados após {CERTIFIED_ORDERS_MAX_ATTEMPTS} tentativas"
+            )
+
+        except Exception as e:
+            logger.error(f"Erro ao gravar pedidos certificados do produto {product_id}: {str(e)}")
+            raise
+
+    def _key(self, product_id: int) -> str:
+        return f"{self.prefix}/{product_id}.bin"
@@ -0,0 +1,327 @@
+"""
+Preenchimento dos atributos derivados (chaves dos GSIs) em itens gravados antes
+de eles existirem.
+
+Cada tabela é lida com scan paralelo; os atributos derivados são recalculados
+com o `_prepare_item` do próprio repositório e só os itens que mudaram são
+regravados, com BatchWriteItem. Na tabela de participantes, são criados os
+itens de lookup por e-mail que faltam. O progresso de cada segmento fica num arquivo
+de checkpoint, então uma execução interrompida continua de onde parou.
+
+O BatchWriteItem substitui o item inteiro: uma alteração feita entre a leitura
+e a gravação de um item é perdida. Rode fora dos horários de emissão.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel, ValidationError
+
+from src.domain.entity.certificate import Certificate
+from src.domain.entity.order import Order
+from src.domain.entity.participant import Participant
+from src.domain.entity.product import Product
+from src.infrastructure.aws.dynamodb_service import DynamoDBService
+from src.infrastructure.repository.certificate_repository_impl import CertificateRepositoryImpl
+from src.infrastructure.repository.order_repository_impl import OrderRepositoryImpl
+from src.infrastructure.repository.participant_repository_impl import _email_lookup_item, _is_email_lookup
+from src.infrastructure.repository.product_repository_impl import ProductRepositoryImpl
+
+logger = logging.getLogger(__name__)
+
+# Segmentos do scan paralelo (uma thread por segmento)
+BACKFILL_TOTAL_SEGMENTS = 4
+
+# Itens lidos por chamada do scan
+BACKFILL_PAGE_SIZE = 100
+
+
+def _restore_integers(item: Dict) -> Dict:
+    """
+    O DynamoDBService lê todo número como float; para regravar o item, números
+    inteiros voltam a int (o DynamoDB não distingue 1 de 1.0, mas as chaves
+    ficam iguais às gravadas pelos repositórios).
+    """
+    return {
+        attribute: int(value) if isinstance(value, float) and value.is_integer() else value
+        for attribute, value in item.items()
+    }
+
+
+class DerivedKeysTarget:
+    """
+    Tabela a preencher: como montar a entidade a partir do item lido e quais
+    atributos do `_prepare_item` são derivados.
+    """
+
+    def __init__(
+        self,
+        table_name: str,
+        entity_type: Type[BaseModel],
+        prepare_item: Callable[[BaseModel], dict],
+        attributes: Tuple[str, ...],
+    ):
+        self.table_name = table_name
+        self.entity_type = entity_type
+        self.prepare_item = prepare_item
+        self.attributes = attributes
+
+    def changes(self, item: Dict) -> Dict[str, Any]:
+        """
+        Atributos derivados que faltam ou estão desatualizados no item.
+        Valores derivados None (ex.: sem e-mail) não são gravados.
+        """
+        prepared = self.prepare_item(self.entity_type.model_validate(item))
+        return {
+            attribute: prepared[attribute]
+            for attribute in self.attributes
+            if prepared.get(attribute) is not None and item.get(attribute) != prepared[attribute]
+        }
+
+    def items_to_write(self, items: List[Dict]) -> Tuple[List[Dict], int]:
+        """
+        Itens da página que precisam ser regravados, já com os atributos derivados,
+        e a quantidade de itens inválidos (que não viram entidade e ficam como estão).
+        """
+        updated_items = []
+        invalid = 0
+        for item in items:
+            try:
+                changes = self.changes(item)
+            except ValidationError as e:
+                invalid += 1
+                logger.warning(f"Item inválido em {self.table_name} ignorado: {e.error_count()} erro(s)")
+                continue
+            if changes:
+                updated_items.append(_restore_integers({**item, **changes}))
+        return updated_items, invalid
+
+
+class ParticipantEmailLookupTarget:
+    """
+    Cria os itens de lookup por e-mail (`email#<e-mail>`) dos participantes que
+    ainda não têm um. Com mais de um participante para o mesmo e-mail, o
+    lookup aponta para um deles; os demais continuam acessíveis pelo id.
+    """
+
+    table_name = "participants"
+
+    def __init__(self, dynamodb_service: DynamoDBService):
+        self.dynamodb_service = dynamodb_service
+
+    def items_to_write(self, items: List[Dict]) -> Tuple[List[Dict], int]:
+        lookups: Dict[str, Dict] = {}
+        invalid = 0
+        for item in items:
+            if _is_email_lookup(item):
+                continue
+            try:
+                participant = Participant.model_validate(item)
+            except ValidationError as e:
+                invalid += 1
+                logger.warning(f"Item inválido em {self.table_name} ignorado: {e.error_count()} erro(s)")
+                continue
+            lookup = _email_lookup_item(participant.id, participant.email)
+            lookups.setdefault(lookup["id"], lookup)
+
+        if not lookups:
+            return [], invalid
+        existing = self.dynamodb_service.batch_get_items(
+            [{"id": lookup_id} for lookup_id in lookups],
+            self.table_name,
+            projection=["id"],
+            consistent_read=True,
+        )
+        for item in existing:
+            lookups.pop(item["id"], None)
+        return list(lookups.values()), invalid
+
+
+BackfillTarget = Union[DerivedKeysTarget, ParticipantEmailLookupTarget]
+
+
+def derived_keys_targets(dynamodb_service: DynamoDBService) -> Dict[str, BackfillTarget]:
+    """Tabelas com atributos derivados, pelo nome da entidade."""
+    certificates = CertificateRepositoryImpl(dynamodb_service, "certificates")
+    orders = OrderRepositoryImpl(dynamodb_service, "orders")
+    products = ProductRepositoryImpl(dynamodb_service, "products")
+    return {
+        "certificates": DerivedKeysTarget(
+            "certificates",
+            Certificate,
+            certificates._prepare_item,
+            (
+                "participant_email",
+                "participant_email_product_key",
+                "success_flag",
+                "participant_email_success_key",
+                "generated_at",
+                "product_shard_key",
+                "success_shard_key",
+            ),
+        ),
+        "orders": DerivedKeysTarget(
+            "orders",
+            Order,
+            orders._prepare_item,
+            ("participant_email", "order_year_month", "order_date_order_id"),
+        ),
+        "products": DerivedKeysTarget(
+            "products",
+            Product,
+            products._prepare_item,
+            (
+                "has_certificate_logo_flag",
+                "has_certificate_background_flag",
+                "has_certificate_logo_shard_key",
+                "has_certificate_background_shard_key",
+            ),
+        ),
+        "participants": ParticipantEmailLookupTarget(dynamodb_service),
+    }
+
+
+class BackfillCheckpoint:
+    """
+    Progresso por tabela e segmento, gravado em JSON a cada página:
+    {"certificates": {"total_segments": 4, "segments": {"0": {"last_key": {...}, "done": false, ...}}}}
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._state: Dict[str, Dict] = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                self._state = json.load(file)
+
+    def segments(self, table_name: str, total_segments: int) -> Dict[str, Dict]:
+        with self._lock:
+            table = self._state.setdefault(table_name, {"total_segments": total_segments, "segments": {}})
+            if table["total_segments"] != total_segments:
+                raise ValueError(
+                    f"Checkpoint de {table_name} foi gravado com {table['total_segments']} segmentos; "
+                    f"use --segments {table['total_segments']} ou apague o checkpoint"
+                )
+            return {segment: dict(state) for segment, state in table["segments"].items()}
+
+    def update(self, table_name: str, segment: int, state: Dict) -> None:
+        with self._lock:
+            self._state[table_name]["segments"][str(segment)] = state
+            # Grava num arquivo temporário e troca, para não deixar um JSON pela metade
+            temporary_path = f"{self.path}.tmp"
+            with open(temporary_path, "w", encoding="utf-8") as file:
+                json.dump(self._state, file)
+            os.replace(temporary_path, self.path)
+
+
+class _RateLimiter:
+    """Espaça as gravações para não passar de `rate` itens por segundo (somando as threads)."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, count: int) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(self._next_slot, now)
+            self._next_slot = start + count * self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class DerivedKeysBackfill:
+    """
+    Preenche os atributos derivados de uma tabela.
+
+    Args:
+        dynamodb_service: Serviço do DynamoDB
+        checkpoint: Progresso para retomar execuções (opcional)
+        max_writes_per_second: Teto de itens gravados por segundo (opcional, sem teto)
+        page_size: Itens lidos por chamada do scan
+        dry_run: Só conta os itens que seriam gravados
+    """
+
+    def __init__(
+        self,
+        dynamodb_service: DynamoDBService,
+        checkpoint: Optional[BackfillCheckpoint] = None,
+        max_writes_per_second: Optional[float] = None,
+        page_size: int = BACKFILL_PAGE_SIZE,
+        dry_run: bool = False,
+    ):
+        self.dynamodb_service = dynamodb_service
+        self.checkpoint = checkpoint
+        self.rate_limiter = _RateLimiter(max_writes_per_second) if max_writes_per_second else None
+        self.page_size = page_size
+        self.dry_run = dry_run
+
+    def run(self, target: BackfillTarget, total_segments: int = BACKFILL_TOTAL_SEGMENTS) -> Dict[str, int]:
+        """
+        Processa todos os segmentos ainda não concluídos da tabela.
+
+        Returns:
+            Dict[str, int]: Itens lidos (scanned), regravados (updated) e inválidos (invalid)
+        """
+        saved = {}
+        if self.checkpoint is not None and not self.dry_run:
+            saved = self.checkpoint.segments(target.table_name, total_segments)
+
+        logger.info(
+            f"Preenchendo atributos derivados de {target.table_name} "
+            f"({total_segments} segmentos, dry_run={self.dry_run})"
+        )
+        with ThreadPoolExecutor(max_workers=total_segments) as executor:
+            results = list(executor.map(
+                lambda segment: self._run_segment(target, segment, total_segments, saved.get(str(segment))),
+                range(total_segments),
+            ))
+
+        totals = {"scanned": 0, "updated": 0, "invalid": 0}
+        for result in results:
+            for counter in totals:
+                totals[counter] += result[counter]
+        logger.info(f"Atributos derivados de {target.table_name} preenchidos: {totals}")
+        return totals
+
+    def _run_segment(
+        self,
+        target: BackfillTarget,
+        segment: int,
+        total_segments: int,
+        state: Optional[Dict],
+    ) -> Dict[str, int]:
+        state = state or {"last_key": None, "done": False, "scanned": 0, "updated": 0, "invalid": 0}
+        if state["done"]:
+            logger.info(f"Segmento {segment} de {target.table_name} já concluído")
+            return state
+
+        pages = self.dynamodb_service.iterate_scan_pages_with_keys(
+            target.table_name,
+            segment=segment,
+            total_segments=total_segments,
+            page_size=self.page_size,
+            exclusive_start_key=state["last_key"],
+        )
+        for items, last_key in pages:
+            updated_items, invalid = target.items_to_write(items)
+            if updated_items and not self.dry_run:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire(len(updated_items))
+                self.dynamodb_service.batch_write_items(updated_items, target.table_name)
+
+            state["scanned"] += len(items)
+            state["updated"] += len(updated_items)
+            state["invalid"] += invalid
+            state["last_key"] = last_key
+            state["done"] = last_key is None
+            if self.checkpoint is not None and not self.dry_run:
+                self.checkpoint.update(target.table_name, segment, state)
+        return state
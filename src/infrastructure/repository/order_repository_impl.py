@@ -1,7 +1,9 @@
+import heapq
 import logging
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Optional, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from src.domain.entity.order import Order
 from src.domain.repository.order_repository import OrderRepository
@@ -43,6 +45,54 @@ def _order_date_order_id(value: str, order_id: int) -> str:
     return f"{_parse_order_date(value).isoformat()}#{order_id:020d}"
 
 
+def _month_ranges(start_date: str, end_date: str) -> List[Tuple[str, str, str]]:
+    """
+    Divide o intervalo em meses: (order_year_month, início e fim do
+    order_date_order_id) para cada consulta ao orders_by_month_idx, em ordem.
+    """
+    start_dt = _as_naive_utc(_parse_order_date(start_date))
+    end_dt = _as_naive_utc(_parse_order_date(end_date))
+    if start_dt > end_dt:
+        start_dt, end_dt = end_dt, start_dt
+
+    current_month = datetime(start_dt.year, start_dt.month, 1)
+    final_month = datetime(end_dt.year, end_dt.month, 1)
+    month_ranges = []
+
+    while current_month <= final_month:
+        month_start = max(start_dt, current_month)
+        next_month = (current_month.replace(day=28) + timedelta(days=4)).replace(day=1)
+        month_end_boundary = next_month - timedelta(microseconds=1)
+        month_end = min(end_dt, month_end_boundary)
+
+        month_ranges.append((
+            current_month.strftime("%Y-%m"),
+            f"{month_start.isoformat()}#00000000000000000000",
+            f"{month_end.isoformat()}#99999999999999999999",
+        ))
+        current_month = next_month
+
+    return month_ranges
+
+
+def _prefetched_items(executor: ThreadPoolExecutor, pages: Iterator[List[dict]], next_page: Future) -> Iterator[dict]:
+    """Itens de um mês, buscando a próxima página em segundo plano enquanto a atual é consumida."""
+    while True:
+        page = next_page.result()
+        if page is None:
+            return
+        next_page = executor.submit(next, pages, None)
+        yield from page
+
+
+_MONTH_KEY_CONDITION = (
+    "order_year_month = :order_year_month AND order_date_order_id BETWEEN :start_range AND :end_range"
+)
+
+# Consultas simultâneas ao orders_by_month_idx (um mês por thread)
+ORDERS_BY_MONTH_MAX_WORKERS = 6
+
+
 class OrderRepositoryImpl(OrderRepository):
     def __init__(self, dynamodb_service: DynamoDBService, table_name: str = "orders"):
         self.dynamodb_service = dynamodb_service
@@ -157,6 +207,25 @@ class OrderRepositoryImpl(OrderRepository):
             logger.error(f"Erro ao buscar pedido por order_id {order_id}: {str(e)}")
             raise
 
+    def get_by_order_ids(self, order_ids: Iterable[int]) -> Dict[int, Order]:
+        """
+        Busca vários pedidos pela chave primária (order_id) com BatchGetItem.
+        Order_ids sem pedido ficam fora do dicionário.
+        """
+        try:
+            unique_order_ids = list(dict.fromkeys(order_ids))
+            if not unique_order_ids:
+                return {}
+            items = self.dynamodb_service.batch_get_items(
+                [{"order_id": order_id} for order_id in unique_order_ids],
+                self.table_name,
+            )
+            return {order.order_id: order for order in (Order(**item) for item in items)}
+
+        except Exception as e:
+            logger.error(f"Erro ao buscar pedidos em lote por order_id: {str(e)}")
+            raise
+
     def get_by_participant_email(self, email: str) -> List[Order]:
         try:
             items = self.dynamodb_service.query_table(
@@ -189,41 +258,75 @@ class OrderRepositoryImpl(OrderRepository):
 
     def get_orders_by_date_range(self, start_date: str, end_date: str) -> List[Order]:
         try:
-            start_dt = _as_naive_utc(_parse_order_date(start_date))
-            end_dt = _as_naive_utc(_parse_order_date(end_date))
-            if start_dt > end_dt:
-                start_dt, end_dt = end_dt, start_dt
-
-            current_month = datetime(start_dt.year, start_dt.month, 1)
-            final_month = datetime(end_dt.year, end_dt.month, 1)
-            items = []
-
-            while current_month <= final_month:
-                month_key = current_month.strftime("%Y-%m")
-                month_start = max(start_dt, current_month)
-                next_month = (current_month.replace(day=28) + timedelta(days=4)).replace(day=1)
-                month_end_boundary = next_month - timedelta(microseconds=1)
-                month_end = min(end_dt, month_end_boundary)
-
-                month_items = self.dynamodb_service.query_table(
-                    self.table_name,
-                    "order_year_month = :order_year_month AND order_date_order_id BETWEEN :start_range AND :end_range",
-                    {
-                        ":order_year_month": month_key,
-                        ":start_range": f"{month_start.isoformat()}#00000000000000000000",
-                        ":end_range": f"{month_end.isoformat()}#99999999999999999999",
-                    },
-                    index_name="orders_by_month_idx",
-                )
-                items.extend(month_items)
-                current_month = next_month
+            month_ranges = _month_ranges(start_date, end_date)
+            # Os meses são consultados em paralelo; como não se sobrepõem,
+            # concatenar na ordem dos meses mantém a ordem por data
+            with ThreadPoolExecutor(max_workers=min(len(month_ranges), ORDERS_BY_MONTH_MAX_WORKERS)) as executor:
+                month_items = list(executor.map(self._query_month, month_ranges))
 
-            return [Order(**item) for item in items]
+            return [Order(**item) for items in month_items for item in items]
 
         except Exception as e:
             logger.error(f"Erro ao buscar pedidos por intervalo de datas {start_date} - {end_date}: {str(e)}")
             raise
 
+    def iter_orders_by_date_range(
+        self,
+        start_date: str,
+        end_date: str,
+        limit: Optional[int] = None,
+        page_size: Optional[int] = None,
+    ) -> Iterator[Order]:
+        """
+        Versão em streaming de get_orders_by_date_range: devolve os pedidos em
+        ordem de data, intercalando as consultas de cada mês (k-way merge).
+
+        A primeira página de todos os meses é buscada em paralelo e, enquanto
+        uma página é consumida, a seguinte do mesmo mês já é buscada. Com
+        `limit`, a leitura para assim que esse número de pedidos for devolvido.
+        """
+        month_ranges = _month_ranges(start_date, end_date)
+        page_size = page_size or limit
+        executor = ThreadPoolExecutor(max_workers=min(len(month_ranges), ORDERS_BY_MONTH_MAX_WORKERS))
+        try:
+            month_pages = [self._iterate_month_pages(month_range, page_size) for month_range in month_ranges]
+            # As primeiras páginas são pedidas antes do merge, que só lê um mês por vez
+            first_pages = [executor.submit(next, pages, None) for pages in month_pages]
+            streams = [
+                _prefetched_items(executor, pages, first_page)
+                for pages, first_page in zip(month_pages, first_pages)
+            ]
+            merged = heapq.merge(*streams, key=lambda item: item.get("order_date_order_id") or "")
+            for count, item in enumerate(merged, start=1):
+                yield Order(**item)
+                if limit and count >= limit:
+                    return
+
+        except Exception as e:
+            logger.error(f"Erro ao percorrer pedidos por intervalo de datas {start_date} - {end_date}: {str(e)}")
+            raise
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _query_month(self, month_range: Tuple[str, str, str]) -> List[dict]:
+        month_key, start_range, end_range = month_range
+        return self.dynamodb_service.query_table(
+            self.table_name,
+            _MONTH_KEY_CONDITION,
+            {":order_year_month": month_key, ":start_range": start_range, ":end_range": end_range},
+            index_name="orders_by_month_idx",
+        )
+
+    def _iterate_month_pages(self, month_range: Tuple[str, str, str], page_size: Optional[int]) -> Iterator[List[dict]]:
+        month_key, start_range, end_range = month_range
+        return self.dynamodb_service.iterate_query_pages(
+            self.table_name,
+            _MONTH_KEY_CONDITION,
+            {":order_year_month": month_key, ":start_range": start_range, ":end_range": end_range},
+            index_name="orders_by_month_idx",
+            page_size=page_size,
+        )
+
     def _prepare_item(self, entity: Order) -> dict:
         item = entity.model_dump()
         item["participant_email"] = _normalize_email(item["participant_email"])
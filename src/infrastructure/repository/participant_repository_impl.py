@@ -1,10 +1,13 @@
 import logging
 import uuid
-from typing import List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Union
+
+from botocore.exceptions import ClientError
 
 from src.domain.entity.participant import Participant
 from src.domain.repository.participant_repository import ParticipantRepository
 from src.infrastructure.aws.dynamodb_service import DynamoDBService
+from src.infrastructure.config.config import config
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -16,16 +19,66 @@ def _normalize_email(email: Optional[str]) -> Optional[str]:
     return email.strip().lower()
 
 
+# Itens de lookup ficam na própria tabela, com id = "email#<e-mail normalizado>"
+# e o id do participante em participant_id. Sem o atributo email, ficam fora dos GSIs.
+EMAIL_LOOKUP_PREFIX = "email#"
+
+# Reservas do e-mail em create quando o lookup some entre a reserva recusada e a leitura
+EMAIL_CLAIM_MAX_ATTEMPTS = 3
+
+
+def _email_lookup_id(email: str) -> str:
+    return f"{EMAIL_LOOKUP_PREFIX}{_normalize_email(email)}"
+
+
+def _email_lookup_item(participant_id: Union[str, uuid.UUID], email: str) -> dict:
+    return {"id": _email_lookup_id(email), "participant_id": str(participant_id)}
+
+
+def _is_email_lookup(item: dict) -> bool:
+    return str(item.get("id", "")).startswith(EMAIL_LOOKUP_PREFIX)
+
+
+def _is_conditional_check_failed(error: ClientError) -> bool:
+    return error.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException"
+
+
 class ParticipantRepositoryImpl(ParticipantRepository):
     def __init__(self, dynamodb_service: DynamoDBService, table_name: str = "participants"):
         self.dynamodb_service = dynamodb_service
         self.table_name = table_name
 
     def create(self, entity: Participant) -> Participant:
+        """
+        Grava o participante reservando antes o e-mail (put condicional do item de lookup).
+        Se o e-mail já pertence a outro participante, nada é gravado e o existente é devolvido.
+        """
         try:
             item = entity.model_dump()
-            item["id"] = str(entity.id)
             item["email"] = _normalize_email(item.get("email"))
+
+            for attempt in range(1, EMAIL_CLAIM_MAX_ATTEMPTS + 1):
+                if self._claim_email(entity.id, item["email"]):
+                    break
+                existing = self.get_by_email(item["email"])
+                if existing:
+                    logger.info(f"E-mail já cadastrado para o participante {existing.id}, mantendo o existente")
+                    return existing
+                # Lookup sem participante (falha entre as duas gravações): usa o id já reservado
+                lookup = self.dynamodb_service.get_item(
+                    {"id": _email_lookup_id(item["email"])}, self.table_name, consistent_read=True
+                )
+                if lookup:
+                    entity = entity.model_copy(update={"id": uuid.UUID(lookup["participant_id"])})
+                    break
+                # Lookup liberado depois da reserva recusada (remoção ou troca de e-mail concorrente)
+                logger.info(f"Lookup do e-mail liberado durante a criação do participante (tentativa {attempt})")
+            else:
+                raise RuntimeError(
+                    f"E-mail {item['email']} não reservado após {EMAIL_CLAIM_MAX_ATTEMPTS} tentativas"
+                )
+
+            item["id"] = str(entity.id)
             self.dynamodb_service.put_item(item, self.table_name)
             return entity
         except Exception as e:
@@ -55,7 +108,7 @@ class ParticipantRepositoryImpl(ParticipantRepository):
     def get_all(self) -> List[Participant]:
         try:
             items = self.dynamodb_service.scan_table(self.table_name)
-            return [Participant(**item) for item in items]
+            return [Participant(**item) for item in items if not _is_email_lookup(item)]
 
         except Exception as e:
             logger.error(f"Erro ao buscar todos os participantes: {str(e)}")
@@ -63,13 +116,18 @@ class ParticipantRepositoryImpl(ParticipantRepository):
 
     def update(self, entity_id: str, entity: Participant) -> Optional[Participant]:
         try:
-            if not self.exists(entity_id):
+            existing = self.get_by_id(entity_id)
+            if existing is None:
                 return None
 
             update_data = entity.model_dump()
             update_data["email"] = _normalize_email(update_data.get("email"))
             update_data.pop("id", None)
 
+            email_changed = update_data["email"] != _normalize_email(existing.email)
+            if email_changed and not self._claim_email(entity_id, update_data["email"]):
+                raise ValueError(f"E-mail {update_data['email']} já cadastrado para outro participante")
+
             update_expression = "SET "
             expression_values = {}
             expression_names = {}
@@ -90,6 +148,9 @@ class ParticipantRepositoryImpl(ParticipantRepository):
                 expression_attribute_names=expression_names,
             )
 
+            if email_changed:
+                self._release_email(entity_id, existing.email)
+
             if "Attributes" in response:
                 result_dict = self.dynamodb_service._convert_from_dynamodb_format(response["Attributes"])
                 return Participant(**result_dict)
@@ -101,7 +162,10 @@ class ParticipantRepositoryImpl(ParticipantRepository):
 
     def delete(self, entity_id: str) -> bool:
         try:
+            existing = self.get_by_id(entity_id)
             self.dynamodb_service.delete_item({"id": entity_id}, self.table_name)
+            if existing is not None:
+                self._release_email(entity_id, existing.email)
             return True
 
         except Exception as e:
@@ -117,7 +181,22 @@ class ParticipantRepositoryImpl(ParticipantRepository):
             return False
 
     def get_by_email(self, email: str) -> Optional[Participant]:
+        """
+        Busca pelo item de lookup do e-mail (GetItem fortemente consistente).
+        Sem lookup, e com PARTICIPANT_EMAIL_LOOKUP_FALLBACK, consulta o GSI por e-mail.
+        """
         try:
+            lookup = self.dynamodb_service.get_item(
+                {"id": _email_lookup_id(email)}, self.table_name, consistent_read=True
+            )
+            if lookup:
+                item = self.dynamodb_service.get_item(
+                    {"id": lookup["participant_id"]}, self.table_name, consistent_read=True
+                )
+                return Participant(**item) if item else None
+
+            if not config.PARTICIPANT_EMAIL_LOOKUP_FALLBACK:
+                return None
             items = self.dynamodb_service.query_table(
                 self.table_name,
                 "email = :email",
@@ -132,6 +211,42 @@ class ParticipantRepositoryImpl(ParticipantRepository):
             logger.error(f"Erro ao buscar participante por email {email}: {str(e)}")
             raise
 
+    def get_by_emails(self, emails: Iterable[str]) -> Dict[str, Participant]:
+        """
+        Resolve vários e-mails com dois BatchGetItem (lookups e participantes).
+        E-mails sem lookup ficam de fora do resultado, sem consultar o GSI.
+
+        Returns:
+            Dict[str, Participant]: Participantes pelo e-mail, como informado
+        """
+        try:
+            lookup_ids = {email: _email_lookup_id(email) for email in emails if email}
+            if not lookup_ids:
+                return {}
+
+            lookups = self.dynamodb_service.batch_get_items(
+                [{"id": lookup_id} for lookup_id in set(lookup_ids.values())],
+                self.table_name,
+                consistent_read=True,
+            )
+            participant_ids = {lookup["id"]: lookup["participant_id"] for lookup in lookups}
+            items = self.dynamodb_service.batch_get_items(
+                [{"id": participant_id} for participant_id in set(participant_ids.values())],
+                self.table_name,
+                consistent_read=True,
+            )
+            participants = {item["id"]: Participant(**item) for item in items}
+
+            return {
+                email: participants[participant_ids[lookup_id]]
+                for email, lookup_id in lookup_ids.items()
+                if participant_ids.get(lookup_id) in participants
+            }
+
+        except Exception as e:
+            logger.error(f"Erro ao buscar participantes por emails: {str(e)}")
+            raise
+
     def get_by_cpf(self, cpf: str) -> Optional[Participant]:
         try:
             items = self.dynamodb_service.query_table(
@@ -179,3 +294,23 @@ class ParticipantRepositoryImpl(ParticipantRepository):
         except Exception as e:
             logger.error(f"Erro ao verificar existência do CPF {cpf}: {str(e)}")
             return False
+
+    def _claim_email(self, participant_id: Union[str, uuid.UUID], email: str) -> bool:
+        """Reserva o e-mail para o participante; False se ele já tem dono."""
+        try:
+            self.dynamodb_service.put_item(
+                _email_lookup_item(participant_id, email),
+                self.table_name,
+                condition_expression="attribute_not_exists(id)",
+            )
+            return True
+        except ClientError as e:
+            if _is_conditional_check_failed(e):
+                return False
+            raise
+
+    def _release_email(self, participant_id: Union[str, uuid.UUID], email: str) -> None:
+        lookup = self.dynamodb_service.get_item({"id": _email_lookup_id(email)}, self.table_name, consistent_read=True)
+        # Só remove o lookup que aponta para este participante
+        if lookup and lookup.get("participant_id") == str(participant_id):
+            self.dynamodb_service.delete_item({"id": lookup["id"]}, self.table_name)
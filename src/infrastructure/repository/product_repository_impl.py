@@ -5,6 +5,7 @@ from typing import List, Optional, Union
 from src.domain.entity.product import Product
 from src.domain.repository.product_repository import ProductRepository
 from src.infrastructure.aws.dynamodb_service import DynamoDBService
+from src.infrastructure.repository.sharding import ShardedIndex, query_sharded
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -14,6 +15,17 @@ def _flag(value: Optional[str]) -> int:
     return 1 if value else 0
 
 
+# Índices por flag (só dois valores) com write sharding; o shard vem do product_id
+PRODUCTS_BY_HAS_LOGO = ShardedIndex(
+    "products_by_has_logo_idx", "has_certificate_logo_flag",
+    "products_by_has_logo_shard_idx", "has_certificate_logo_shard_key",
+)
+PRODUCTS_BY_HAS_BACKGROUND = ShardedIndex(
+    "products_by_has_background_idx", "has_certificate_background_flag",
+    "products_by_has_background_shard_idx", "has_certificate_background_shard_key",
+)
+
+
 class ProductRepositoryImpl(ProductRepository):
     def __init__(self, dynamodb_service: DynamoDBService, table_name: str = "products"):
         self.dynamodb_service = dynamodb_service
@@ -144,12 +156,7 @@ class ProductRepositoryImpl(ProductRepository):
 
     def get_products_with_logo(self) -> List[Product]:
         try:
-            items = self.dynamodb_service.query_table(
-                self.table_name,
-                "has_certificate_logo_flag = :flag",
-                {":flag": 1},
-                index_name="products_by_has_logo_idx",
-            )
+            items = query_sharded(self.dynamodb_service, self.table_name, PRODUCTS_BY_HAS_LOGO, 1)
             return [Product(**item) for item in items]
 
         except Exception as e:
@@ -158,12 +165,7 @@ class ProductRepositoryImpl(ProductRepository):
 
     def get_products_with_background(self) -> List[Product]:
         try:
-            items = self.dynamodb_service.query_table(
-                self.table_name,
-                "has_certificate_background_flag = :flag",
-                {":flag": 1},
-                index_name="products_by_has_background_idx",
-            )
+            items = query_sharded(self.dynamodb_service, self.table_name, PRODUCTS_BY_HAS_BACKGROUND, 1)
             return [Product(**item) for item in items]
 
         except Exception as e:
@@ -174,4 +176,10 @@ class ProductRepositoryImpl(ProductRepository):
         item = entity.model_dump()
         item["has_certificate_logo_flag"] = _flag(item.get("certificate_logo"))
         item["has_certificate_background_flag"] = _flag(item.get("certificate_background"))
+        item["has_certificate_logo_shard_key"] = PRODUCTS_BY_HAS_LOGO.key(
+            item["has_certificate_logo_flag"], item.get("product_id")
+        )
+        item["has_certificate_background_shard_key"] = PRODUCTS_BY_HAS_BACKGROUND.key(
+            item["has_certificate_background_flag"], item.get("product_id")
+        )
         return item
@@ -0,0 +1,75 @@
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from src.domain.entity.product_stats import CERTIFICATE_STATUSES, ProductStats
+from src.domain.repository.product_stats_repository import ProductStatsRepository
+from src.infrastructure.aws.dynamodb_service import DynamoDBService
+
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+_COUNTERS = ("total",) + CERTIFICATE_STATUSES
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+class ProductStatsRepositoryImpl(ProductStatsRepository):
+    """
+    Um item por produto (chave: product_id) com os contadores de certificados.
+    Os contadores são mantidos com UpdateItem/ADD, que é atômico no DynamoDB.
+    """
+
+    def __init__(self, dynamodb_service: DynamoDBService, table_name: str = "product_stats"):
+        self.dynamodb_service = dynamodb_service
+        self.table_name = table_name
+
+    def get(self, product_id: int) -> Optional[ProductStats]:
+        try:
+            item = self.dynamodb_service.get_item({"product_id": product_id}, self.table_name)
+            if not item:
+                return None
+            values = {counter: int(item.get(counter) or 0) for counter in _COUNTERS}
+            return ProductStats(product_id=int(item["product_id"]), updated_at=item.get("updated_at"), **values)
+
+        except Exception as e:
+            logger.error(f"Erro ao buscar estatísticas do produto {product_id}: {str(e)}")
+            raise
+
+    def increment(self, product_id: int, deltas: Dict[str, int]) -> None:
+        deltas = {counter: delta for counter, delta in deltas.items() if counter in _COUNTERS and delta}
+        if not deltas:
+            return
+        try:
+            expression_names = {"#updated_at": "updated_at"}
+            expression_values = {":updated_at": _now()}
+            for counter, delta in deltas.items():
+                expression_names[f"#{counter}"] = counter
+                expression_values[f":{counter}"] = delta
+            update_expression = (
+                "ADD " + ", ".join(f"#{counter} :{counter}" for counter in deltas)
+                + " SET #updated_at = :updated_at"
+            )
+            self.dynamodb_service.update_item(
+                {"product_id": product_id},
+                update_expression,
+                expression_values,
+                self.table_name,
+                expression_attribute_names=expression_names,
+            )
+
+        except Exception as e:
+            logger.error(f"Erro ao atualizar estatísticas do produto {product_id}: {str(e)}")
+            raise
+
+    def save(self, stats: ProductStats) -> ProductStats:
+        try:
+            stats.updated_at = _now()
+            self.dynamodb_service.put_item(stats.model_dump(), self.table_name)
+            return stats
+
+        except Exception as e:
+            logger.error(f"Erro ao gravar estatísticas do produto {stats.product_id}: {str(e)}")
+            raise
@@ -0,0 +1,233 @@
+"""
+Chaves de GSI com write sharding (`<valor>#<shard>`).
+
+Índices com HASH de baixa cardinalidade (success_flag, flags de produto) ou
+concentrado num valor durante um evento grande (product_id) viram partições
+quentes. Com sharding, cada item grava a chave com um sufixo derivado da sua
+chave primária e as consultas leem todos os shards em paralelo.
+
+A quantidade de shards é configurada por índice em GSI_SHARD_COUNTS. Enquanto
+um índice não estiver configurado, as consultas continuam no índice original;
+as chaves com sufixo são gravadas mesmo assim (no shard 0), para o índice novo
+já estar populado quando o sharding for ligado. A quantidade só deve aumentar:
+itens gravados com uma quantidade maior ficam fora das consultas se ela diminuir.
+"""
+
+import heapq
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.infrastructure.aws.dynamodb_service import DynamoDBService
+from src.infrastructure.config.config import config
+
+logger = logging.getLogger(__name__)
+
+# Valor de ordenação para itens sem o atributo de RANGE (ficam no fim da ordem decrescente)
+_MISSING_SORT_VALUE = ""
+
+# Partição única do índice original nas posições de leitura de iterate_sharded_pages_with_keys
+_LEGACY_PARTITION = "*"
+
+
+class ShardedIndex:
+    """
+    Par índice original / índice com sharding para um mesmo atributo.
+
+    Args:
+        legacy_index: Índice original, com HASH = `legacy_attribute` (chave em GSI_SHARD_COUNTS)
+        legacy_attribute: Atributo de HASH do índice original
+        index_name: Índice com HASH = `key_attribute`
+        key_attribute: Atributo gravado como `<valor>#<shard>`
+        sort_attribute: RANGE do índice com sharding, usado para intercalar os shards (opcional)
+        shard_count_index: Índice original cuja quantidade em GSI_SHARD_COUNTS vale para
+            este (padrão: legacy_index). Índices que compartilham `key_attribute` precisam
+            da mesma quantidade, senão a chave gravada não cai nos shards consultados
+    """
+
+    def __init__(
+        self,
+        legacy_index: str,
+        legacy_attribute: str,
+        index_name: str,
+        key_attribute: str,
+        sort_attribute: Optional[str] = None,
+        shard_count_index: Optional[str] = None,
+    ):
+        self.legacy_index = legacy_index
+        self.legacy_attribute = legacy_attribute
+        self.index_name = index_name
+        self.key_attribute = key_attribute
+        self.sort_attribute = sort_attribute
+        self.shard_count_index = shard_count_index or legacy_index
+
+    @property
+    def shard_count(self) -> int:
+        """Shards configurados; 0 mantém as consultas no índice original."""
+        return max(config.GSI_SHARD_COUNTS.get(self.shard_count_index, 0), 0)
+
+    def key(self, value: Any, seed: int) -> Optional[str]:
+        """Chave com sufixo de shard; o mesmo `seed` sempre cai no mesmo shard."""
+        if value is None or seed is None:
+            return None
+        return f"{value}#{int(seed) % max(self.shard_count, 1)}"
+
+    def shard_keys(self, value: Any) -> List[str]:
+        return [f"{value}#{shard}" for shard in range(self.shard_count)]
+
+
+def query_sharded(
+    dynamodb_service: DynamoDBService,
+    table_name: str,
+    index: ShardedIndex,
+    value: Any,
+    filter_expression: str = None,
+    expression_values: Optional[Dict] = None,
+    scan_index_forward: bool = True,
+    projection: Optional[List[str]] = None,
+    range_condition: Optional[str] = None,
+) -> List[Dict]:
+    """
+    Consulta todos os itens com `value` no índice: em paralelo em cada shard,
+    intercalando os resultados pelo RANGE, ou no índice original sem sharding.
+    `range_condition` (ex.: "updated_at > :since") é somada à condição de chave
+    em todos os shards; `expression_values` complementa os valores da condição e do filtro.
+    """
+    range_suffix = f" AND {range_condition}" if range_condition else ""
+    if not index.shard_count:
+        return dynamodb_service.query_table(
+            table_name,
+            f"{index.legacy_attribute} = :shard_value{range_suffix}",
+            {":shard_value": value, **(expression_values or {})},
+            index_name=index.legacy_index,
+            filter_expression=filter_expression,
+            scan_index_forward=scan_index_forward,
+            projection=projection,
+        )
+
+    if projection and index.sort_attribute:
+        # O atributo de ordenação é necessário para intercalar os shards
+        projection = [*projection, index.sort_attribute]
+
+    def query_shard(shard_key: str) -> List[Dict]:
+        return dynamodb_service.query_table(
+            table_name,
+            f"{index.key_attribute} = :shard_key{range_suffix}",
+            {":shard_key": shard_key, **(expression_values or {})},
+            index_name=index.index_name,
+            filter_expression=filter_expression,
+            scan_index_forward=scan_index_forward,
+            projection=projection,
+        )
+
+    shard_keys = index.shard_keys(value)
+    with ThreadPoolExecutor(max_workers=len(shard_keys)) as executor:
+        results = list(executor.map(query_shard, shard_keys))
+
+    if not index.sort_attribute:
+        return [item for items in results for item in items]
+    return list(heapq.merge(
+        *results,
+        key=lambda item: item.get(index.sort_attribute) or _MISSING_SORT_VALUE,
+        reverse=not scan_index_forward,
+    ))
+
+
+def iterate_sharded_pages(
+    dynamodb_service: DynamoDBService,
+    table_name: str,
+    index: ShardedIndex,
+    value: Any,
+    filter_expression: str = None,
+    expression_values: Optional[Dict] = None,
+    scan_index_forward: bool = True,
+    projection: Optional[List[str]] = None,
+    page_size: Optional[int] = None,
+) -> Iterator[List[Dict]]:
+    """
+    Versão paginada de query_sharded, sem ordem global entre os shards.
+    A cada rodada, busca em paralelo a próxima página de cada shard; no máximo
+    uma página por shard fica em memória.
+    """
+    pages = iterate_sharded_pages_with_keys(
+        dynamodb_service,
+        table_name,
+        index,
+        value,
+        filter_expression=filter_expression,
+        expression_values=expression_values,
+        scan_index_forward=scan_index_forward,
+        projection=projection,
+        page_size=page_size,
+    )
+    for items, _ in pages:
+        if items:
+            yield items
+
+
+def iterate_sharded_pages_with_keys(
+    dynamodb_service: DynamoDBService,
+    table_name: str,
+    index: ShardedIndex,
+    value: Any,
+    filter_expression: str = None,
+    expression_values: Optional[Dict] = None,
+    scan_index_forward: bool = True,
+    projection: Optional[List[str]] = None,
+    page_size: Optional[int] = None,
+    start_keys: Optional[Dict[str, Optional[Dict]]] = None,
+) -> Iterator[Tuple[List[Dict], Dict[str, Optional[Dict]]]]:
+    """
+    Como iterate_sharded_pages, mas devolve junto de cada página a posição das
+    partições ainda não concluídas, já contando a página: partição (chave do
+    shard, ou _LEGACY_PARTITION sem sharding) -> LastEvaluatedKey, ou None se a
+    partição ainda não foi lida. Passada como `start_keys`, retoma a leitura
+    dali; {} indica que tudo foi lido. Páginas vazias também são devolvidas.
+
+    Raises:
+        ValueError: Se `start_keys` não corresponder às partições atuais do
+            índice (ex.: a quantidade de shards mudou)
+    """
+    partitions = index.shard_keys(value) if index.shard_count else [_LEGACY_PARTITION]
+    if start_keys is None:
+        positions: Dict[str, Optional[Dict]] = {partition: None for partition in partitions}
+    else:
+        unknown = set(start_keys) - set(partitions)
+        if unknown:
+            raise ValueError(f"Posição de leitura não corresponde ao índice {index.legacy_index}: {sorted(unknown)}")
+        positions = dict(start_keys)
+
+    def pages_of(partition: str) -> Iterator[Tuple[List[Dict], Optional[Dict]]]:
+        if partition == _LEGACY_PARTITION:
+            index_name, key_condition = index.legacy_index, f"{index.legacy_attribute} = :shard_value"
+            key_values = {":shard_value": value}
+        else:
+            index_name, key_condition = index.index_name, f"{index.key_attribute} = :shard_key"
+            key_values = {":shard_key": partition}
+        return dynamodb_service.iterate_query_pages_with_keys(
+            table_name,
+            key_condition,
+            {**key_values, **(expression_values or {})},
+            index_name=index_name,
+            filter_expression=filter_expression,
+            scan_index_forward=scan_index_forward,
+            projection=projection,
+            page_size=page_size,
+            exclusive_start_key=positions[partition],
+        )
+
+    iterators = {partition: pages_of(partition) for partition in positions}
+    if not iterators:
+        return
+    with ThreadPoolExecutor(max_workers=len(iterators)) as executor:
+        while iterators:
+            names = list(iterators)
+            pages = list(executor.map(lambda name: next(iterators[name], None), names))
+            for name, page in zip(names, pages):
+                items, last_key = page if page is not None else ([], None)
+                if last_key is None:
+                    del iterators[name]
+                    positions.pop(name, None)
+                else:
+                    positions[name] = last_key
+                yield items, dict(positions)
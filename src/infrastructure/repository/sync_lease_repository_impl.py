@@ -0,0 +1,99 @@
+import logging
+import time
+import uuid
+from typing import Optional
+
+from botocore.exceptions import ClientError
+
+from src.domain.entity.sync_lease import LEASE_DONE, LEASE_FAILED, LEASE_RUNNING, SyncLease
+from src.domain.repository.sync_lease_repository import SyncLeaseRepository
+from src.infrastructure.aws.dynamodb_service import DynamoDBService
+
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# Por quanto tempo o item (e o resultado) continua na tabela depois de expirar;
+# a remoção é feita pelo TTL do DynamoDB no atributo `ttl`
+LEASE_RECORD_RETENTION_SECONDS = 24 * 60 * 60
+
+
+def _is_conditional_check_failed(error: ClientError) -> bool:
+    return error.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException"
+
+
+class SyncLeaseRepositoryImpl(SyncLeaseRepository):
+    """
+    Um item por lease (chave: lease_id). A lease é obtida com um put condicional:
+    só grava se não houver item, se a execução anterior terminou ou se ela expirou.
+    As atualizações seguintes são condicionadas ao job_id do dono.
+    """
+
+    def __init__(self, dynamodb_service: DynamoDBService, table_name: str = "sync_leases"):
+        self.dynamodb_service = dynamodb_service
+        self.table_name = table_name
+
+    def acquire(self, lease_id: str, ttl_seconds: int) -> Optional[SyncLease]:
+        now = int(time.time())
+        lease = SyncLease(lease_id=lease_id, job_id=str(uuid.uuid4()), expires_at=now + ttl_seconds)
+        try:
+            self.dynamodb_service.put_item(
+                {**lease.model_dump(exclude_none=True), "ttl": lease.expires_at + LEASE_RECORD_RETENTION_SECONDS},
+                self.table_name,
+                condition_expression="attribute_not_exists(lease_id) OR #status <> :running OR expires_at <= :now",
+                expression_values={":running": LEASE_RUNNING, ":now": now},
+                expression_attribute_names={"#status": "status"},
+            )
+            logger.info(f"Lease {lease_id} obtida pelo job {lease.job_id}")
+            return lease
+
+        except ClientError as e:
+            if _is_conditional_check_failed(e):
+                return None
+            logger.error(f"Erro ao obter lease {lease_id}: {str(e)}")
+            raise
+
+    def get(self, lease_id: str) -> Optional[SyncLease]:
+        try:
+            item = self.dynamodb_service.get_item({"lease_id": lease_id}, self.table_name, consistent_read=True)
+            if not item:
+                return None
+            return SyncLease(
+                lease_id=item["lease_id"],
+                job_id=item["job_id"],
+                status=item.get("status", LEASE_RUNNING),
+                expires_at=int(item["expires_at"]),
+                result=item.get("result"),
+            )
+
+        except Exception as e:
+            logger.error(f"Erro ao buscar lease {lease_id}: {str(e)}")
+            raise
+
+    def complete(self, lease: SyncLease, result: str) -> None:
+        self._finish(lease, LEASE_DONE, result)
+
+    def fail(self, lease: SyncLease) -> None:
+        self._finish(lease, LEASE_FAILED)
+
+    def _finish(self, lease: SyncLease, status: str, result: Optional[str] = None) -> None:
+        values = {"status": status}
+        if result is not None:
+            values["result"] = result
+        try:
+            self.dynamodb_service.update_item(
+                {"lease_id": lease.lease_id},
+                "SET " + ", ".join(f"#{name} = :{name}" for name in values),
+                {**{f":{name}": value for name, value in values.items()}, ":job_id": lease.job_id},
+                self.table_name,
+                expression_attribute_names={f"#{name}": name for name in values},
+                condition_expression="job_id = :job_id",
+            )
+            logger.info(f"Lease {lease.lease_id} liberada pelo job {lease.job_id} ({status})")
+
+        except ClientError as e:
+            if _is_conditional_check_failed(e):
+                # A lease expirou e foi obtida por outra execução: nada a liberar
+                logger.warning(f"Lease {lease.lease_id} não pertence mais ao job {lease.job_id}")
+                return
+            logger.error(f"Erro ao liberar lease {lease.lease_id}: {str(e)}")
+            raise
@@ -0,0 +1 @@
+# Política de novas tentativas com prazo da invocação da Lambda
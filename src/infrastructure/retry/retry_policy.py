@@ -0,0 +1,185 @@
+"""
+Novas tentativas com full jitter e prazo total por invocação.
+
+O prazo vem do contexto da Lambda (`request_deadline`) e vale para todas as
+chamadas feitas durante a invocação, inclusive em outras threads que copiem o
+contexto. Uma nova tentativa só acontece se, depois da espera, ainda sobrar o
+tempo mínimo de uma tentativa (min_attempt_seconds); caso contrário, o último
+erro é levantado na hora, antes do timeout da Lambda. Quem faz a chamada limita
+o timeout de cada tentativa ao prazo com attempt_timeout.
+
+Só erros transitórios são repetidos (is_retryable_error): falhas de rede,
+timeouts, throttling e respostas 5xx. Erros 4xx voltam na primeira tentativa.
+"""
+
+import functools
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+import httpx
+from aws_lambda_powertools.metrics import MetricUnit, single_metric
+from botocore.exceptions import ClientError, ConnectionError as BotoConnectionError, ReadTimeoutError
+
+from src.infrastructure.config.config import config
+
+logger = logging.getLogger(__name__)
+
+ResultT = TypeVar("ResultT")
+
+# Instante (time.monotonic) em que o prazo da invocação atual acaba; None: sem prazo
+_deadline: ContextVar[Optional[float]] = ContextVar("retry_deadline", default=None)
+
+# Códigos de erro da AWS que indicam throttling
+_THROTTLING_ERROR_CODES = (
+    "ProvisionedThroughputExceededException",
+    "ThrottlingException",
+    "Throttling",
+    "RequestLimitExceeded",
+    "RequestThrottled",
+    "SlowDown",
+    "TooManyRequestsException",
+)
+
+
+@contextmanager
+def request_deadline(context: Any, margin_seconds: Optional[float] = None) -> Iterator[None]:
+    """
+    Define o prazo das novas tentativas pelo tempo restante da invocação,
+    descontando `margin_seconds` (padrão: RETRY_DEADLINE_MARGIN_SECONDS) para
+    a resposta. Sem contexto da Lambda (execução local), não há prazo.
+    """
+    get_remaining = getattr(context, "get_remaining_time_in_millis", None)
+    if get_remaining is None:
+        yield
+        return
+    margin = config.RETRY_DEADLINE_MARGIN_SECONDS if margin_seconds is None else margin_seconds
+    token = _deadline.set(time.monotonic() + get_remaining() / 1000 - margin)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """Segundos até o prazo da invocação atual (None quando não há prazo)."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def attempt_timeout(timeout: float) -> float:
+    """
+    `timeout` limitado ao tempo que resta no prazo da invocação, para uma
+    tentativa não passar do timeout da Lambda. Nunca menos que 0.1s.
+    """
+    remaining = remaining_time()
+    if remaining is None:
+        return timeout
+    return max(min(timeout, remaining), 0.1)
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """Falhas de rede, timeouts, throttling (429) e 5xx; erros 4xx não são repetidos."""
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    if isinstance(error, (httpx.TimeoutException, httpx.TransportError)):
+        return True
+    if isinstance(error, ClientError):
+        details = error.response.get("Error", {})
+        status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode") or 0
+        return details.get("Code") in _THROTTLING_ERROR_CODES or status == 429 or status >= 500
+    return isinstance(error, (BotoConnectionError, ReadTimeoutError))
+
+
+class RetryPolicy:
+    """
+    Política de novas tentativas para uma operação.
+
+    Args:
+        operation: Nome da operação (dimensão das métricas e logs)
+        max_attempts: Máximo de tentativas, contando a primeira
+        base_delay: Teto da primeira espera, em segundos; dobra a cada tentativa
+        max_delay: Teto de qualquer espera
+        min_attempt_seconds: Tempo que precisa sobrar no prazo, depois da espera, para
+            valer a pena uma nova tentativa (padrão: RETRY_MIN_ATTEMPT_SECONDS)
+        is_retryable: Decide se um erro é transitório (padrão: is_retryable_error)
+    """
+
+    def __init__(
+        self,
+        operation: str,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 5.0,
+        min_attempt_seconds: Optional[float] = None,
+        is_retryable: Callable[[BaseException], bool] = is_retryable_error,
+    ):
+        self.operation = operation
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.min_attempt_seconds = (
+            config.RETRY_MIN_ATTEMPT_SECONDS if min_attempt_seconds is None else min_attempt_seconds
+        )
+        self.is_retryable = is_retryable
+
+    def call(self, function: Callable[..., ResultT], *args: Any, **kwargs: Any) -> ResultT:
+        attempt = 1
+        while True:
+            try:
+                result = function(*args, **kwargs)
+            except Exception as e:
+                delay = self._next_delay(attempt, e)
+                if delay is None:
+                    self._record(attempt, "failure")
+                    raise
+                logger.warning(
+                    f"{self.operation} falhou (tentativa {attempt}/{self.max_attempts}): {e}; "
+                    f"nova tentativa em {delay:.2f}s"
+                )
+                time.sleep(delay)
+                attempt += 1
+                continue
+            self._record(attempt, "success")
+            return result
+
+    def __call__(self, function: Callable[..., ResultT]) -> Callable[..., ResultT]:
+        """Uso como decorator."""
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> ResultT:
+            return self.call(function, *args, **kwargs)
+
+        return wrapper
+
+    def _next_delay(self, attempt: int, error: Exception) -> Optional[float]:
+        """Espera antes da próxima tentativa, ou None para desistir."""
+        if attempt >= self.max_attempts or not self.is_retryable(error):
+            return None
+        # Full jitter: espera aleatória entre zero e o teto exponencial
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        remaining = remaining_time()
+        if remaining is not None and remaining - delay < self.min_attempt_seconds:
+            logger.warning(f"{self.operation}: sem tempo para nova tentativa ({remaining:.2f}s restantes)")
+            return None
+        return delay
+
+    def _record(self, attempts: int, outcome: str) -> None:
+        try:
+            with single_metric(
+                name="RetryAttempts",
+                unit=MetricUnit.Count,
+                value=attempts,
+                namespace=config.METRICS_NAMESPACE,
+            ) as metric:
+                metric.add_dimension(name="operation", value=self.operation)
+                metric.add_dimension(name="outcome", value=outcome)
+        except Exception as e:
+            # Métrica nunca derruba a operação
+            logger.warning(f"Métrica de tentativas de {self.operation} não registrada: {e}")
@@ -0,0 +1 @@
+# Serialização JSON das respostas da API e das mensagens de fila
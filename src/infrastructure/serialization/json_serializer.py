@@ -0,0 +1,111 @@
+import json
+import logging
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+try:
+    import orjson
+except ImportError:  # dependência opcional
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+JsonSerializer = Callable[[Any], str]
+
+
+def _decimal_to_number(value: Decimal) -> Any:
+    return int(value) if value == value.to_integral_value() else float(value)
+
+
+def _default(obj: Any) -> Any:
+    """Converte tipos que não são JSON nativos (usado pelos modos orjson e stdlib)."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, Decimal):
+        return _decimal_to_number(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Objeto do tipo {type(obj).__name__} não é serializável em JSON")
+
+
+# Tipos que podem conter (ou ser) Decimal; os demais valores passam sem cópia
+_DECIMAL_CARRIERS = frozenset((Decimal, dict, list, tuple))
+
+
+def _without_decimals(obj: Any) -> Any:
+    """
+    Troca Decimals (números lidos pelo boto3) por int/float em dicts, listas e tuplas.
+    O pydantic-core serializa Decimal como texto, e os outros modos como número.
+    Só copia os containers em que algo muda.
+    """
+    kind = type(obj)
+    if kind is Decimal:
+        return _decimal_to_number(obj)
+    if kind is dict:
+        items = iter(obj.items())
+        for key, value in items:
+            if type(value) not in _DECIMAL_CARRIERS:
+                continue
+            converted = _without_decimals(value)
+            if converted is not value:
+                # Primeira mudança: copia o dict e converte só o que falta percorrer
+                result = dict(obj)
+                result[key] = converted
+                for key, value in items:
+                    if type(value) in _DECIMAL_CARRIERS:
+                        result[key] = _without_decimals(value)
+                return result
+        return obj
+    if kind is list or kind is tuple:
+        converted = [_without_decimals(value) for value in obj]
+        if kind is list and all(new is old for new, old in zip(converted, obj)):
+            return obj
+        return converted
+    return obj
+
+
+def dumps_stdlib(obj: Any) -> str:
+    # Acentos sem escape \uXXXX, como nos modos pydantic e orjson
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default)
+
+
+def dumps_pydantic(obj: Any) -> str:
+    # Serializador em Rust do pydantic-core: sempre disponível, entende modelos, UUID e datas
+    return to_json(_without_decimals(obj), fallback=_default).decode("utf-8")
+
+
+def dumps_orjson(obj: Any) -> str:
+    return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
+def get_json_serializer(mode: str = "auto") -> JsonSerializer:
+    """
+    Retorna o serializador JSON para o modo informado.
+
+    Args:
+        mode: "auto" (orjson quando instalado, senão pydantic), "orjson", "pydantic" ou "stdlib"
+
+    Returns:
+        Função que recebe um objeto e devolve o JSON como string
+    """
+    mode = (mode or "auto").lower()
+    if mode in ("auto", "orjson"):
+        if orjson is not None:
+            return dumps_orjson
+        if mode == "orjson":
+            logger.warning("orjson não está instalado, usando serializador do pydantic")
+        return dumps_pydantic
+    if mode == "pydantic":
+        return dumps_pydantic
+    if mode == "stdlib":
+        return dumps_stdlib
+    raise ValueError(f"Modo de serialização JSON desconhecido: {mode}")
@@ -0,0 +1,83 @@
+"""
+Preenche os atributos derivados (chaves dos GSIs) em itens antigos das tabelas
+de certificados, pedidos e produtos, e cria os lookups por e-mail dos participantes.
+
+Com DYNAMODB_ENDPOINT_URL, roda contra um DynamoDB Local.
+
+Uso:
+    python -m src.main.command.backfill_derived_keys [--table certificates ...] [--segments 4]
+        [--checkpoint backfill.json] [--max-writes-per-second 200] [--dry-run]
+"""
+
+import argparse
+import logging
+
+from src.infrastructure.container.dependency_container import container
+from src.infrastructure.repository.derived_keys_backfill import (
+    BACKFILL_PAGE_SIZE,
+    BACKFILL_TOTAL_SEGMENTS,
+    BackfillCheckpoint,
+    DerivedKeysBackfill,
+    derived_keys_targets,
+)
+
+
+def main(argv=None) -> None:
+    dynamodb_service = container.get("dynamodb_service")
+    targets = derived_keys_targets(dynamodb_service)
+
+    parser = argparse.ArgumentParser(description="Preenche os atributos derivados em itens antigos")
+    parser.add_argument(
+        "--table",
+        action="append",
+        dest="tables",
+        choices=sorted(targets),
+        help="Tabela a processar (pode repetir; padrão: todas)",
+    )
+    parser.add_argument(
+        "--segments",
+        type=int,
+        default=BACKFILL_TOTAL_SEGMENTS,
+        help=f"Segmentos do scan paralelo (padrão: {BACKFILL_TOTAL_SEGMENTS})",
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=BACKFILL_PAGE_SIZE,
+        help=f"Itens lidos por chamada do scan (padrão: {BACKFILL_PAGE_SIZE})",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        help="Arquivo JSON de progresso; se já existir, a execução continua de onde parou",
+    )
+    parser.add_argument(
+        "--max-writes-per-second",
+        type=float,
+        help="Teto de itens gravados por segundo (padrão: sem teto)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Só conta os itens que seriam regravados",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    backfill = DerivedKeysBackfill(
+        dynamodb_service,
+        checkpoint=BackfillCheckpoint(args.checkpoint) if args.checkpoint else None,
+        max_writes_per_second=args.max_writes_per_second,
+        page_size=args.page_size,
+        dry_run=args.dry_run,
+    )
+    for table_name in args.tables or sorted(targets):
+        totals = backfill.run(targets[table_name], total_segments=args.segments)
+        print(
+            f"table={table_name} scanned={totals['scanned']} updated={totals['updated']} "
+            f"invalid={totals['invalid']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
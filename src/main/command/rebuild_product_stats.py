@@ -0,0 +1,45 @@
+"""
+Recalcula os contadores de certificados por produto (tabela product_stats)
+a partir de um scan paralelo da tabela de certificados.
+
+Uso:
+    python -m src.main.command.rebuild_product_stats [--segments 8] [--product-id 1678 ...]
+"""
+
+import argparse
+import logging
+
+from src.application.rebuild_product_stats import REBUILD_TOTAL_SEGMENTS, RebuildProductStats
+from src.infrastructure.container.dependency_container import container
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Recalcula os contadores de certificados por produto")
+    parser.add_argument(
+        "--segments",
+        type=int,
+        default=REBUILD_TOTAL_SEGMENTS,
+        help=f"Segmentos do scan paralelo (padrão: {REBUILD_TOTAL_SEGMENTS})",
+    )
+    parser.add_argument(
+        "--product-id",
+        type=int,
+        action="append",
+        dest="product_ids",
+        help="Grava apenas os contadores deste produto (pode repetir)",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    rebuild: RebuildProductStats = container.get("rebuild_product_stats")
+    results = rebuild.execute(total_segments=args.segments, product_ids=args.product_ids)
+    for stats in results.values():
+        print(
+            f"product_id={stats.product_id} total={stats.total} success={stats.success} "
+            f"failed={stats.failed} pending={stats.pending}"
+        )
+
+
+if __name__ == "__main__":
+    main()
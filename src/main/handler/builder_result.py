@@ -0,0 +1,55 @@
+import logging
+from typing import Dict, List, Union
+
+from aws_lambda_powertools.utilities.data_classes import SQSEvent
+from pydantic import TypeAdapter
+
+from src.application.apply_build_results import ApplyBuildResults
+from src.application.dto.apply_build_results_dto import ApplyBuildResultsRequestDto
+from src.domain.response.build_result import BuildResultResponse
+from src.infrastructure.container.dependency_container import container
+
+
+logger = logging.getLogger(__name__)
+
+# Cada mensagem traz um resultado ou uma lista deles (o builder agrupa como as ordens enviadas)
+_MESSAGE_ADAPTER = TypeAdapter(Union[List[BuildResultResponse], BuildResultResponse])
+
+
+def builder_result_handler(event: dict) -> dict:
+    """
+    Processa um lote de mensagens SQS com resultados do builder.
+
+    Todas as mensagens do lote são aplicadas numa única chamada em lote e só as
+    que falharam (corpo inválido ou gravação com erro) voltam em batchItemFailures,
+    para o SQS entregá-las de novo. Exige ReportBatchItemFailures no event source mapping.
+    """
+    sqs_event = SQSEvent(event)
+    failed_message_ids: List[str] = []
+    message_ids_by_order: Dict[int, List[str]] = {}
+    results: List[BuildResultResponse] = []
+
+    for record in sqs_event.records:
+        try:
+            parsed = _MESSAGE_ADAPTER.validate_json(record.body)
+        except Exception as e:
+            logger.error(f"Mensagem {record.message_id} com resultado inválido: {e}")
+            failed_message_ids.append(record.message_id)
+            continue
+        for result in parsed if isinstance(parsed, list) else [parsed]:
+            results.append(result)
+            message_ids_by_order.setdefault(result.order_id, []).append(record.message_id)
+
+    if results:
+        apply_build_results: ApplyBuildResults = container.get('apply_build_results')
+        response = apply_build_results.execute(ApplyBuildResultsRequestDto(results=results))
+        for order_id in response.failed_order_ids:
+            failed_message_ids.extend(message_ids_by_order.get(order_id, []))
+
+    logger.info(f"Lote de resultados processado: {len(sqs_event.raw_event.get('Records', []))} mensagens, "
+                f"{len(set(failed_message_ids))} com falha")
+    return {
+        "batchItemFailures": [
+            {"itemIdentifier": message_id} for message_id in dict.fromkeys(failed_message_ids)
+        ]
+    }
@@ -1,34 +1,65 @@
 import logging
-from typing import List
+from typing import Dict, List, Optional
+
+from pydantic import TypeAdapter
+
 from src.main.presentation.http_types.create_certificate import CreateCertificateRequest
 from src.main.presentation.http_types.create_certificates import CreateCertificatesRequest
 from src.main.presentation.http_types.fetch_certificate import FetchCertificateRequest, FetchCertificateResponse
+from src.main.presentation.http_types.fetch_certificates_batch import (
+    FetchCertificatesBatchRequest,
+    FetchCertificatesBatchResponse,
+)
 from src.main.presentation.http_types.download_certificate import DownloadCertificateRequest, DownloadCertificateResponse
+from src.main.presentation.http_types.export_certificates import ExportCertificatesRequest, ExportCertificatesResponse
+from src.main.presentation.http_types.requeue_failed import RequeueFailedRequest, RequeueFailedResponse
 from src.main.presentation.http_types.list_user_certificates import (
     ListUserCertificatesRequest,
     ListUserCertificatesResponse,
     UserCertificateItemResponse,
 )
-from src.application.dto.fetch_certificate_dto import FetchCertificateRequestDto
+from src.application.dto.fetch_certificate_dto import FetchCertificateRequestDto, FetchCertificateResponseDto
 from src.application.dto.list_user_certificates_dto import ListUserCertificatesRequestDto
+from src.application.dto.fetch_certificates_batch_dto import FetchCertificatesBatchRequestDto
+from src.application.dto.export_certificates_dto import ExportCertificatesRequestDto
+from src.application.dto.requeue_failed_dto import RequeueFailedRequestDto
 from src.domain.response.build_order import BuildOrderResponse
 from src.domain.response.tech_floripa import TechOrdersResponse
 from src.domain.response.processed_orders import ProcessedOrdersResponse
 from src.application.create_certificate import CreateCertificate
+from src.application.product_sync_guard import ProductSyncGuard
 from src.application.send_for_build_certificate import SendForBuildCertificate
 from src.application.fetch_order_tech_floripa import FetchOrderTechFloripa
 from src.application.fetch_certificate import FetchCertificate
 from src.application.download_certificate import DownloadCertificate
 from src.application.list_user_certificates import ListUserCertificates
+from src.application.fetch_certificates_batch import FetchCertificatesBatch
+from src.application.export_product_certificates import ExportProductCertificates
+from src.application.requeue_failed_certificates import RequeueFailedCertificates
 from src.infrastructure.container.dependency_container import container
 
 
 logger = logging.getLogger(__name__)
 
+# Validadores pré-compilados das listas de resposta
+_FETCH_RESPONSES_ADAPTER = TypeAdapter(List[FetchCertificateResponse])
+_USER_CERTIFICATE_ITEMS_ADAPTER = TypeAdapter(List[UserCertificateItemResponse])
+
 
 def create_certificate_handler(request: CreateCertificateRequest) -> BuildOrderResponse:
     logger.info(f"Iniciando processamento de certificados para o product_id: {request.product_id}")
 
+    # Uma execução por produto por vez; chamadas concorrentes recebem o resultado dela
+    # ou SyncInProgress (409) com o job_id da execução em andamento
+    product_sync_guard: ProductSyncGuard = container.get('product_sync_guard')
+    return product_sync_guard.run(
+        request.product_id,
+        lambda: _create_product_certificates(request),
+        BuildOrderResponse,
+    )
+
+
+def _create_product_certificates(request: CreateCertificateRequest) -> BuildOrderResponse:
     create_certificate: CreateCertificate = container.get('create_certificate')
     send_for_build_certificate: SendForBuildCertificate = container.get('send_for_build_certificate')
         
@@ -49,7 +80,7 @@ def create_certificate_handler(request: CreateCertificateRequest) -> BuildOrderR
         
     if len(processed_orders.valid_orders) > 0:
         logger.info(f"Enviando {len(processed_orders.valid_orders)} novas ordens para construção de certificados")
-        send_for_build_certificate.execute(processed_orders.valid_orders)
+        send_for_build_certificate.execute(processed_orders.valid_orders, priority=request.priority)
     else:
         logger.info("Nenhuma ordem nova para enviar para construção de certificados")
    
@@ -68,32 +99,89 @@ def fetch_certificate_handler(request: FetchCertificateRequest) -> List[FetchCer
     application_request = FetchCertificateRequestDto(
         order_id=request.order_id,
         email=request.email,
-        product_id=request.product_id
+        product_id=request.product_id,
+        since=request.since,
+        fields=request.fields
     )
     
     # Executa na camada de aplicação
     fetch_certificate: FetchCertificate = container.get('fetch_certificate')
     application_responses = fetch_certificate.execute(application_request)
     
-    # Converte DTOs da Application para DTOs da Presentation
-    presentation_responses = []
-    for app_response in application_responses:
-        presentation_response = FetchCertificateResponse(
-            id=app_response.id,
-            order_id=app_response.order_id,
-            product_id=app_response.product_id,
-            participant_name=app_response.participant_name,
-            participant_email=app_response.participant_email,
-            participant_document=app_response.participant_document,
-            certificate_url=app_response.certificate_url,
-            created_at=app_response.created_at,
-            updated_at=app_response.updated_at,
-            success=app_response.success,
-            email=app_response.email
-        )
-        presentation_responses.append(presentation_response)
-    
-    return presentation_responses
+    return _to_fetch_responses(application_responses, request.fields)
+
+
+def fetch_certificates_batch_handler(request: FetchCertificatesBatchRequest) -> FetchCertificatesBatchResponse:
+    logger.info(f"Fetching certificates batch: {len(request.order_ids)} order_ids, {len(request.ids)} ids")
+
+    application_request = FetchCertificatesBatchRequestDto(
+        order_ids=request.order_ids,
+        ids=[str(certificate_id) for certificate_id in request.ids],
+        fields=request.fields,
+    )
+
+    fetch_certificates_batch: FetchCertificatesBatch = container.get('fetch_certificates_batch')
+    application_response = fetch_certificates_batch.execute(application_request)
+
+    return FetchCertificatesBatchResponse(
+        by_order_id=_to_fetch_responses_map(application_response.by_order_id, request.fields),
+        by_id=_to_fetch_responses_map(application_response.by_id, request.fields),
+        missing_order_ids=application_response.missing_order_ids,
+        missing_ids=application_response.missing_ids,
+    )
+
+
+def _to_fetch_responses_map(
+    dtos: Dict[str, FetchCertificateResponseDto],
+    fields: Optional[List[str]] = None,
+) -> Dict[str, FetchCertificateResponse]:
+    responses = _to_fetch_responses(list(dtos.values()), fields)
+    return dict(zip(dtos.keys(), responses))
+
+
+def _to_fetch_responses(
+    dtos: List[FetchCertificateResponseDto],
+    fields: Optional[List[str]] = None,
+) -> List[FetchCertificateResponse]:
+    """
+    Converte os DTOs da Application (dicts com os mesmos nomes de campo) nas
+    respostas da Presentation numa única validação: é o único salto validado
+    depois do repositório.
+    """
+    return [response.only(fields) for response in _FETCH_RESPONSES_ADAPTER.validate_python(dtos)]
+
+
+def export_certificates_handler(request: ExportCertificatesRequest) -> ExportCertificatesResponse:
+    logger.info(f"Exporting certificates for request: {request}")
+
+    application_request = ExportCertificatesRequestDto(
+        product_id=request.product_id,
+        format=request.format,
+    )
+
+    export_product_certificates: ExportProductCertificates = container.get('export_product_certificates')
+    application_response = export_product_certificates.execute(application_request)
+
+    return ExportCertificatesResponse(**application_response.model_dump())
+
+
+def requeue_failed_handler(request: RequeueFailedRequest) -> RequeueFailedResponse:
+    logger.info(f"Requeueing failed certificates for request: {request}")
+
+    requeue_failed_certificates: RequeueFailedCertificates = container.get('requeue_failed_certificates')
+    application_response = requeue_failed_certificates.execute(
+        RequeueFailedRequestDto(product_id=request.product_id, limit=request.limit, start_after=request.start_after)
+    )
+
+    return RequeueFailedResponse(
+        product_id=application_response.product_id,
+        requeued=len(application_response.requeued_order_ids),
+        requeued_order_ids=application_response.requeued_order_ids,
+        skipped_order_ids=application_response.skipped_order_ids,
+        messages_sent=application_response.messages_sent,
+        truncated=application_response.truncated,
+        next_start_after=application_response.next_start_after,
+    )
 
 
 def download_certificate_handler(request: DownloadCertificateRequest) -> DownloadCertificateResponse:
@@ -124,6 +212,7 @@ def list_user_certificates_handler(
     application_request = ListUserCertificatesRequestDto(
         email=request.email,
         success=request.success,
+        since=request.since,
     )
 
     list_user_certificates: ListUserCertificates = container.get("list_user_certificates")
@@ -131,21 +220,8 @@ def list_user_certificates_handler(
 
     return ListUserCertificatesResponse(
         email=application_response.email,
-        certificates=[
-            UserCertificateItemResponse(
-                id=item.id,
-                order_id=item.order_id,
-                product_id=item.product_id,
-                participant_name=item.participant_name,
-                participant_email=item.participant_email,
-                participant_document=item.participant_document,
-                certificate_url=item.certificate_url,
-                created_at=item.created_at,
-                updated_at=item.updated_at,
-                success=item.success,
-            )
-            for item in application_response.certificates
-        ],
+        certificates=_USER_CERTIFICATE_ITEMS_ADAPTER.validate_python(application_response.certificates),
+        server_time=application_response.server_time,
     )
 
 
@@ -173,7 +249,7 @@ def create_certificates_handler(request: CreateCertificatesRequest) -> BuildOrde
     # Envia as ordens válidas para construção de certificados
     if len(processed_orders.valid_orders) > 0:
         logger.info(f"Enviando {len(processed_orders.valid_orders)} novas ordens para construção de certificados")
-        send_for_build_certificate.execute(processed_orders.valid_orders)
+        send_for_build_certificate.execute(processed_orders.valid_orders, priority=request.priority)
     else:
         logger.info("Nenhuma ordem nova para enviar para construção de certificados")
 
@@ -0,0 +1,18 @@
+import logging
+
+from src.main.presentation.http_types.product_stats import ProductStatsResponse
+from src.application.dto.product_stats_dto import ProductStatsRequestDto
+from src.application.get_product_stats import GetProductStats
+from src.infrastructure.container.dependency_container import container
+
+
+logger = logging.getLogger(__name__)
+
+
+def product_stats_handler(product_id: int) -> ProductStatsResponse:
+    logger.info(f"Fetching stats for product: {product_id}")
+
+    get_product_stats: GetProductStats = container.get('get_product_stats')
+    application_response = get_product_stats.execute(ProductStatsRequestDto(product_id=product_id))
+
+    return ProductStatsResponse(**application_response.model_dump())
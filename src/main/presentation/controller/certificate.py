@@ -1,5 +1,6 @@
 import logging
-from typing import Annotated, List, Optional
+from datetime import datetime
+from typing import Annotated, List, Literal, Optional, Union
 from urllib.parse import unquote
 
 from aws_lambda_powertools.event_handler.openapi.params import Query
@@ -9,11 +10,23 @@ from aws_lambda_powertools.event_handler import Response
 
 from src.infrastructure.aws.api_gateway_restr_resolver import app
 from src.infrastructure.config.config import config
+from src.infrastructure.aws.file_manager import CERTIFICATE_DOWNLOAD_EXPIRES_IN
 
 from src.main.presentation.http_types.create_certificate import CreateCertificateRequest
 from src.main.presentation.http_types.create_certificates import CreateCertificatesRequest
-from src.main.presentation.http_types.fetch_certificate import FetchCertificateRequest, FetchCertificateResponse
+from src.main.presentation.http_types.fetch_certificate import (
+    FetchCertificateRequest,
+    FetchCertificateResponse,
+    FieldsParam,
+    split_fields,
+)
+from src.main.presentation.http_types.fetch_certificates_batch import (
+    FetchCertificatesBatchRequest,
+    FetchCertificatesBatchResponse,
+)
 from src.main.presentation.http_types.download_certificate import DownloadCertificateRequest, DownloadCertificateResponse
+from src.main.presentation.http_types.export_certificates import ExportCertificatesRequest, ExportCertificatesResponse
+from src.main.presentation.http_types.requeue_failed import RequeueFailedRequest, RequeueFailedResponse
 from src.main.presentation.http_types.list_user_certificates import (
     ListUserCertificatesRequest,
     ListUserCertificatesResponse,
@@ -22,24 +35,43 @@ from src.main.handler.certificate import (
     create_certificate_handler,
     create_certificates_handler,
     fetch_certificate_handler,
+    fetch_certificates_batch_handler,
     download_certificate_handler,
+    export_certificates_handler,
+    requeue_failed_handler,
     list_user_certificates_handler,
 )
 from src.main.presentation.template_loader import template_loader
+from src.application.delta_polling import next_poll_time
 from src.domain.response.build_order import BuildOrderResponse
 from src.domain.response.failed import FailedResponse
+from src.domain.response.sync_in_progress import SyncInProgressResponse
 from src.domain.exception.certificate_not_found import CertificateNotFound
+from src.domain.exception.sync_in_progress import SyncInProgress
 
 
 logger = logging.getLogger(__name__)
 
 
 @app.post(f"{config.PREFIX_API_VERSION}/certificate/create")
-def create_certificate() -> BuildOrderResponse: 
+def create_certificate() -> Union[BuildOrderResponse, SyncInProgressResponse, FailedResponse]:
     try:
-        request: CreateCertificateRequest = parse(app.current_event.body, CreateCertificateRequest)        
+        request: CreateCertificateRequest = parse(app.current_event.decoded_body, CreateCertificateRequest)        
         response: BuildOrderResponse = create_certificate_handler(request)
         return response
+    except SyncInProgress as e:
+        logger.info(str(e))
+        return Response(
+            status_code=409,
+            content_type="application/json",
+            body=SyncInProgressResponse(
+                status=409,
+                message=e.message,
+                details=str(e),
+                product_id=e.product_id,
+                job_id=e.job_id,
+            ),
+        )
     except Exception as e:
         logger.error(f"Erro ao processar a requisição: {e}")
         return FailedResponse(
@@ -56,7 +88,7 @@ def create_certificates() -> BuildOrderResponse:
     Recebe uma lista de objetos de certificado e processa cada um deles.
     """
     try:
-        request: CreateCertificatesRequest = parse(app.current_event.body, CreateCertificatesRequest)
+        request: CreateCertificatesRequest = parse(app.current_event.decoded_body, CreateCertificatesRequest)
         response: BuildOrderResponse = create_certificates_handler(request)
         return response
     except Exception as e:
@@ -72,7 +104,9 @@ def create_certificates() -> BuildOrderResponse:
 def fetch_certificate(
     order_id: Annotated[Optional[int], Query(ge=1)] = None,
     email: Annotated[Optional[str], Query(min_length=1, max_length=255)] = None,
-    product_id: Annotated[Optional[int], Query(ge=1)] = None
+    product_id: Annotated[Optional[int], Query(ge=1)] = None,
+    since: Annotated[Optional[datetime], Query(description="Retorna apenas certificados alterados depois deste instante (ISO 8601)")] = None,
+    fields: Annotated[Optional[List[FieldsParam]], Query(description="Campos da resposta, separados por vírgula")] = None,
 ) -> List[FetchCertificateResponse]:
     """
     Endpoint unificado para busca de certificados.
@@ -83,14 +117,28 @@ def fetch_certificate(
     - email: Busca certificados por email do participante
     - product_id: Busca certificados por ID do produto
     - email + product_id: Busca específica por email e produto
+    - since: Com email ou product_id isolados, retorna só o que mudou; o header
+      X-Server-Time traz o valor para a próxima consulta
+    - fields: Limita os campos retornados (e os atributos lidos do DynamoDB)
     """
     try:
         request: FetchCertificateRequest = FetchCertificateRequest(
             order_id=order_id,
             email=email,
-            product_id=product_id
+            product_id=product_id,
+            since=since,
+            fields=split_fields(fields)
         )
+        # Obtido antes da consulta para não perder alterações feitas durante ela
+        server_time = next_poll_time()
         response: List[FetchCertificateResponse] = fetch_certificate_handler(request)
+        if since is not None:
+            return Response(
+                status_code=200,
+                content_type="application/json",
+                body=response,
+                headers={"X-Server-Time": server_time},
+            )
         return response
     except Exception as e:
         if isinstance(e, CertificateNotFound):
@@ -109,9 +157,88 @@ def fetch_certificate(
         
 
 
+@app.post(f"{config.PREFIX_API_VERSION}/certificate/fetch-batch")
+def fetch_certificates_batch() -> Union[FetchCertificatesBatchResponse, FailedResponse]:
+    """
+    Busca vários certificados de uma vez por order_ids e/ou ids (UUID).
+    Retorna mapas chave -> certificado e lista explicitamente as chaves não encontradas.
+    """
+    try:
+        request: FetchCertificatesBatchRequest = parse(app.current_event.decoded_body, FetchCertificatesBatchRequest)
+    except Exception as e:
+        return FailedResponse(details=str(e), message="Bad Request", status=400)
+
+    total_keys = len(request.order_ids) + len(request.ids)
+    if total_keys == 0 or total_keys > config.FETCH_BATCH_MAX_KEYS:
+        return FailedResponse(
+            details=f"Informe entre 1 e {config.FETCH_BATCH_MAX_KEYS} chaves (order_ids + ids); recebidas: {total_keys}",
+            message="Bad Request",
+            status=400
+        )
+
+    try:
+        return fetch_certificates_batch_handler(request)
+    except Exception as e:
+        logger.error(f"Erro ao processar a busca de certificados em lote: {e}")
+        return FailedResponse(
+            details=str(e),
+            message="Internal Server Error",
+            status=500
+        )
+
+
+@app.post(f"{config.PREFIX_API_VERSION}/certificate/requeue-failed")
+def requeue_failed() -> Union[RequeueFailedResponse, FailedResponse]:
+    """
+    Reenvia ao builder os certificados sem sucesso (opcionalmente de um produto),
+    até REQUEUE_MAX_CERTIFICATES por chamada. Body opcional: {"product_id": 1678, "limit": 500}
+    Se a resposta vier com truncated, envie o next_start_after recebido como
+    "start_after" para continuar de onde a chamada parou.
+    """
+    try:
+        body = app.current_event.decoded_body
+        request: RequeueFailedRequest = parse(body, RequeueFailedRequest) if body else RequeueFailedRequest()
+    except Exception as e:
+        return FailedResponse(details=str(e), message="Bad Request", status=400)
+
+    try:
+        return requeue_failed_handler(request)
+    except ValueError as e:
+        # Cursor start_after inválido ou de outro índice
+        return FailedResponse(details=str(e), message="Bad Request", status=400)
+    except Exception as e:
+        logger.error(f"Erro ao reenviar certificados sem sucesso: {e}")
+        return FailedResponse(
+            details=str(e),
+            message="Internal Server Error",
+            status=500
+        )
+
+
+@app.get(f"{config.PREFIX_API_VERSION}/certificate/export")
+def export_certificates(
+    product_id: Annotated[int, Query(ge=1, description="ID do produto")],
+    format: Annotated[Literal["ndjson", "csv"], Query(description="Formato do arquivo (ndjson ou csv)")] = "ndjson",
+) -> Union[ExportCertificatesResponse, FailedResponse]:
+    """
+    Exporta todos os certificados de um produto para um arquivo gzip no S3.
+    Retorna um link pré-assinado (attachment) para download do arquivo.
+    """
+    try:
+        return export_certificates_handler(ExportCertificatesRequest(product_id=product_id, format=format))
+    except Exception as e:
+        logger.error(f"Erro ao exportar certificados do produto {product_id}: {e}")
+        return FailedResponse(
+            details=str(e),
+            message="Internal Server Error",
+            status=500
+        )
+
+
 @app.get(f"{config.PREFIX_API_VERSION}/certificate/download")
 def download_certificate(
-    id: Annotated[str, Query(description="UUID do certificado")]
+    id: Annotated[str, Query(description="UUID do certificado")],
+    redirect: Annotated[Optional[bool], Query(description="Redireciona (302) direto para a URL do S3")] = None,
 ):
     try:
         import uuid
@@ -121,6 +248,17 @@ def download_certificate(
             DownloadCertificateRequest(id=certificate_id)
         )
         
+        redirect_mode = config.DOWNLOAD_REDIRECT_MODE if redirect is None else redirect
+        if redirect_mode and response.success and response.certificate_url:
+            # Evita renderizar template: o navegador segue direto para a URL pré-assinada
+            return Response(
+                status_code=302,
+                headers={
+                    "Location": response.certificate_url,
+                    "Cache-Control": f"private, max-age={_redirect_max_age()}",
+                },
+            )
+
         if response.success:
             html_content = template_loader.load_template(
                 "certificate_download.html",
@@ -132,46 +270,57 @@ def download_certificate(
                 body=html_content
             )
         else:
-            html_content = template_loader.load_template("certificate_not_generated.html")
-            return Response(
-                status_code=200,
-                content_type="text/html",
-                body=html_content
-            )
+            return _static_page("certificate_not_generated.html", status_code=200)
         
     except ValueError:
-        html_content = template_loader.load_template("certificate_uuid_invalid.html")
-        return Response(
-            status_code=404,
-            content_type="text/html",
-            body=html_content
-        )
+        return _static_page("certificate_uuid_invalid.html", status_code=404)
     except CertificateNotFound:
-        html_content = template_loader.load_template("certificate_not_found.html")
-        return Response(
-            status_code=404,
-            content_type="text/html",
-            body=html_content
-        )
+        return _static_page("certificate_not_found.html", status_code=404)
     except Exception as e:
         logger.error(f"Erro ao processar a requisição: {e}")
-        html_content = template_loader.load_template("server_error.html")
+        return _static_page("server_error.html", status_code=500)
+
+
+def _static_page(template_name: str, status_code: int) -> Response:
+    """
+    Responde uma página estática pré-renderizada.
+    Usa a versão pré-comprimida quando o cliente aceita gzip.
+    """
+    accept_encoding = app.current_event.headers.get("accept-encoding") or ""
+    if "gzip" in accept_encoding and template_loader.has_gzip(template_name):
         return Response(
-            status_code=500,
+            status_code=status_code,
             content_type="text/html",
-            body=html_content
+            body=template_loader.load_static_bytes(template_name, gzipped=True),
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
         )
+    return Response(
+        status_code=status_code,
+        content_type="text/html",
+        body=template_loader.load_template(template_name),
+    )
+
+
+def _redirect_max_age() -> int:
+    """
+    Tempo pelo qual o navegador pode reaproveitar o redirecionamento.
+    Uma URL entregue pelo cache do FileManager ainda vale, no mínimo,
+    a fração da validade que não é reaproveitada.
+    """
+    return int(CERTIFICATE_DOWNLOAD_EXPIRES_IN * (1 - config.PRESIGNED_URL_REUSE_FRACTION))
 
 
 @app.get(f"{config.PREFIX_API_VERSION}/users/<email>/certificates")
 def list_user_certificates(
     email: str,
     success: Annotated[Optional[bool], Query()] = None,
+    since: Annotated[Optional[datetime], Query(description="Retorna apenas certificados alterados depois deste instante (ISO 8601)")] = None,
 ) -> ListUserCertificatesResponse:
     try:
         request = ListUserCertificatesRequest(
             email=unquote(email),
             success=success,
+            since=since,
         )
         response = list_user_certificates_handler(request)
         return response
@@ -0,0 +1,29 @@
+import logging
+from typing import Union
+
+from src.infrastructure.aws.api_gateway_restr_resolver import app
+from src.infrastructure.config.config import config
+
+from src.main.presentation.http_types.product_stats import ProductStatsResponse
+from src.main.handler.product import product_stats_handler
+from src.domain.response.failed import FailedResponse
+
+
+logger = logging.getLogger(__name__)
+
+
+@app.get(f"{config.PREFIX_API_VERSION}/products/<product_id>/stats")
+def product_stats(product_id: int) -> Union[ProductStatsResponse, FailedResponse]:
+    """
+    Contadores de certificados do produto (total, success, failed, pending),
+    mantidos a cada gravação de certificado e lidos com um único GetItem.
+    """
+    try:
+        return product_stats_handler(product_id)
+    except Exception as e:
+        logger.error(f"Erro ao buscar estatísticas do produto {product_id}: {e}")
+        return FailedResponse(
+            details=str(e),
+            message="Internal Server Error",
+            status=500
+        )
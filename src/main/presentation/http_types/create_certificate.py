@@ -1,8 +1,12 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 
 class CreateCertificateRequest(BaseModel):
     product_id: str
+    # Fila prioritária do builder; sem valor, decide pela quantidade de pedidos
+    priority: Optional[bool] = None
     
 
 
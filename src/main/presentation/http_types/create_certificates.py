@@ -25,4 +25,6 @@ class CertificateItemRequest(BaseModel):
 class CreateCertificatesRequest(BaseModel):
     """Request para criação de múltiplos certificados"""
     certificates: List[CertificateItemRequest]
+    # Fila prioritária do builder; sem valor, decide pela quantidade de pedidos
+    priority: Optional[bool] = None
 
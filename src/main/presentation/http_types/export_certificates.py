@@ -0,0 +1,17 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class ExportCertificatesRequest(BaseModel):
+    product_id: int = Field(..., ge=1)
+    format: Literal["ndjson", "csv"] = "ndjson"
+
+
+class ExportCertificatesResponse(BaseModel):
+    product_id: int
+    format: str
+    key: str
+    download_url: str
+    expires_in: int
+    total: int
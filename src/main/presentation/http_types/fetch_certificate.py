@@ -1,11 +1,14 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from datetime import datetime
+from pydantic import BaseModel, Field, PrivateAttr, SerializerFunctionWrapHandler, StringConstraints, model_serializer
+from typing import Annotated, Iterable, List, Optional
 import uuid
 
 class FetchCertificateRequest(BaseModel):
     order_id: Optional[int] = None
     product_id: Optional[int] = None
     email: Optional[str] = None
+    since: Optional[datetime] = None
+    fields: Optional[List[str]] = None
 
 
 class FetchCertificateResponse(BaseModel):
@@ -26,4 +29,34 @@ class FetchCertificateResponse(BaseModel):
     email: Optional[str] = None
     product_name: Optional[str] = None
     generated_date: Optional[str] = None
-    time_checkin: Optional[str] = None
\ No newline at end of file
+    time_checkin: Optional[str] = None
+
+    # Campos pedidos via `fields=`; None serializa todos
+    _fields: Optional[frozenset] = PrivateAttr(default=None)
+
+    def only(self, fields: Optional[Iterable[str]]) -> "FetchCertificateResponse":
+        self._fields = frozenset(fields) if fields else None
+        return self
+
+    @model_serializer(mode="wrap")
+    def _serialize_sparse(self, handler: SerializerFunctionWrapHandler):
+        data = handler(self)
+        if self._fields is None:
+            return data
+        return {name: value for name, value in data.items() if name in self._fields}
+
+
+# Nomes aceitos em `fields=`, separados por vírgula
+FETCH_RESPONSE_FIELDS = tuple(FetchCertificateResponse.model_fields)
+FETCH_FIELDS_PATTERN = rf"^({'|'.join(FETCH_RESPONSE_FIELDS)})(,({'|'.join(FETCH_RESPONSE_FIELDS)}))*$"
+FieldsParam = Annotated[str, StringConstraints(pattern=FETCH_FIELDS_PATTERN)]
+
+
+def split_fields(values: Optional[List[str]]) -> Optional[List[str]]:
+    """
+    Junta `fields=a,b` e `fields=a&fields=b` numa lista sem repetições.
+    Sem multiValueQueryStringParameters o Powertools já separa pelas vírgulas.
+    """
+    if not values:
+        return None
+    return list(dict.fromkeys(field for value in values for field in value.split(",") if field)) or None
@@ -0,0 +1,31 @@
+from typing import Dict, List, Optional
+import uuid
+
+from pydantic import BaseModel, Field, field_validator
+
+from src.main.presentation.http_types.fetch_certificate import FETCH_RESPONSE_FIELDS, FetchCertificateResponse
+
+
+class FetchCertificatesBatchRequest(BaseModel):
+    order_ids: List[int] = Field(default_factory=list)
+    ids: List[uuid.UUID] = Field(default_factory=list)
+    # Campos de FetchCertificateResponse a retornar (None = todos)
+    fields: Optional[List[str]] = None
+
+    @field_validator("fields")
+    @classmethod
+    def _validate_fields(cls, fields: Optional[List[str]]) -> Optional[List[str]]:
+        if fields is None:
+            return None
+        unknown = [field for field in fields if field not in FETCH_RESPONSE_FIELDS]
+        if unknown:
+            raise ValueError(f"Campos desconhecidos: {', '.join(unknown)}")
+        return list(dict.fromkeys(fields)) or None
+
+
+class FetchCertificatesBatchResponse(BaseModel):
+    # Chaves do JSON são sempre strings: order_id ou UUID do certificado
+    by_order_id: Dict[str, FetchCertificateResponse]
+    by_id: Dict[str, FetchCertificateResponse]
+    missing_order_ids: List[int]
+    missing_ids: List[uuid.UUID]
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Optional
 import uuid
 
@@ -7,6 +8,7 @@ from pydantic import BaseModel
 class ListUserCertificatesRequest(BaseModel):
     email: str
     success: Optional[bool] = None
+    since: Optional[datetime] = None
 
 
 class UserCertificateItemResponse(BaseModel):
@@ -25,3 +27,5 @@ class UserCertificateItemResponse(BaseModel):
 class ListUserCertificatesResponse(BaseModel):
     email: str
     certificates: list[UserCertificateItemResponse]
+    # Valor a enviar como `since` na próxima consulta
+    server_time: Optional[str] = None
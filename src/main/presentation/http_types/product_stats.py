@@ -0,0 +1,12 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ProductStatsResponse(BaseModel):
+    product_id: int
+    total: int
+    success: int
+    failed: int
+    pending: int
+    updated_at: Optional[str] = None
@@ -0,0 +1,21 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class RequeueFailedRequest(BaseModel):
+    # Sem product_id, reenvia certificados sem sucesso de todos os produtos
+    product_id: Optional[int] = Field(default=None, ge=1)
+    limit: Optional[int] = Field(default=None, ge=1)
+    # next_start_after de uma chamada anterior, para continuar dali
+    start_after: Optional[str] = None
+
+
+class RequeueFailedResponse(BaseModel):
+    product_id: Optional[int] = None
+    requeued: int
+    requeued_order_ids: List[int]
+    skipped_order_ids: List[int] = Field(default_factory=list)
+    messages_sent: int
+    truncated: bool
+    next_start_after: Optional[str] = None
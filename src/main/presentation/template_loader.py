@@ -1,19 +1,131 @@
-import os
+import gzip
+import html
+import json
+import re
 from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+# Placeholders no formato {{ nome }} ou {{ nome|filtro }}; chaves simples (CSS/JS) são texto literal
+_PLACEHOLDER = re.compile(r"\{\{\s*(\w+)\s*(?:\|\s*(\w+)\s*)?\}\}")
+
+
+def _escape_html(value: object) -> str:
+    return html.escape(str(value), quote=True)
+
+
+def _escape_js(value: object) -> str:
+    # Literal de string JS seguro dentro de <script>
+    return (
+        json.dumps(str(value))
+        .replace("<", "\\u003c")
+        .replace(">", "\\u003e")
+        .replace("&", "\\u0026")
+    )
+
+
+_FILTERS: Dict[str, Callable[[object], str]] = {
+    "html": _escape_html,
+    "js": _escape_js,
+}
+
+_Part = Union[str, Tuple[str, Callable[[object], str]]]
+
+
+class CompiledTemplate:
+    """
+    Template pré-compilado: o conteúdo é dividido uma única vez em trechos
+    literais e substituições, e cada valor é escapado conforme o filtro
+    (html por padrão, js para uso dentro de <script>).
+    """
+
+    def __init__(self, name: str, content: str):
+        self.name = name
+        self.parts: List[_Part] = []
+        position = 0
+        for match in _PLACEHOLDER.finditer(content):
+            if match.start() > position:
+                self.parts.append(content[position:match.start()])
+            filter_name = match.group(2) or "html"
+            if filter_name not in _FILTERS:
+                raise ValueError(f"Filtro '{filter_name}' desconhecido no template {name}")
+            self.parts.append((match.group(1), _FILTERS[filter_name]))
+            position = match.end()
+        if position < len(content):
+            self.parts.append(content[position:])
+
+    @property
+    def is_static(self) -> bool:
+        return all(isinstance(part, str) for part in self.parts)
+
+    def render(self, **kwargs) -> str:
+        rendered = []
+        for part in self.parts:
+            if isinstance(part, str):
+                rendered.append(part)
+            else:
+                name, escape = part
+                if name not in kwargs:
+                    raise KeyError(f"Variável '{name}' não informada para o template {self.name}")
+                rendered.append(escape(kwargs[name]))
+        return "".join(rendered)
+
 
 class TemplateLoader:
-    def __init__(self):
-        self.template_dir = Path(__file__).parent / "templates"
-    
+    """
+    Carrega e compila todos os templates de `templates/` uma única vez.
+    Páginas estáticas ficam pré-renderizadas em bytes (e opcionalmente em gzip),
+    sem acesso a disco durante as requisições.
+    """
+
+    def __init__(self, template_dir: Optional[Path] = None, pregzip: bool = True):
+        self.template_dir = template_dir or Path(__file__).parent / "templates"
+        self._templates: Dict[str, CompiledTemplate] = {}
+        self._static_bytes: Dict[str, bytes] = {}
+        self._static_gzip: Dict[str, bytes] = {}
+
+        for template_path in sorted(self.template_dir.glob("*.html")):
+            content = template_path.read_text(encoding="utf-8")
+            template = CompiledTemplate(template_path.name, content)
+            self._templates[template_path.name] = template
+
+            if template.is_static:
+                body = content.encode("utf-8")
+                self._static_bytes[template_path.name] = body
+                if pregzip:
+                    self._static_gzip[template_path.name] = gzip.compress(body, compresslevel=9, mtime=0)
+
     def load_template(self, template_name: str, **kwargs) -> str:
-        template_path = self.template_dir / template_name
-        
-        if not template_path.exists():
+        return self._get(template_name).render(**kwargs)
+
+    def is_static(self, template_name: str) -> bool:
+        return template_name in self._static_bytes
+
+    def load_static_bytes(self, template_name: str, gzipped: bool = False) -> bytes:
+        """
+        Retorna o corpo pré-renderizado de um template estático.
+
+        Args:
+            template_name: Nome do template
+            gzipped: Quando True, retorna a versão pré-comprimida em gzip
+
+        Raises:
+            ValueError: Se o template possuir variáveis
+        """
+        self._get(template_name)
+        if not self.is_static(template_name):
+            raise ValueError(f"Template {template_name} não é estático")
+        if gzipped and template_name in self._static_gzip:
+            return self._static_gzip[template_name]
+        return self._static_bytes[template_name]
+
+    def has_gzip(self, template_name: str) -> bool:
+        return template_name in self._static_gzip
+
+    def _get(self, template_name: str) -> CompiledTemplate:
+        template = self._templates.get(template_name)
+        if template is None:
             raise FileNotFoundError(f"Template {template_name} não encontrado")
-        
-        with open(template_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-        
-        return content.format(**kwargs)
+        return template
+
 
 template_loader = TemplateLoader()
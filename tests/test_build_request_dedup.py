@@ -0,0 +1,138 @@
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("REGION", "us-east-1")
+os.environ.setdefault("BUILDER_QUEUE_URL", "https://example.com/queue")
+os.environ.setdefault("S3_BUCKET_NAME", "bucket")
+os.environ.setdefault("URL_SERVICE_TECH", "https://example.com")
+
+from src.application import create_certificate as create_certificate_module
+from src.application.create_certificate import CreateCertificate
+from src.application.send_for_build_certificate import SendForBuildCertificate
+from src.domain.entity.certificate import Certificate
+from src.domain.response.tech_floripa import TechOrdersResponse
+from src.infrastructure.aws import sqs_service as sqs_service_module
+from src.infrastructure.serialization.json_serializer import dumps_stdlib
+
+
+def _order(order_id):
+    return TechOrdersResponse(
+        order_id=order_id, first_name="User", last_name="Test", email=f"user{order_id}@example.com",
+        phone="000", cpf="000", city="Florianópolis", product_id=100, product_name="Curso",
+        certificate_details="Detalhes", certificate_logo="logo.png", certificate_background="background.png",
+        order_date="2025-01-01 10:00:00", checkin_latitude="0", checkin_longitude="0", time_checkin="10:00",
+    )
+
+
+def _requested(minutes_ago):
+    moment = datetime.now(timezone.utc) - timedelta(minutes=minutes_ago)
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+class FakeCertificateRepository:
+    def __init__(self, certificates=None):
+        self.certificates = dict(certificates or {})
+
+    def get_by_order_ids(self, order_ids, projection=None):
+        return {order_id: self.certificates[order_id] for order_id in order_ids if order_id in self.certificates}
+
+    def create(self, entity):
+        self.certificates[entity.order_id] = entity
+        return entity
+
+    def mark_build_requested(self, order_ids, requested_at):
+        for order_id in order_ids:
+            self.certificates[order_id].build_requested_at = requested_at.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+class FakeRepository:
+    """Participantes, produtos e pedidos: tudo já cadastrado."""
+
+    def get_by_emails(self, emails):
+        return {email: object() for email in emails}
+
+    def get_by_id(self, entity_id):
+        return object()
+
+
+class FakeCertifiedOrdersRepository:
+    def get(self, product_id):
+        return set()
+
+    def add(self, product_id, order_ids):
+        pass
+
+
+class FakeSQSService:
+    def __init__(self):
+        self.messages = []
+
+    def send_message(self, messagens, queue_url=None):
+        self.messages.append(messagens)
+
+
+class BuildRequestDedupTestCase(unittest.TestCase):
+    def _create_certificate(self, certificate_repository):
+        repositories = {
+            "certificate_repository": certificate_repository,
+            "participant_repository": FakeRepository(),
+            "product_repository": FakeRepository(),
+            "order_repository": FakeRepository(),
+            "certified_orders_repository": FakeCertifiedOrdersRepository(),
+        }
+        with mock.patch.object(create_certificate_module.container, "get", side_effect=repositories.__getitem__):
+            return CreateCertificate()
+
+    def test_skips_orders_recently_sent_to_build(self):
+        certificate_repository = FakeCertificateRepository({
+            1: Certificate.model_construct(order_id=1, success=False, build_requested_at=_requested(1)),
+            2: Certificate.model_construct(order_id=2, success=False, build_requested_at=_requested(60)),
+            3: Certificate.model_construct(order_id=3, success=False, build_requested_at=None),
+        })
+        use_case = self._create_certificate(certificate_repository)
+
+        response = use_case.execute([_order(1), _order(2), _order(3)])
+
+        self.assertEqual([order.order_id for order in response.valid_orders], [2, 3])
+
+    def test_orders_sent_to_build_are_skipped_until_the_window_passes(self):
+        certificate_repository = FakeCertificateRepository()
+        use_case = self._create_certificate(certificate_repository)
+        sqs_service = FakeSQSService()
+        send_for_build = SendForBuildCertificate(sqs_service, certificate_repository)
+
+        first = use_case.execute([_order(1), _order(2)])
+        send_for_build.execute(first.valid_orders)
+        second = use_case.execute([_order(1), _order(2), _order(3)])
+
+        self.assertEqual([order.order_id for order in first.valid_orders], [1, 2])
+        self.assertEqual([order.order_id for order in second.valid_orders], [3])
+        self.assertIsNotNone(certificate_repository.certificates[1].build_requested_at)
+
+        with mock.patch.object(create_certificate_module.config, "BUILD_REQUEST_SKIP_SECONDS", 0):
+            third = use_case.execute([_order(1)])
+        self.assertEqual([order.order_id for order in third.valid_orders], [1])
+
+    def test_fifo_queue_sets_group_and_deduplication_ids(self):
+        service = sqs_service_module.SQSService.__new__(sqs_service_module.SQSService)
+        service.aws = mock.Mock(**{"send_message_batch.return_value": {"Successful": [{"Id": "1"}, {"Id": "2"}]}})
+        service.queue_url = "https://example.com/queue.fifo"
+        service.serializer = dumps_stdlib
+
+        service.send_message_batch([
+            [{"order_id": 2, "product_id": 100}, {"order_id": 1, "product_id": 100}],
+            [{"order_id": 1, "product_id": 100}, {"order_id": 2, "product_id": 100}],
+        ])
+
+        first, second = service.aws.send_message_batch.call_args.kwargs["Entries"]
+        self.assertEqual(first["MessageGroupId"], "product-100")
+        self.assertEqual(first["MessageDeduplicationId"], second["MessageDeduplicationId"])
+
+
+if __name__ == "__main__":
+    unittest.main()
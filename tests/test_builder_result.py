@@ -0,0 +1,122 @@
+import json
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("REGION", "us-east-1")
+os.environ.setdefault("BUILDER_QUEUE_URL", "https://example.com/queue")
+os.environ.setdefault("S3_BUCKET_NAME", "bucket")
+os.environ.setdefault("URL_SERVICE_TECH", "https://example.com")
+
+from src.application.dto.apply_build_results_dto import ApplyBuildResultsResponseDto
+from src.domain.response.build_result import (
+    BUILD_RESULT_FAILED,
+    BUILD_RESULT_MISSING,
+    BUILD_RESULT_UPDATED,
+    BuildResultResponse,
+)
+from src.infrastructure.repository.certificate_repository_impl import CertificateRepositoryImpl
+from src.main.handler import builder_result as builder_result_module
+
+
+class FakeDynamoDBService:
+    def __init__(self, items):
+        self.items = {item["order_id"]: item for item in items}
+        self.updates = []
+
+    def batch_get_items(self, keys, table_name, projection=None):
+        return [self.items[key["order_id"]] for key in keys if key["order_id"] in self.items]
+
+    def update_item(self, key, update_expression, expression_values, table_name,
+                    expression_attribute_names=None, condition_expression=None):
+        self.updates.append((key["order_id"], update_expression, expression_values, condition_expression))
+        if key["order_id"] == 2:
+            raise RuntimeError("ConditionalCheckFailedException")
+        item = dict(self.items[key["order_id"]])
+        item.update({name[1:]: value for name, value in expression_values.items() if name != ":expected_updated_at"})
+        return {"Attributes": item}
+
+    def _convert_from_dynamodb_format(self, item):
+        return item
+
+
+class FakeStatsRepository:
+    def __init__(self):
+        self.increments = []
+
+    def increment(self, product_id, deltas):
+        self.increments.append((product_id, deltas))
+
+
+class ApplyBuildResultsTestCase(unittest.TestCase):
+    def test_applies_results_with_conditional_updates(self):
+        service = FakeDynamoDBService([
+            {"order_id": 1, "product_id": 100, "participant_email": "a@example.com", "success": False},
+            {"order_id": 2, "product_id": 100, "participant_email": "b@example.com", "success": False,
+             "updated_at": "2025-01-20T10:00:00.000000Z"},
+            {"order_id": 4, "product_id": 100, "participant_email": "c@example.com", "success": False},
+        ])
+        stats_repository = FakeStatsRepository()
+        repository = CertificateRepositoryImpl(service, stats_repository=stats_repository)
+
+        outcome = repository.apply_build_results([
+            BuildResultResponse(order_id=1, success=True, certificate_key="k1", generated_date="2025-01-20T10:30:45"),
+            BuildResultResponse(order_id=2, success=True, certificate_key="k2"),
+            BuildResultResponse(order_id=3, success=True),
+            BuildResultResponse(order_id=4, success=True, generated_date="2025-01-20T10:31:00"),
+        ])
+
+        self.assertEqual(outcome, {
+            1: BUILD_RESULT_UPDATED,
+            2: BUILD_RESULT_FAILED,
+            3: BUILD_RESULT_MISSING,
+            4: BUILD_RESULT_UPDATED,
+        })
+        conditions = {order_id: condition for order_id, _, _, condition in service.updates}
+        self.assertIn("attribute_not_exists(#updated_at)", conditions[1])
+        self.assertIn("#updated_at = :expected_updated_at", conditions[2])
+        values = {order_id: values for order_id, _, values, _ in service.updates}
+        self.assertEqual(values[1][":participant_email_success_key"], "a@example.com#1")
+        self.assertNotIn(":certificate_url", values[1])
+        # Contadores somados: uma única atualização por produto
+        self.assertEqual(stats_repository.increments, [(100, {"total": 0, "pending": -2, "success": 2})])
+
+
+class FakeApplyBuildResults:
+    def __init__(self, failed_order_ids):
+        self.failed_order_ids = failed_order_ids
+        self.requests = []
+
+    def execute(self, request):
+        self.requests.append(request)
+        return ApplyBuildResultsResponseDto(failed_order_ids=self.failed_order_ids)
+
+
+def _record(message_id, body):
+    return {"messageId": message_id, "body": body, "receiptHandle": message_id, "attributes": {}}
+
+
+class BuilderResultHandlerTestCase(unittest.TestCase):
+    def test_reports_only_failed_messages(self):
+        use_case = FakeApplyBuildResults(failed_order_ids=[2])
+        event = {"Records": [
+            _record("m1", json.dumps({"order_id": 1, "success": True})),
+            _record("m2", json.dumps([{"order_id": 2, "success": True}, {"order_id": 3, "success": False}])),
+            _record("m3", "not json"),
+        ]}
+
+        with mock.patch.object(builder_result_module.container, "get", return_value=use_case):
+            response = builder_result_module.builder_result_handler(event)
+
+        self.assertEqual(
+            response,
+            {"batchItemFailures": [{"itemIdentifier": "m3"}, {"itemIdentifier": "m2"}]},
+        )
+        self.assertEqual([result.order_id for result in use_case.requests[0].results], [1, 2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.domain.entity.product import Product
+from src.infrastructure.cache.ttl_cache import MISSING, TTLCache
+from src.infrastructure.repository.cached_repository import CachedRepository
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeProductRepository:
+    def __init__(self, products=None):
+        self.products = {product.product_id: product for product in products or []}
+        self.calls = 0
+
+    def get_by_id(self, entity_id):
+        self.calls += 1
+        return self.products.get(entity_id)
+
+    def find_by_id(self, entity_id):
+        return self.get_by_id(int(entity_id))
+
+    def create(self, entity):
+        self.products[entity.product_id] = entity
+        return entity
+
+    def update(self, entity_id, entity):
+        self.products[entity_id] = entity
+        return entity
+
+    def delete(self, entity_id):
+        return self.products.pop(entity_id, None) is not None
+
+    def get_by_name(self, product_name):
+        return [product for product in self.products.values() if product.product_name == product_name]
+
+
+class TTLCacheTestCase(unittest.TestCase):
+    def test_expires_entries_after_ttl(self):
+        clock = FakeClock()
+        cache = TTLCache(max_size=10, default_ttl=10, clock=clock)
+
+        cache.set("key", "value")
+        clock.now = 9
+        self.assertEqual(cache.get("key"), "value")
+        clock.now = 10
+        self.assertIs(cache.get("key"), MISSING)
+
+    def test_evicts_least_recently_used_entry(self):
+        cache = TTLCache(max_size=2, default_ttl=60)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIs(cache.get("b"), MISSING)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+
+class CachedRepositoryTestCase(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.repository = FakeProductRepository([self._product(1)])
+        self.cached = CachedRepository(
+            self.repository,
+            entity_key=lambda product: product.product_id,
+            ttl=60,
+            negative_ttl=5,
+            cache=TTLCache(max_size=10, default_ttl=60, clock=self.clock),
+        )
+
+    def test_reads_through_and_counts_hits(self):
+        first = self.cached.get_by_id(1)
+        second = self.cached.get_by_id(1)
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.repository.calls, 1)
+        self.assertEqual(self.cached.cache_stats()["hits"], 1)
+        self.assertEqual(self.cached.cache_stats()["misses"], 1)
+
+    def test_caches_misses_with_negative_ttl(self):
+        self.assertIsNone(self.cached.get_by_id(2))
+        self.assertIsNone(self.cached.get_by_id(2))
+        self.assertEqual(self.repository.calls, 1)
+
+        self.clock.now = 5
+        self.cached.get_by_id(2)
+        self.assertEqual(self.repository.calls, 2)
+
+    def test_create_invalidates_negative_entry(self):
+        self.assertIsNone(self.cached.get_by_id(2))
+
+        self.cached.create(self._product(2))
+
+        self.assertEqual(self.cached.get_by_id(2).product_id, 2)
+
+    def test_update_and_delete_invalidate_all_lookups(self):
+        self.cached.get_by_id(1)
+        self.cached.find_by_id("1")
+
+        self.cached.update(1, self._product(1, name="Novo nome"))
+        self.assertEqual(self.cached.get_by_id(1).product_name, "Novo nome")
+        self.assertEqual(self.cached.find_by_id("1").product_name, "Novo nome")
+
+        self.cached.delete(1)
+        self.assertIsNone(self.cached.get_by_id(1))
+
+    def test_delegates_other_methods(self):
+        self.assertEqual(len(self.cached.get_by_name("Curso")), 1)
+
+    def _product(self, product_id, name="Curso"):
+        return Product(
+            product_id=product_id,
+            product_name=name,
+            certificate_details="Detalhes",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
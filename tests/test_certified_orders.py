@@ -0,0 +1,113 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("REGION", "us-east-1")
+os.environ.setdefault("BUILDER_QUEUE_URL", "https://example.com/queue")
+os.environ.setdefault("S3_BUCKET_NAME", "bucket")
+os.environ.setdefault("URL_SERVICE_TECH", "https://example.com")
+
+from botocore.exceptions import ClientError
+
+from src.application.create_certificate import CreateCertificate
+from src.domain.entity.certificate import Certificate
+from src.domain.response.tech_floripa import TechOrdersResponse
+from src.infrastructure.repository.certified_orders_repository_impl import (
+    CertifiedOrdersRepositoryImpl,
+    _decode,
+    _encode,
+)
+
+
+class FakeFileManager:
+    def __init__(self):
+        self.objects = {}
+        self.conflicts = 0
+
+    def read_object(self, key):
+        return self.objects.get(key)
+
+    def write_object(self, key, body, content_type="application/octet-stream", if_match=None):
+        current = self.objects.get(key)
+        if self.conflicts:
+            self.conflicts -= 1
+            # Outro processo gravou o pedido 999 entre a leitura e a escrita
+            self.objects[key] = (_encode((_decode(current[0]) if current else set()) | {999}), "concurrent")
+            raise ClientError({"Error": {"Code": "PreconditionFailed"}}, "PutObject")
+        if (current[1] if current else None) != if_match:
+            raise ClientError({"Error": {"Code": "PreconditionFailed"}}, "PutObject")
+        self.objects[key] = (body, f"etag-{len(self.objects)}-{len(body)}")
+
+
+class FakeCertificateRepository:
+    def __init__(self, certificates):
+        self.certificates = certificates
+        self.batch_reads = []
+        self.created = []
+
+    def get_by_order_ids(self, order_ids, projection=None):
+        order_ids = list(order_ids)
+        self.batch_reads.append(order_ids)
+        return {order_id: self.certificates[order_id] for order_id in order_ids if order_id in self.certificates}
+
+    def create(self, entity):
+        self.created.append(entity.order_id)
+        return entity
+
+
+def _order(order_id):
+    return TechOrdersResponse(
+        order_id=order_id, first_name="User", last_name="Test", email=f"user{order_id}@example.com",
+        phone="000", cpf="000", city="Florianópolis", product_id=100, product_name="Curso",
+        certificate_details="Detalhes", certificate_logo="logo.png", certificate_background="background.png",
+        order_date="2025-01-01 10:00:00", checkin_latitude="0", checkin_longitude="0", time_checkin="10:00",
+    )
+
+
+class CertifiedOrdersRepositoryTestCase(unittest.TestCase):
+    def test_encoding_round_trip(self):
+        order_ids = {5, 1, 2 ** 40, 7}
+
+        self.assertEqual(_decode(_encode(order_ids)), order_ids)
+        self.assertEqual(_decode(_encode([])), set())
+
+    def test_add_merges_concurrent_writes(self):
+        file_manager = FakeFileManager()
+        repository = CertifiedOrdersRepositoryImpl(file_manager)
+        repository.add(100, [1, 2])
+        file_manager.conflicts = 1
+
+        repository.add(100, [3])
+
+        self.assertEqual(repository.get(100), {1, 2, 3, 999})
+        self.assertEqual(repository.get(200), set())
+
+
+class CreateCertificateSkipTestCase(unittest.TestCase):
+    def test_skips_known_orders_and_records_new_ones(self):
+        file_manager = FakeFileManager()
+        certified_orders = CertifiedOrdersRepositoryImpl(file_manager)
+        certified_orders.add(100, [1])
+        certificate_repository = FakeCertificateRepository({
+            2: Certificate.model_construct(order_id=2, success=True),
+        })
+        use_case = CreateCertificate.__new__(CreateCertificate)
+        use_case.certificate_repository = certificate_repository
+        use_case.certified_orders_repository = certified_orders
+        use_case.participant_repository = mock.Mock(**{"get_by_emails.return_value": {}})
+        use_case.product_repository = mock.Mock(**{"get_by_id.return_value": object()})
+        use_case.order_repository = mock.Mock(**{"get_by_id.return_value": object()})
+
+        response = use_case.execute([_order(1), _order(2), _order(3)])
+
+        self.assertEqual([order.order_id for order in response.valid_orders], [3])
+        self.assertEqual(certificate_repository.batch_reads, [[2, 3]])
+        self.assertEqual(certificate_repository.created, [3])
+        self.assertEqual(certified_orders.get(100), {1, 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import os
+import sys
+import tempfile
+import unittest
+import uuid
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("REGION", "us-east-1")
+os.environ.setdefault("BUILDER_QUEUE_URL", "https://example.com/queue")
+os.environ.setdefault("S3_BUCKET_NAME", "bucket")
+os.environ.setdefault("URL_SERVICE_TECH", "https://example.com")
+
+from src.infrastructure.aws import dynamodb_service as dynamodb_service_module
+from src.infrastructure.config.config import config
+from src.infrastructure.repository.derived_keys_backfill import (
+    BackfillCheckpoint,
+    DerivedKeysBackfill,
+    derived_keys_targets,
+)
+
+
+class FakeDynamoDBClient:
+    """DynamoDB em memória: scan segmentado e paginado por order_id, e BatchWriteItem."""
+
+    def __init__(self, items):
+        self.items = {item["order_id"]["N"]: item for item in items}
+        self.writes = []
+        self.fail_scans_after = None
+
+    def scan(self, TableName, Segment=0, TotalSegments=1, Limit=None, ExclusiveStartKey=None, **kwargs):
+        if self.fail_scans_after is not None:
+            if self.fail_scans_after == 0:
+                raise RuntimeError("conexão perdida")
+            self.fail_scans_after -= 1
+        keys = sorted(key for key in self.items if int(key) % TotalSegments == Segment)
+        if ExclusiveStartKey:
+            keys = [key for key in keys if int(key) > int(ExclusiveStartKey["order_id"]["N"])]
+        page = keys[:Limit] if Limit else keys
+        response = {"Items": [self.items[key] for key in page]}
+        if Limit and len(keys) > Limit:
+            response["LastEvaluatedKey"] = {"order_id": {"N": page[-1]}}
+        return response
+
+    def batch_write_item(self, RequestItems):
+        for requests in RequestItems.values():
+            for request in requests:
+                item = request["PutRequest"]["Item"]
+                self.writes.append(item["order_id"]["N"])
+                self.items[item["order_id"]["N"]] = item
+        return {}
+
+
+def _certificate_item(order_id, **attributes):
+    item = {
+        "id": {"S": str(uuid.uuid4())},
+        "order_id": {"N": str(order_id)},
+        "order_date": {"S": "2025-01-01 10:00:00"},
+        "product_id": {"N": "100"},
+        "product_name": {"S": "Curso"},
+        "certificate_details": {"S": "Detalhes"},
+        "certificate_logo": {"S": "logo.png"},
+        "certificate_background": {"S": "background.png"},
+        "participant_email": {"S": "user@example.com"},
+        "participant_first_name": {"S": "User"},
+        "participant_last_name": {"S": str(order_id)},
+        "participant_cpf": {"NULL": True},
+        "participant_phone": {"NULL": True},
+        "participant_city": {"NULL": True},
+        "success": {"BOOL": True},
+        "generated_date": {"S": "2025-01-02T10:00:00"},
+    }
+    item.update(attributes)
+    return item
+
+
+def _service(client):
+    service = dynamodb_service_module.DynamoDBService.__new__(dynamodb_service_module.DynamoDBService)
+    service.config = config
+    service.aws = client
+    return service
+
+
+class DerivedKeysBackfillTestCase(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(config, "GSI_SHARD_COUNTS", {})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_writes_only_items_with_missing_keys(self):
+        client = FakeDynamoDBClient([_certificate_item(order_id) for order_id in range(1, 7)])
+        service = _service(client)
+        target = derived_keys_targets(service)["certificates"]
+        # Item já preenchido não deve ser regravado
+        current = service._convert_from_dynamodb_format(client.items["3"])
+        client.items["3"] = service._convert_to_dynamodb_format({**current, **target.changes(current)})
+
+        totals = DerivedKeysBackfill(service, page_size=2).run(target, total_segments=2)
+
+        self.assertEqual(totals, {"scanned": 6, "updated": 5, "invalid": 0})
+        self.assertEqual(sorted(client.writes), ["1", "2", "4", "5", "6"])
+        item = client.items["1"]
+        self.assertEqual(item["participant_email_product_key"], {"S": "user@example.com#100"})
+        self.assertEqual(item["success_flag"], {"N": "1"})
+        self.assertEqual(item["product_shard_key"], {"S": "100#0"})
+        self.assertEqual(item["participant_last_name"], {"S": "1"})
+
+    def test_invalid_items_are_counted_and_skipped(self):
+        invalid = _certificate_item(2)
+        del invalid["product_name"]
+        client = FakeDynamoDBClient([_certificate_item(1), invalid])
+        service = _service(client)
+
+        totals = DerivedKeysBackfill(service).run(derived_keys_targets(service)["certificates"], total_segments=1)
+
+        self.assertEqual(totals, {"scanned": 2, "updated": 1, "invalid": 1})
+        self.assertEqual(client.writes, ["1"])
+
+    def test_resumes_from_checkpoint(self):
+        client = FakeDynamoDBClient([_certificate_item(order_id) for order_id in range(1, 6)])
+        service = _service(client)
+        target = derived_keys_targets(service)["certificates"]
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "backfill.json")
+            client.fail_scans_after = 2
+            with self.assertRaises(RuntimeError):
+                DerivedKeysBackfill(service, checkpoint=BackfillCheckpoint(path), page_size=2).run(target, 1)
+            self.assertEqual(client.writes, ["1", "2", "3", "4"])
+
+            client.fail_scans_after = None
+            totals = DerivedKeysBackfill(service, checkpoint=BackfillCheckpoint(path), page_size=2).run(target, 1)
+
+            self.assertEqual(client.writes, ["1", "2", "3", "4", "5"])
+            self.assertEqual(totals["scanned"], 5)
+            with self.assertRaises(ValueError):
+                BackfillCheckpoint(path).segments("certificates", 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("REGION", "us-east-1")
+os.environ.setdefault("BUILDER_QUEUE_URL", "https://example.com/queue")
+os.environ.setdefault("S3_BUCKET_NAME", "bucket")
+os.environ.setdefault("URL_SERVICE_TECH", "https://example.com")
+
+from lambda_function import lambda_handler
+from src.infrastructure.config.config import Config, config
+from src.main.presentation.controller import certificate as controller_module
+from src.main.presentation.http_types.download_certificate import DownloadCertificateResponse
+
+CERTIFICATE_ID = "0b8f3a52-4f4e-4d1f-9c53-2f4c1f0a7e11"
+CERTIFICATE_URL = "https://bucket.s3.amazonaws.com/certificates/1.pdf?X-Amz-Signature=abc"
+
+
+def _event(query_string_parameters):
+    path = f"{config.PREFIX_API_VERSION}/certificate/download"
+    return {
+        "httpMethod": "GET",
+        "path": path,
+        "pathParameters": None,
+        "queryStringParameters": query_string_parameters,
+        "headers": {"Accept": "text/html"},
+        "body": None,
+        "isBase64Encoded": False,
+        "requestContext": {"httpMethod": "GET", "path": path, "stage": "test", "requestId": "test-request-id"},
+    }
+
+
+def _download_response(success=True, certificate_url=CERTIFICATE_URL):
+    return DownloadCertificateResponse(
+        certificate_url=certificate_url, email="user@example.com", product_id=100, success=success
+    )
+
+
+class DownloadCertificateControllerTestCase(unittest.TestCase):
+    def _download(self, response, redirect=None, redirect_mode=False):
+        query_string_parameters = {"id": CERTIFICATE_ID}
+        if redirect is not None:
+            query_string_parameters["redirect"] = redirect
+        with mock.patch.object(controller_module, "download_certificate_handler", return_value=response), \
+                mock.patch.object(controller_module.config, "DOWNLOAD_REDIRECT_MODE", redirect_mode):
+            return lambda_handler(_event(query_string_parameters), None)
+
+    def test_redirect_returns_302_to_presigned_url(self):
+        with mock.patch.object(controller_module.config, "PRESIGNED_URL_REUSE_FRACTION", 0.5):
+            result = self._download(_download_response(), redirect="true")
+
+        self.assertEqual(result["statusCode"], 302)
+        headers = result["multiValueHeaders"]
+        self.assertEqual(headers["Location"], [CERTIFICATE_URL])
+        # Metade da validade da URL pré-assinada (1800s)
+        self.assertEqual(headers["Cache-Control"], ["private, max-age=900"])
+
+    def test_redirect_mode_from_config_applies_without_query_parameter(self):
+        result = self._download(_download_response(), redirect_mode=True)
+
+        self.assertEqual(result["statusCode"], 302)
+
+    def test_query_parameter_overrides_redirect_mode(self):
+        result = self._download(_download_response(), redirect="false", redirect_mode=True)
+
+        self.assertEqual(result["statusCode"], 200)
+        self.assertIn(CERTIFICATE_URL, result["body"])
+
+    def test_falls_back_to_html_when_certificate_not_generated(self):
+        result = self._download(_download_response(success=False, certificate_url=""), redirect="true")
+
+        self.assertEqual(result["statusCode"], 200)
+        self.assertNotIn("Location", result["multiValueHeaders"])
+        self.assertIn("<html", result["body"].lower())
+
+    def test_redirect_mode_is_off_by_default(self):
+        self.assertIs(Config.model_fields["DOWNLOAD_REDIRECT_MODE"].default, False)
+
+        result = self._download(_download_response())
+
+        self.assertEqual(result["statusCode"], 200)
+        self.assertIn(CERTIFICATE_URL, result["body"])
+
+
+if __name__ == "__main__":
+    unittest.main()
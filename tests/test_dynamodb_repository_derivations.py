@@ -3,6 +3,7 @@ import sys
 import types
 import unittest
 import uuid
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -30,13 +31,23 @@ sys.modules.setdefault("boto3", boto3_module)
 from src.domain.entity.certificate import Certificate
 from src.domain.entity.order import Order
 from src.domain.entity.product import Product
-from src.infrastructure.repository.certificate_repository_impl import CertificateRepositoryImpl
+from src.infrastructure.repository.certificate_repository_impl import (
+    GENERATED_AT_MISSING,
+    CertificateRepositoryImpl,
+    _generated_at,
+)
 from src.infrastructure.repository.order_repository_impl import OrderRepositoryImpl
 from src.infrastructure.repository.product_repository_impl import ProductRepositoryImpl
 
 
 class FakeDynamoDBService:
-    pass
+    def __init__(self, items=None):
+        self.items = items or []
+        self.queries = []
+
+    def query_table(self, table_name, key_condition_expression, expression_values, **kwargs):
+        self.queries.append((key_condition_expression, expression_values, kwargs))
+        return list(self.items)
 
 
 class DynamoDBRepositoryDerivationsTestCase(unittest.TestCase):
@@ -68,8 +79,47 @@ class DynamoDBRepositoryDerivationsTestCase(unittest.TestCase):
         self.assertEqual(item["participant_email"], "user+test@example.com")
         self.assertEqual(item["participant_email_product_key"], "user+test@example.com#100")
         self.assertEqual(item["success_flag"], 1)
+        self.assertEqual(item["participant_email_success_key"], "user+test@example.com#1")
+        self.assertEqual(item["generated_at"], "2025-01-10T10:00:00.000000")
         self.assertEqual(item["id"], str(certificate.id))
 
+    def test_certificate_generated_at_is_sortable(self):
+        self.assertEqual(_generated_at("2025-01-10T12:00:00-03:00"), "2025-01-10T15:00:00.000000")
+        self.assertEqual(_generated_at("2025-01-10 09:30:00"), "2025-01-10T09:30:00.000000")
+        self.assertEqual(_generated_at(None), GENERATED_AT_MISSING)
+        self.assertEqual(_generated_at("ontem"), GENERATED_AT_MISSING)
+        self.assertLess(GENERATED_AT_MISSING, _generated_at("1970-01-01T00:00:00"))
+
+    def test_certificate_list_by_email_uses_success_index(self):
+        service = FakeDynamoDBService()
+        repository = CertificateRepositoryImpl(service)
+
+        repository.list_by_participant_email(" User@Example.com ")
+        repository.list_by_participant_email("user@example.com", success=False)
+
+        (_, all_values, all_kwargs), (_, failed_values, failed_kwargs) = service.queries
+        self.assertEqual(all_kwargs["index_name"], "certificates_by_email_generated_idx")
+        self.assertEqual(all_values, {":email": "user@example.com"})
+        self.assertEqual(failed_kwargs["index_name"], "certificates_by_email_success_idx")
+        self.assertEqual(failed_values, {":email_success_key": "user@example.com#0"})
+        self.assertFalse(failed_kwargs["scan_index_forward"])
+
+    def test_certificate_changed_since_queries_updated_index(self):
+        service = FakeDynamoDBService()
+        repository = CertificateRepositoryImpl(service)
+
+        repository.get_by_product_id_changed_since(100, datetime(2025, 1, 10, 12, 0, tzinfo=timezone(timedelta(hours=-3))))
+        repository.get_by_participant_email_changed_since("User@Example.com", datetime(2025, 1, 10), success=True)
+
+        (product_condition, product_values, product_kwargs), (_, email_values, email_kwargs) = service.queries
+        self.assertEqual(product_condition, "product_id = :shard_value AND updated_at > :since")
+        self.assertEqual(product_kwargs["index_name"], "certificates_by_product_updated_idx")
+        self.assertEqual(product_values[":since"], "2025-01-10T15:00:00.000000Z")
+        self.assertEqual(email_kwargs["index_name"], "certificates_by_email_updated_idx")
+        self.assertEqual(email_kwargs["filter_expression"], "success_flag = :success_flag")
+        self.assertEqual(email_values[":email"], "user@example.com")
+        self.assertEqual(email_values[":since"], "2025-01-10T00:00:00.000000Z")
+
     def test_order_prepare_item_adds_month_and_sort_key(self):
         repository = OrderRepositoryImpl(FakeDynamoDBService())
         order = Order(
@@ -0,0 +1,149 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("REGION", "us-east-1")
+os.environ.setdefault("BUILDER_QUEUE_URL", "https://example.com/queue")
+os.environ.setdefault("S3_BUCKET_NAME", "bucket")
+os.environ.setdefault("URL_SERVICE_TECH", "https://example.com")
+
+from botocore.exceptions import ClientError, EndpointConnectionError, ReadTimeoutError
+
+from src.infrastructure.aws import dynamodb_throttling
+from src.infrastructure.aws.dynamodb_throttling import (
+    AdaptiveTokenBucket,
+    TableRateLimiters,
+    ThrottledDynamoDBClient,
+)
+
+
+def _error(code):
+    return ClientError({"Error": {"Code": code}}, "Operation")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class AdaptiveTokenBucketTestCase(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        clock_patch = mock.patch.object(dynamodb_throttling.time, "monotonic", self.clock)
+        self.sleep = mock.patch.object(dynamodb_throttling.time, "sleep").start()
+        clock_patch.start()
+        self.addCleanup(mock.patch.stopall)
+
+    def test_first_throttle_limits_at_half_the_measured_rate(self):
+        bucket = AdaptiveTokenBucket(min_rate=10, max_rate=5000, increase=100)
+        for _ in range(10):
+            bucket.acquire(100)
+        self.clock.now = 1.0
+        bucket.acquire(1)
+        self.assertFalse(bucket.limited)
+
+        bucket.on_throttle()
+        bucket.on_throttle()
+        self.assertEqual(bucket.rate, 500)
+
+        bucket.on_success(cost=500)
+        self.assertEqual(bucket.rate, 600)
+
+        bucket.acquire(600)
+        self.assertEqual(self.sleep.call_count, 1)
+        self.assertAlmostEqual(self.sleep.call_args.args[0], 1.0)
+
+    def test_limit_is_removed_when_rate_reaches_the_ceiling(self):
+        bucket = AdaptiveTokenBucket(min_rate=10, max_rate=100, increase=100)
+        bucket.on_throttle()
+        self.assertEqual(bucket.rate, 50)
+
+        bucket.on_success(cost=50)
+
+        self.assertFalse(bucket.limited)
+
+
+class ThrottledDynamoDBClientTestCase(unittest.TestCase):
+    def setUp(self):
+        self.limiters = TableRateLimiters(min_rate=1, max_rate=5000, increase=10)
+        self.client = mock.Mock()
+        self.throttled = ThrottledDynamoDBClient(self.client, self.limiters, max_attempts=3)
+        self.sleep = mock.patch.object(dynamodb_throttling.time, "sleep").start()
+        self.addCleanup(mock.patch.stopall)
+
+    def test_unthrottled_batch_traffic_is_not_slowed_down(self):
+        self.client.batch_get_item.return_value = {"Responses": {"orders": []}}
+        keys = {"orders": {"Keys": [{"order_id": {"N": str(i)}} for i in range(100)]}}
+
+        for _ in range(30):
+            self.throttled.batch_get_item(RequestItems=keys)
+
+        self.sleep.assert_not_called()
+        self.assertFalse(self.limiters.for_table("orders").limited)
+
+    def test_retries_throttled_calls_and_starts_limiting(self):
+        self.client.get_item.side_effect = [_error("ProvisionedThroughputExceededException"), {"Item": {}}]
+
+        response = self.throttled.get_item(TableName="certificates", Key={})
+
+        self.assertEqual(response, {"Item": {}})
+        self.assertEqual(self.client.get_item.call_count, 2)
+        self.assertTrue(self.limiters.for_table("certificates").limited)
+        self.assertFalse(self.limiters.for_table("orders").limited)
+
+    def test_gives_up_after_max_attempts_and_passes_other_errors(self):
+        self.client.query.side_effect = _error("ThrottlingException")
+        with self.assertRaises(ClientError):
+            self.throttled.query(TableName="orders")
+        self.assertEqual(self.client.query.call_count, 3)
+
+        self.client.put_item.side_effect = _error("ConditionalCheckFailedException")
+        with self.assertRaises(ClientError):
+            self.throttled.put_item(TableName="orders", Item={})
+        self.assertEqual(self.client.put_item.call_count, 1)
+
+    def test_retries_connection_errors_without_limiting(self):
+        self.client.get_item.side_effect = [
+            EndpointConnectionError(endpoint_url="https://dynamodb"),
+            ReadTimeoutError(endpoint_url="https://dynamodb"),
+            {"Item": {}},
+        ]
+
+        response = self.throttled.get_item(TableName="orders", Key={})
+
+        self.assertEqual(response, {"Item": {}})
+        self.assertEqual(self.sleep.call_count, 2)
+        self.assertFalse(self.limiters.for_table("orders").limited)
+
+        self.client.get_item.side_effect = ReadTimeoutError(endpoint_url="https://dynamodb")
+        with self.assertRaises(ReadTimeoutError):
+            self.throttled.get_item(TableName="orders", Key={})
+        self.assertEqual(self.client.get_item.call_count, 6)
+
+    def test_unprocessed_batch_items_count_as_throttle(self):
+        self.client.batch_write_item.return_value = {"UnprocessedItems": {"orders": [{"PutRequest": {}}]}}
+
+        self.throttled.batch_write_item(RequestItems={"orders": [{"PutRequest": {}}] * 25})
+
+        self.assertTrue(self.limiters.for_table("orders").limited)
+        self.assertIs(self.throttled.meta, self.client.meta)
+
+    def test_queries_are_charged_by_items_read(self):
+        bucket = self.limiters.for_table("orders")
+        bucket.on_throttle()
+        bucket.rate = 100.0
+        self.client.query.return_value = {"Items": [], "Count": 10, "ScannedCount": 80}
+
+        self.throttled.query(TableName="orders")
+
+        self.assertLess(bucket._tokens, -70)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import csv
+import gzip
+import io
+import json
+import os
+import sys
+import unittest
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("REGION", "us-east-1")
+os.environ.setdefault("BUILDER_QUEUE_URL", "https://example.com/queue")
+os.environ.setdefault("S3_BUCKET_NAME", "bucket")
+os.environ.setdefault("URL_SERVICE_TECH", "https://example.com")
+
+from src.application.dto.export_certificates_dto import ExportCertificatesRequestDto
+from src.application.export_product_certificates import EXPORT_FIELDS, ExportProductCertificates
+from src.domain.entity.certificate import Certificate
+from src.infrastructure.aws.s3_multipart_writer import MULTIPART_MIN_PART_SIZE, S3MultipartGzipWriter
+
+
+def _certificate(order_id):
+    return Certificate(
+        id=uuid.uuid4(),
+        success=True,
+        order_id=order_id,
+        order_date="2025-01-01 10:00:00",
+        product_id=100,
+        product_name="Curso",
+        certificate_details="Detalhes",
+        certificate_logo="logo.png",
+        certificate_background="background.png",
+        certificate_key=f"certificates/{order_id}.pdf",
+        participant_email=f"user{order_id}@example.com",
+        participant_first_name="User",
+        participant_last_name=str(order_id),
+        participant_cpf=None,
+        participant_phone=None,
+        participant_city=None,
+    )
+
+
+class FakeS3Client:
+    def __init__(self):
+        self.objects = {}
+        self.parts = []
+        self.completed = None
+        self.aborted = False
+
+    def put_object(self, Bucket, Key, Body, ContentType):
+        self.objects[Key] = Body
+
+    def create_multipart_upload(self, Bucket, Key, ContentType):
+        return {"UploadId": "upload-1"}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.parts.append(Body)
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        self.completed = MultipartUpload["Parts"]
+        self.objects[Key] = b"".join(self.parts)
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.aborted = True
+
+
+class FakeFileManager:
+    def __init__(self):
+        self.s3 = FakeS3Client()
+
+    def open_gzip_upload(self, key, content_type="application/gzip"):
+        return S3MultipartGzipWriter(self.s3, "bucket", key, content_type=content_type)
+
+    def get_url(self, key, expires_in, disposition):
+        return f"https://bucket.s3.amazonaws.com/{key}?disposition={disposition}"
+
+
+class FakeCertificateRepository:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def iter_by_product_id(self, product_id, projection=None, page_size=None):
+        yield from self.pages
+
+
+class ExportProductCertificatesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.file_manager = FakeFileManager()
+        repository = FakeCertificateRepository([[_certificate(1), _certificate(2)], [_certificate(3)]])
+        self.service = ExportProductCertificates(repository, self.file_manager)
+
+    def test_exports_ndjson_page_by_page(self):
+        response = self.service.execute(ExportCertificatesRequestDto(product_id=100))
+
+        lines = gzip.decompress(self.file_manager.s3.objects[response.key]).decode().splitlines()
+        rows = [json.loads(line) for line in lines]
+        self.assertEqual(response.total, 3)
+        self.assertEqual([row["order_id"] for row in rows], [1, 2, 3])
+        self.assertEqual(list(rows[0]), EXPORT_FIELDS)
+        self.assertIn("attachment", response.download_url)
+
+    def test_exports_csv_with_header(self):
+        response = self.service.execute(ExportCertificatesRequestDto(product_id=100, format="csv"))
+
+        content = gzip.decompress(self.file_manager.s3.objects[response.key]).decode()
+        rows = list(csv.reader(io.StringIO(content)))
+        self.assertEqual(rows[0], EXPORT_FIELDS)
+        self.assertEqual(len(rows), 4)
+        self.assertTrue(response.key.endswith(".csv.gz"))
+
+
+class S3MultipartGzipWriterTestCase(unittest.TestCase):
+    def test_uploads_parts_once_buffer_is_full(self):
+        s3 = FakeS3Client()
+        # Dados aleatórios não comprimem, então cada bloco enche uma parte
+        chunks = [os.urandom(MULTIPART_MIN_PART_SIZE) for _ in range(3)]
+        with S3MultipartGzipWriter(s3, "bucket", "export.gz") as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+
+        part_numbers = [part["PartNumber"] for part in s3.completed]
+        self.assertGreater(len(part_numbers), 1)
+        self.assertEqual(part_numbers, list(range(1, len(part_numbers) + 1)))
+        self.assertTrue(all(len(part) >= MULTIPART_MIN_PART_SIZE for part in s3.parts[:-1]))
+        self.assertEqual(gzip.decompress(s3.objects["export.gz"]), b"".join(chunks))
+
+    def test_aborts_upload_on_error(self):
+        s3 = FakeS3Client()
+        with self.assertRaises(RuntimeError):
+            with S3MultipartGzipWriter(s3, "bucket", "export.gz") as writer:
+                writer.write(os.urandom(MULTIPART_MIN_PART_SIZE))
+                writer.write(os.urandom(MULTIPART_MIN_PART_SIZE))
+                raise RuntimeError("falha na leitura")
+
+        self.assertTrue(s3.aborted)
+        self.assertIsNone(s3.completed)
+
+
+if __name__ == "__main__":
+    unittest.main()
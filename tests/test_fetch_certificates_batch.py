@@ -0,0 +1,176 @@
+import base64
+import json
+import os
+import sys
+import unittest
+import uuid
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("REGION", "us-east-1")
+os.environ.setdefault("BUILDER_QUEUE_URL", "https://example.com/queue")
+os.environ.setdefault("S3_BUCKET_NAME", "bucket")
+os.environ.setdefault("URL_SERVICE_TECH", "https://example.com")
+
+from src.application.dto.fetch_certificates_batch_dto import FetchCertificatesBatchRequestDto
+from src.application.fetch_certificates_batch import FetchCertificatesBatch
+from src.domain.entity.certificate import Certificate
+from src.infrastructure.aws import dynamodb_service as dynamodb_service_module
+from src.infrastructure.config.config import config
+from src.main.presentation.controller import certificate as controller_module
+from src.main.presentation.http_types.fetch_certificate import FetchCertificateResponse
+from src.main.presentation.http_types.fetch_certificates_batch import FetchCertificatesBatchResponse
+from lambda_function import lambda_handler
+
+
+def _certificate(order_id, certificate_id=None):
+    return Certificate(
+        id=certificate_id or uuid.uuid4(),
+        success=True,
+        order_id=order_id,
+        order_date="2025-01-01 10:00:00",
+        product_id=100,
+        product_name="Curso",
+        certificate_details="Detalhes",
+        certificate_logo="logo.png",
+        certificate_background="background.png",
+        participant_email="user@example.com",
+        participant_first_name="User",
+        participant_last_name=str(order_id),
+        participant_cpf=None,
+        participant_phone=None,
+        participant_city=None,
+    )
+
+
+class FakeCertificateRepository:
+    def __init__(self, certificates):
+        self.certificates = certificates
+        self.requested_order_ids = None
+        self.projection = None
+
+    def get_by_order_ids(self, order_ids, projection=None):
+        self.requested_order_ids = list(order_ids)
+        self.projection = projection
+        return {c.order_id: c for c in self.certificates if c.order_id in self.requested_order_ids}
+
+    def find_by_ids(self, ids, projection=None):
+        return {str(c.id): c for c in self.certificates if str(c.id) in ids}
+
+
+class FetchCertificatesBatchTestCase(unittest.TestCase):
+    def test_maps_found_keys_and_lists_missing_ones(self):
+        known_id = uuid.uuid4()
+        unknown_id = str(uuid.uuid4())
+        repository = FakeCertificateRepository([_certificate(1), _certificate(2), _certificate(3, known_id)])
+        service = FetchCertificatesBatch(repository)
+
+        response = service.execute(FetchCertificatesBatchRequestDto(
+            order_ids=[2, 1, 2, 404],
+            ids=[str(known_id), unknown_id],
+        ))
+
+        self.assertEqual(repository.requested_order_ids, [2, 1, 404])
+        self.assertEqual(list(response.by_order_id), ["2", "1"])
+        self.assertEqual(response.by_order_id["1"]["participant_name"], "User 1")
+        self.assertEqual(list(response.by_id), [str(known_id)])
+        self.assertEqual(response.missing_order_ids, [404])
+        self.assertEqual(response.missing_ids, [unknown_id])
+
+    def test_sparse_fields_become_projection(self):
+        repository = FakeCertificateRepository([_certificate(1)])
+        service = FetchCertificatesBatch(repository)
+
+        response = service.execute(FetchCertificatesBatchRequestDto(
+            order_ids=[1],
+            ids=[],
+            fields=["order_id", "participant_name"],
+        ))
+
+        self.assertEqual(
+            repository.projection,
+            ["order_id", "participant_first_name", "participant_last_name"],
+        )
+        self.assertEqual(response.by_order_id["1"]["participant_name"], "User 1")
+        self.assertNotIn("participant_email", response.by_order_id["1"])
+
+    def test_sparse_response_serializes_only_requested_fields(self):
+        response = FetchCertificateResponse(order_id=1, success=True, participant_name="User 1")
+        self.assertEqual(
+            json.loads(response.only(["order_id", "success"]).model_dump_json()),
+            {"order_id": 1, "success": True},
+        )
+        self.assertIn("participant_name", response.only(None).model_dump())
+
+    def test_projection_uses_placeholders(self):
+        kwargs = dynamodb_service_module.DynamoDBService._projection_kwargs(
+            ["order_id", "success"], {"#e": "participant_email"}
+        )
+        self.assertEqual(kwargs["ProjectionExpression"], "#p0, #p1")
+        self.assertEqual(
+            kwargs["ExpressionAttributeNames"],
+            {"#e": "participant_email", "#p0": "order_id", "#p1": "success"},
+        )
+
+
+class FakeDynamoDBClient:
+    def __init__(self, table_name):
+        self.table_name = table_name
+        self.calls = []
+
+    def batch_get_item(self, RequestItems):
+        keys = RequestItems[self.table_name]["Keys"]
+        self.calls.append(len(keys))
+        # Primeira chamada de cada lote devolve a última chave como não processada
+        if len(self.calls) % 2 == 1 and len(keys) > 1:
+            processed, unprocessed = keys[:-1], keys[-1:]
+            return {
+                "Responses": {self.table_name: processed},
+                "UnprocessedKeys": {self.table_name: {"Keys": unprocessed}},
+            }
+        return {"Responses": {self.table_name: keys}}
+
+
+class DynamoDBServiceBatchGetTestCase(unittest.TestCase):
+    def test_chunks_keys_and_retries_unprocessed(self):
+        service = dynamodb_service_module.DynamoDBService.__new__(dynamodb_service_module.DynamoDBService)
+        service.config = config
+        service.aws = FakeDynamoDBClient(config.get_table_name("certificates"))
+
+        with mock.patch.object(dynamodb_service_module.time, "sleep"):
+            items = service.batch_get_items([{"order_id": i} for i in range(150)], "certificates")
+
+        self.assertEqual(service.aws.calls, [100, 1, 50, 1])
+        self.assertEqual(sorted(item["order_id"] for item in items), [float(i) for i in range(150)])
+
+
+class FetchCertificatesBatchControllerTestCase(unittest.TestCase):
+    def test_accepts_base64_encoded_body(self):
+        # Com */* em binary media types, o API Gateway entrega o corpo em base64
+        path = f"{config.PREFIX_API_VERSION}/certificate/fetch-batch"
+        body = base64.b64encode(json.dumps({"order_ids": [1, 2]}).encode()).decode()
+        event = {
+            "httpMethod": "POST",
+            "path": path,
+            "pathParameters": None,
+            "queryStringParameters": None,
+            "headers": {"Content-Type": "application/json"},
+            "body": body,
+            "isBase64Encoded": True,
+            "requestContext": {"httpMethod": "POST", "path": path, "stage": "test", "requestId": "test-request-id"},
+        }
+        handler = mock.Mock(return_value=FetchCertificatesBatchResponse(
+            by_order_id={}, by_id={}, missing_order_ids=[1, 2], missing_ids=[]
+        ))
+
+        with mock.patch.object(controller_module, "fetch_certificates_batch_handler", handler):
+            result = lambda_handler(event, None)
+
+        self.assertEqual(result["statusCode"], 200)
+        self.assertEqual(handler.call_args.args[0].order_ids, [1, 2])
+        self.assertEqual(json.loads(result["body"])["missing_order_ids"], [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
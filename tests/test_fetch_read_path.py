@@ -0,0 +1,113 @@
+import json
+import os
+import sys
+import unittest
+import uuid
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("REGION", "us-east-1")
+os.environ.setdefault("BUILDER_QUEUE_URL", "https://example.com/queue")
+os.environ.setdefault("S3_BUCKET_NAME", "bucket")
+os.environ.setdefault("URL_SERVICE_TECH", "https://example.com")
+
+from src.application.dto.list_user_certificates_dto import ListUserCertificatesRequestDto
+from src.application.list_user_certificates import ListUserCertificates
+from src.application.mapper.certificate import CertificateResponseMapper
+from src.infrastructure.repository.certificate_repository_impl import _to_certificates
+from src.main.handler import certificate as handler_module
+from src.main.presentation.http_types.fetch_certificate import FetchCertificateRequest, FetchCertificateResponse
+from src.main.presentation.http_types.list_user_certificates import (
+    ListUserCertificatesRequest,
+    UserCertificateItemResponse,
+)
+
+
+def _item(order_id, certificate_id):
+    # Formato devolvido por DynamoDBService._convert_from_dynamodb_format (números como float)
+    return {
+        "id": str(certificate_id),
+        "order_id": float(order_id),
+        "order_date": "2025-01-10 12:00:00",
+        "product_id": 1678.0,
+        "product_name": "Workshop",
+        "certificate_details": "Detalhes",
+        "certificate_logo": "logo.png",
+        "certificate_background": "background.png",
+        "certificate_key": f"certificates/{order_id}.pdf",
+        "certificate_url": f"https://bucket.s3.amazonaws.com/certificates/{order_id}.pdf",
+        "generated_date": "2025-01-20T10:30:45",
+        "success": True,
+        "participant_email": "user@example.com",
+        "participant_first_name": "User",
+        "participant_last_name": str(order_id),
+        "participant_cpf": "123.456.789-00",
+        "participant_phone": None,
+        "participant_city": None,
+    }
+
+
+class FetchReadPathTestCase(unittest.TestCase):
+    def _fetch(self, items, fields=None):
+        dtos = CertificateResponseMapper.to_fetch_response_dtos(_to_certificates(items), fields)
+        fetch_certificate = mock.Mock(**{"execute.return_value": dtos})
+        with mock.patch.object(handler_module.container, "get", return_value=fetch_certificate):
+            return handler_module.fetch_certificate_handler(FetchCertificateRequest(order_id=1, fields=fields))
+
+    def test_maps_decoded_items_to_responses(self):
+        certificate_id = uuid.uuid4()
+
+        responses = self._fetch([_item(1, certificate_id)])
+
+        self.assertEqual(len(responses), 1)
+        response = responses[0]
+        self.assertIsInstance(response, FetchCertificateResponse)
+        self.assertEqual(response.id, certificate_id)
+        self.assertEqual(response.order_id, 1)
+        self.assertEqual(response.product_id, 1678)
+        self.assertEqual(response.participant_name, "User 1")
+        self.assertEqual(response.participant_document, "123.456.789-00")
+        self.assertEqual(response.created_at, "2025-01-20T10:30:45")
+        self.assertEqual(response.updated_at, "2025-01-20T10:30:45")
+        self.assertTrue(response.success)
+        self.assertNotIn("certificate_key", json.loads(response.model_dump_json()))
+
+    def test_sparse_fields_serialize_only_requested_fields(self):
+        responses = self._fetch([_item(1, uuid.uuid4()), _item(2, uuid.uuid4())], ["order_id", "participant_name"])
+
+        self.assertEqual(
+            [json.loads(response.model_dump_json()) for response in responses],
+            [{"order_id": 1, "participant_name": "User 1"}, {"order_id": 2, "participant_name": "User 2"}],
+        )
+
+    def test_mapper_does_not_build_models(self):
+        dtos = CertificateResponseMapper.to_fetch_response_dtos(_to_certificates([_item(1, uuid.uuid4())]), ["order_id"])
+
+        self.assertEqual(dtos, [{"order_id": 1}])
+
+
+class ListUserCertificatesReadPathTestCase(unittest.TestCase):
+    def test_items_are_validated_once_by_the_handler(self):
+        certificate_id = uuid.uuid4()
+        repository = mock.Mock(**{"list_by_participant_email.return_value": _to_certificates([_item(1, certificate_id)])})
+        use_case = ListUserCertificates(repository)
+
+        application_response = use_case.execute(ListUserCertificatesRequestDto(email="user@example.com"))
+        with mock.patch.object(handler_module.container, "get", return_value=use_case):
+            response = handler_module.list_user_certificates_handler(
+                ListUserCertificatesRequest(email="user@example.com")
+            )
+
+        # A aplicação devolve dicts; só a resposta HTTP é validada
+        self.assertIsInstance(application_response.certificates[0], dict)
+        item = response.certificates[0]
+        self.assertIsInstance(item, UserCertificateItemResponse)
+        self.assertEqual(item.id, certificate_id)
+        self.assertEqual(item.order_id, 1)
+        self.assertEqual(item.participant_name, "User 1")
+        self.assertEqual(item.updated_at, "2025-01-20T10:30:45")
+
+
+if __name__ == "__main__":
+    unittest.main()
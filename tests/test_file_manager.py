@@ -0,0 +1,71 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("REGION", "us-east-1")
+os.environ.setdefault("BUILDER_QUEUE_URL", "https://example.com/queue")
+os.environ.setdefault("S3_BUCKET_NAME", "bucket")
+os.environ.setdefault("URL_SERVICE_TECH", "https://example.com")
+
+from src.infrastructure.aws import file_manager as file_manager_module
+from src.infrastructure.cache.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeS3Client:
+    def __init__(self):
+        self.calls = []
+
+    def generate_presigned_url(self, operation, Params, ExpiresIn):
+        self.calls.append((Params["Key"], Params["ResponseContentDisposition"], ExpiresIn))
+        return f"https://s3.example.com/{Params['Key']}?sig={len(self.calls)}"
+
+
+class FileManagerPresignedUrlCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.s3 = FakeS3Client()
+        with mock.patch.object(file_manager_module, "get_instance_aws", return_value=self.s3):
+            self.file_manager = file_manager_module.FileManager(
+                url_cache=TTLCache(max_size=10, clock=self.clock)
+            )
+        self.file_manager.reuse_fraction = 0.5
+
+    def test_reuses_url_until_fraction_of_lifetime(self):
+        first = self.file_manager.get_certificate_download_url("cert.pdf")
+
+        self.clock.now = 899
+        self.assertEqual(self.file_manager.get_certificate_download_url("cert.pdf"), first)
+
+        self.clock.now = 900
+        self.assertNotEqual(self.file_manager.get_certificate_download_url("cert.pdf"), first)
+        self.assertEqual(len(self.s3.calls), 2)
+
+    def test_cache_is_keyed_by_disposition(self):
+        self.file_manager.get_url("cert.pdf", expires_in=1800)
+        self.file_manager.get_url("cert.pdf", expires_in=1800, disposition="attachment")
+
+        self.assertEqual(
+            [call[1] for call in self.s3.calls],
+            ["inline", "attachment"],
+        )
+
+    def test_get_urls_signs_each_distinct_key_once(self):
+        urls = self.file_manager.get_urls(["a.pdf", "b.pdf", "a.pdf", ""])
+
+        self.assertEqual(set(urls), {"a.pdf", "b.pdf"})
+        self.assertEqual(len(self.s3.calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
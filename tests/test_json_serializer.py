@@ -0,0 +1,52 @@
+import json
+import sys
+import unittest
+import uuid
+from decimal import Decimal
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.domain.entity.product import Product
+from src.infrastructure.serialization import json_serializer
+from src.infrastructure.serialization.json_serializer import get_json_serializer
+
+
+class JsonSerializerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.payload = {
+            "id": uuid.UUID("00000000-0000-0000-0000-000000000001"),
+            "order_id": Decimal("10"),
+            "price": Decimal("10.5"),
+            "orders": [{"order_id": Decimal("11")}, (Decimal("12"),)],
+            "product": Product(product_id=1, product_name="Curso", certificate_details="Detalhes"),
+            "name": "João",
+        }
+
+    def test_all_modes_produce_identical_json(self):
+        modes = ["stdlib", "pydantic"] + (["orjson"] if json_serializer.orjson is not None else [])
+        outputs = {mode: get_json_serializer(mode)(self.payload) for mode in modes}
+
+        expected = outputs["stdlib"]
+        for mode, output in outputs.items():
+            self.assertEqual(output, expected, mode)
+        self.assertEqual(
+            json.loads(expected)["orders"],
+            [{"order_id": 11}, [12]],
+        )
+        self.assertIn('"order_id":10,"price":10.5', expected)
+        self.assertIn('"name":"João"', expected)
+
+    def test_falls_back_when_orjson_is_missing(self):
+        with mock.patch.object(json_serializer, "orjson", None):
+            self.assertIs(get_json_serializer("auto"), json_serializer.dumps_pydantic)
+            self.assertIs(get_json_serializer("orjson"), json_serializer.dumps_pydantic)
+
+    def test_rejects_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            get_json_serializer("yaml")
+
+
+if __name__ == "__main__":
+    unittest.main()
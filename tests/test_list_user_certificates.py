@@ -1,6 +1,7 @@
 import sys
 import unittest
 import uuid
+from datetime import datetime, timezone
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -11,13 +12,25 @@ from src.domain.entity.certificate import Certificate
 
 
 class FakeCertificateRepository:
+    """Simula os índices por email: filtra por success e devolve na ordem recebida."""
+
     def __init__(self, certificates):
         self.certificates = certificates
         self.last_email = None
+        self.last_success = None
 
-    def get_by_participant_email(self, email: str):
+    def list_by_participant_email(self, email: str, success=None):
         self.last_email = email
-        return list(self.certificates)
+        self.last_success = success
+        return [
+            certificate
+            for certificate in self.certificates
+            if success is None or certificate.success is success
+        ]
+
+    def get_by_participant_email_changed_since(self, email: str, since, success=None):
+        self.last_since = since
+        return self.list_by_participant_email(email, success)[:1]
 
 
 class ListUserCertificatesTestCase(unittest.TestCase):
@@ -47,33 +60,51 @@ class ListUserCertificatesTestCase(unittest.TestCase):
             ),
         ]
 
-    def test_lists_all_certificates_sorted_by_generated_date_desc(self):
+    def test_keeps_order_returned_by_repository(self):
         service = ListUserCertificates(FakeCertificateRepository(self.certificates))
 
         response = service.execute(ListUserCertificatesRequestDto(email=self.email))
 
         self.assertEqual(response.email, self.email)
-        self.assertEqual([item.order_id for item in response.certificates], [3, 4, 1, 2])
+        self.assertEqual([item["order_id"] for item in response.certificates], [1, 2, 3, 4])
 
-    def test_filters_success_true_before_sorting(self):
-        service = ListUserCertificates(FakeCertificateRepository(self.certificates))
+    def test_delegates_success_filter_to_repository(self):
+        repository = FakeCertificateRepository(self.certificates)
+        service = ListUserCertificates(repository)
 
         response = service.execute(
             ListUserCertificatesRequestDto(email=self.email, success=True)
         )
 
-        self.assertEqual([item.order_id for item in response.certificates], [4, 1, 2])
-        self.assertTrue(all(item.success is True for item in response.certificates))
+        self.assertIs(repository.last_success, True)
+        self.assertEqual([item["order_id"] for item in response.certificates], [1, 2, 4])
+        self.assertTrue(all(item["success"] is True for item in response.certificates))
 
     def test_filters_success_false(self):
-        service = ListUserCertificates(FakeCertificateRepository(self.certificates))
+        repository = FakeCertificateRepository(self.certificates)
+        service = ListUserCertificates(repository)
 
         response = service.execute(
             ListUserCertificatesRequestDto(email=self.email, success=False)
         )
 
-        self.assertEqual([item.order_id for item in response.certificates], [3])
-        self.assertEqual(response.certificates[0].success, False)
+        self.assertIs(repository.last_success, False)
+        self.assertEqual([item["order_id"] for item in response.certificates], [3])
+        self.assertEqual(response.certificates[0]["success"], False)
+
+    def test_since_returns_only_changes_and_next_poll_time(self):
+        repository = FakeCertificateRepository(self.certificates)
+        service = ListUserCertificates(repository)
+        since = datetime(2025, 1, 11, tzinfo=timezone.utc)
+
+        response = service.execute(
+            ListUserCertificatesRequestDto(email=self.email, since=since)
+        )
+
+        self.assertEqual(repository.last_since, since)
+        self.assertEqual([item["order_id"] for item in response.certificates], [1])
+        self.assertTrue(response.server_time.endswith("Z"))
+        self.assertLess(since, datetime.fromisoformat(response.server_time.replace("Z", "+00:00")))
 
     def test_returns_empty_list_when_no_records_match_email(self):
         service = ListUserCertificates(FakeCertificateRepository([]))
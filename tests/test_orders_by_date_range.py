@@ -0,0 +1,103 @@
+import os
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("REGION", "us-east-1")
+os.environ.setdefault("BUILDER_QUEUE_URL", "https://example.com/queue")
+os.environ.setdefault("S3_BUCKET_NAME", "bucket")
+os.environ.setdefault("URL_SERVICE_TECH", "https://example.com")
+
+from src.domain.entity.order import Order
+from src.infrastructure.repository.order_repository_impl import OrderRepositoryImpl, _month_ranges
+
+
+def _order(order_id, order_date):
+    return Order(
+        order_id=order_id,
+        order_date=order_date,
+        product_id=100,
+        product_name="Curso",
+        certificate_details="Detalhes",
+        certificate_logo="logo.png",
+        certificate_background="background.png",
+        checkin_latitude="0",
+        checkin_longitude="0",
+        time_checkin="10:00",
+        participant_email="User@Example.com",
+        participant_first_name="User",
+        participant_last_name=str(order_id),
+        participant_cpf="000",
+        participant_phone="000",
+        participant_city="Florianópolis",
+    )
+
+
+class FakeDynamoDBService:
+    """Índice orders_by_month_idx em memória: partição por mês, ordenada pela chave de RANGE."""
+
+    def __init__(self, items):
+        self.items = items
+        self.pages_read = 0
+        self.lock = threading.Lock()
+
+    def _month_items(self, expression_values):
+        return sorted(
+            (
+                item for item in self.items
+                if item["order_year_month"] == expression_values[":order_year_month"]
+                and expression_values[":start_range"] <= item["order_date_order_id"] <= expression_values[":end_range"]
+            ),
+            key=lambda item: item["order_date_order_id"],
+        )
+
+    def query_table(self, table_name, key_condition, expression_values, index_name=None):
+        return self._month_items(expression_values)
+
+    def iterate_query_pages(self, table_name, key_condition, expression_values, index_name=None, page_size=None):
+        items = self._month_items(expression_values)
+        page_size = page_size or len(items) or 1
+        for start in range(0, len(items), page_size):
+            with self.lock:
+                self.pages_read += 1
+            yield items[start:start + page_size]
+
+
+class OrdersByDateRangeTestCase(unittest.TestCase):
+    def setUp(self):
+        repository = OrderRepositoryImpl(None)
+        dates = ["2025-03-15 10:00:00", "2025-01-05 09:00:00", "2025-02-20 08:00:00",
+                 "2025-01-25 12:00:00", "2024-12-31 23:00:00", "2025-03-01 00:00:00"]
+        items = [repository._prepare_item(_order(order_id, date)) for order_id, date in enumerate(dates, start=1)]
+        self.service = FakeDynamoDBService(items)
+        self.repository = OrderRepositoryImpl(self.service)
+
+    def test_month_ranges_cover_interval(self):
+        ranges = _month_ranges("2025-03-10", "2025-01-15")
+
+        self.assertEqual([month for month, _, _ in ranges], ["2025-01", "2025-02", "2025-03"])
+        self.assertTrue(ranges[0][1].startswith("2025-01-15T00:00:00#"))
+        self.assertTrue(ranges[-1][2].startswith("2025-03-10T00:00:00#"))
+
+    def test_get_orders_by_date_range_keeps_date_order(self):
+        orders = self.repository.get_orders_by_date_range("2025-01-01", "2025-03-31")
+
+        self.assertEqual([order.order_id for order in orders], [2, 4, 3, 6, 1])
+
+    def test_iter_orders_by_date_range_merges_months(self):
+        orders = list(self.repository.iter_orders_by_date_range("2024-12-01", "2025-03-31", page_size=1))
+
+        self.assertEqual([order.order_id for order in orders], [5, 2, 4, 3, 6, 1])
+
+    def test_iter_orders_by_date_range_stops_at_limit(self):
+        orders = list(self.repository.iter_orders_by_date_range("2025-01-01", "2025-03-31", limit=2))
+
+        self.assertEqual([order.order_id for order in orders], [2, 4])
+        # Uma página (de `limit` itens) por mês, mais a pré-busca da seguinte em janeiro
+        self.assertLessEqual(self.service.pages_read, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
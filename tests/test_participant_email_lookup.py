@@ -0,0 +1,152 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("REGION", "us-east-1")
+os.environ.setdefault("BUILDER_QUEUE_URL", "https://example.com/queue")
+os.environ.setdefault("S3_BUCKET_NAME", "bucket")
+os.environ.setdefault("URL_SERVICE_TECH", "https://example.com")
+
+from botocore.exceptions import ClientError
+
+from src.domain.entity.participant import Participant
+from src.infrastructure.config.config import config
+from src.infrastructure.repository.derived_keys_backfill import ParticipantEmailLookupTarget
+from src.infrastructure.repository.participant_repository_impl import ParticipantRepositoryImpl
+
+
+class FakeDynamoDBService:
+    """Tabela de participantes em memória, chaveada por id."""
+
+    def __init__(self):
+        self.items = {}
+        self.queries = 0
+
+    def put_item(self, item, table_name, return_values=None, condition_expression=None):
+        if condition_expression == "attribute_not_exists(id)" and item["id"] in self.items:
+            raise ClientError({"Error": {"Code": "ConditionalCheckFailedException"}}, "PutItem")
+        self.items[item["id"]] = dict(item)
+        return {}
+
+    def get_item(self, key, table_name, projection=None, consistent_read=False):
+        item = self.items.get(key["id"])
+        return dict(item) if item else None
+
+    def batch_get_items(self, keys, table_name, projection=None, consistent_read=False):
+        return [dict(self.items[key["id"]]) for key in keys if key["id"] in self.items]
+
+    def scan_table(self, table_name):
+        return [dict(item) for item in self.items.values()]
+
+    def delete_item(self, key, table_name):
+        self.items.pop(key["id"], None)
+        return {}
+
+    def query_table(self, table_name, key_condition, expression_values, index_name=None):
+        self.queries += 1
+        return [
+            dict(item) for item in self.items.values()
+            if item.get("email") == expression_values[":email"]
+        ]
+
+
+def _participant(email, first_name="User"):
+    return Participant(first_name=first_name, last_name="Test", email=email)
+
+
+class ParticipantEmailLookupTestCase(unittest.TestCase):
+    def setUp(self):
+        self.service = FakeDynamoDBService()
+        self.repository = ParticipantRepositoryImpl(self.service)
+
+    def test_create_claims_email_once(self):
+        first = self.repository.create(_participant("User@Example.com"))
+        second = self.repository.create(_participant(" user@example.com ", first_name="Outro"))
+
+        self.assertEqual(second.id, first.id)
+        self.assertEqual(self.service.items["email#user@example.com"]["participant_id"], str(first.id))
+        self.assertEqual(len([item for item in self.service.items.values() if "email" in item]), 1)
+        self.assertEqual(len(self.repository.get_all()), 1)
+
+    def test_get_by_email_reads_lookup_without_gsi(self):
+        created = self.repository.create(_participant("user@example.com"))
+
+        with mock.patch.object(config, "PARTICIPANT_EMAIL_LOOKUP_FALLBACK", False):
+            self.assertEqual(self.repository.get_by_email("USER@example.com").id, created.id)
+            self.assertIsNone(self.repository.get_by_email("other@example.com"))
+        self.assertEqual(self.service.queries, 0)
+
+    def test_create_reuses_id_of_orphan_lookup(self):
+        self.service.items["email#user@example.com"] = {
+            "id": "email#user@example.com",
+            "participant_id": "11111111-1111-1111-1111-111111111111",
+        }
+
+        with mock.patch.object(config, "PARTICIPANT_EMAIL_LOOKUP_FALLBACK", False):
+            created = self.repository.create(_participant("user@example.com"))
+
+        self.assertEqual(str(created.id), "11111111-1111-1111-1111-111111111111")
+        self.assertIn(str(created.id), self.service.items)
+
+    def test_create_claims_again_when_lookup_is_released(self):
+        lookup_id = "email#user@example.com"
+        self.service.items[lookup_id] = {"id": lookup_id, "participant_id": "11111111-1111-1111-1111-111111111111"}
+        get_item = self.service.get_item
+
+        def released_after_claim(key, table_name, projection=None, consistent_read=False):
+            # Remoção concorrente logo depois da reserva recusada
+            self.service.items.pop(lookup_id, None)
+            return get_item(key, table_name, projection, consistent_read)
+
+        with mock.patch.object(config, "PARTICIPANT_EMAIL_LOOKUP_FALLBACK", False), \
+                mock.patch.object(self.service, "get_item", side_effect=released_after_claim):
+            created = self.repository.create(_participant("user@example.com"))
+
+        self.assertEqual(self.service.items[lookup_id]["participant_id"], str(created.id))
+        self.assertIn(str(created.id), self.service.items)
+
+    def test_create_gives_up_when_lookup_keeps_disappearing(self):
+        claims = mock.patch.object(self.repository, "_claim_email", return_value=False)
+        with mock.patch.object(config, "PARTICIPANT_EMAIL_LOOKUP_FALLBACK", False), claims as claim_email:
+            with self.assertRaises(RuntimeError):
+                self.repository.create(_participant("user@example.com"))
+
+        self.assertEqual(claim_email.call_count, 3)
+        self.assertEqual(self.service.items, {})
+
+    def test_get_by_emails_and_email_change(self):
+        first = self.repository.create(_participant("a@example.com"))
+        self.repository.create(_participant("b@example.com"))
+
+        found = self.repository.get_by_emails(["A@example.com", "b@example.com", "c@example.com"])
+        self.assertEqual(sorted(found), ["A@example.com", "b@example.com"])
+
+        changed = first.model_copy(update={"email": "new@example.com"})
+        with mock.patch.object(self.service, "update_item", create=True, return_value={}):
+            self.repository.update(str(first.id), changed)
+        self.assertNotIn("email#a@example.com", self.service.items)
+        self.assertEqual(self.service.items["email#new@example.com"]["participant_id"], str(first.id))
+
+    def test_backfill_creates_missing_lookups(self):
+        existing = self.repository.create(_participant("a@example.com"))
+        legacy = _participant("b@example.com").model_dump(mode="json")
+        duplicate = _participant("B@example.com").model_dump(mode="json")
+        duplicate["email"] = "b@example.com"
+
+        items, invalid = ParticipantEmailLookupTarget(self.service).items_to_write([
+            self.service.items[str(existing.id)],
+            self.service.items["email#a@example.com"],
+            legacy,
+            duplicate,
+            {"id": "sem-dados"},
+        ])
+
+        self.assertEqual(items, [{"id": "email#b@example.com", "participant_id": legacy["id"]}])
+        self.assertEqual(invalid, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+import os
+import sys
+import unittest
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("REGION", "us-east-1")
+os.environ.setdefault("BUILDER_QUEUE_URL", "https://example.com/queue")
+os.environ.setdefault("S3_BUCKET_NAME", "bucket")
+os.environ.setdefault("URL_SERVICE_TECH", "https://example.com")
+
+from src.application.rebuild_product_stats import RebuildProductStats
+from src.domain.entity.certificate import Certificate
+from src.infrastructure.repository.certificate_repository_impl import CertificateRepositoryImpl, _stats_deltas
+from src.infrastructure.repository.product_stats_repository_impl import ProductStatsRepositoryImpl
+
+
+def _certificate(order_id, product_id=100, success=False, generated_date=None):
+    return Certificate(
+        id=uuid.uuid4(),
+        success=success,
+        generated_date=generated_date,
+        order_id=order_id,
+        order_date="2025-01-01 10:00:00",
+        product_id=product_id,
+        product_name="Curso",
+        certificate_details="Detalhes",
+        certificate_logo="logo.png",
+        certificate_background="background.png",
+        participant_email="user@example.com",
+        participant_first_name="User",
+        participant_last_name=str(order_id),
+        participant_cpf=None,
+        participant_phone=None,
+        participant_city=None,
+    )
+
+
+class FakeDynamoDBService:
+    def __init__(self, old_item=None):
+        self.old_item = old_item
+        self.updates = []
+
+    def put_item(self, item, table_name, return_values=None):
+        return {"Attributes": self.old_item} if self.old_item else {}
+
+    def update_item(self, key, update_expression, expression_values, table_name, expression_attribute_names=None):
+        self.updates.append((key, update_expression, expression_values))
+        return {}
+
+    def _convert_from_dynamodb_format(self, item):
+        return item
+
+
+class FakeCertificateTable:
+    """Tabela com um item atual e um índice por id atrasado (eventualmente consistente)."""
+
+    def __init__(self, current_item, index_item):
+        self.current_item = current_item
+        self.index_item = index_item
+        self.update_kwargs = None
+
+    def query_table(self, table_name, key_condition, expression_values, index_name=None, projection=None):
+        return [dict(self.index_item)]
+
+    def update_item(self, key, update_expression, expression_values, table_name, **kwargs):
+        self.update_kwargs = kwargs
+        old_item = dict(self.current_item)
+        self.current_item.update({name[1:]: value for name, value in expression_values.items()})
+        return {"Attributes": old_item if kwargs.get("return_values") == "ALL_OLD" else dict(self.current_item)}
+
+    def _convert_from_dynamodb_format(self, item):
+        return item
+
+
+class FakeStatsRepository:
+    def __init__(self):
+        self.increments = []
+        self.saved = {}
+
+    def increment(self, product_id, deltas):
+        self.increments.append((product_id, deltas))
+
+    def save(self, stats):
+        self.saved[stats.product_id] = stats
+        return stats
+
+
+class FakeCertificateRepository:
+    def __init__(self, segments):
+        self.segments = segments
+
+    def iter_scan_segment(self, segment, total_segments, projection=None):
+        yield from self.segments[segment]
+
+
+class ProductStatsTestCase(unittest.TestCase):
+    def test_deltas_follow_status_transitions(self):
+        pending = {"product_id": 100, "success": False, "generated_date": None}
+        succeeded = {"product_id": 100, "success": True, "generated_date": "2025-01-20T10:30:45"}
+
+        self.assertEqual(_stats_deltas(None, pending), {100: {"total": 1, "pending": 1}})
+        self.assertEqual(_stats_deltas(pending, succeeded), {100: {"total": 0, "pending": -1, "success": 1}})
+        self.assertEqual(_stats_deltas(succeeded, None), {100: {"total": -1, "success": -1}})
+
+    def test_create_over_existing_item_only_moves_status(self):
+        old_item = {"product_id": 100, "success": False, "generated_date": "2025-01-20T10:30:45"}
+        stats_repository = FakeStatsRepository()
+        repository = CertificateRepositoryImpl(FakeDynamoDBService(old_item), stats_repository=stats_repository)
+
+        repository.create(_certificate(1, success=True, generated_date="2025-01-21T10:30:45"))
+
+        self.assertEqual(stats_repository.increments, [(100, {"total": 0, "failed": -1, "success": 1})])
+
+    def test_update_uses_the_old_image_not_the_index(self):
+        certificate = _certificate(1)
+        current_item = {**certificate.model_dump(mode="json"), "success": True, "generated_date": "2025-01-20T10:30:45"}
+        # O índice ainda mostra a versão pendente, já substituída por um resultado do builder
+        service = FakeCertificateTable(current_item, index_item=certificate.model_dump(mode="json"))
+        stats_repository = FakeStatsRepository()
+        repository = CertificateRepositoryImpl(service, stats_repository=stats_repository)
+
+        changed = certificate.model_copy(update={"success": False, "generated_date": "2025-01-22T10:30:45"})
+        updated = repository.update(str(certificate.id), changed)
+
+        self.assertEqual(service.update_kwargs["return_values"], "ALL_OLD")
+        self.assertIn("#id = :expected_id", service.update_kwargs["condition_expression"])
+        self.assertEqual(stats_repository.increments, [(100, {"total": 0, "success": -1, "failed": 1})])
+        self.assertFalse(updated.success)
+        self.assertEqual(updated.generated_date, "2025-01-22T10:30:45")
+
+    def test_increment_uses_atomic_add(self):
+        service = FakeDynamoDBService()
+        ProductStatsRepositoryImpl(service).increment(100, {"total": 0, "pending": -1, "success": 1})
+
+        key, update_expression, expression_values = service.updates[0]
+        self.assertEqual(key, {"product_id": 100})
+        self.assertTrue(update_expression.startswith("ADD #pending :pending, #success :success SET"))
+        self.assertNotIn(":total", expression_values)
+
+    def test_rebuild_merges_scan_segments(self):
+        certificate_repository = FakeCertificateRepository([
+            [[_certificate(1, success=True), _certificate(2)]],
+            [[_certificate(3, generated_date="2025-01-20T10:30:45")], [_certificate(4, product_id=200)]],
+        ])
+        stats_repository = FakeStatsRepository()
+
+        results = RebuildProductStats(certificate_repository, stats_repository).execute(total_segments=2)
+
+        self.assertEqual(
+            results[100].model_dump(include={"total", "success", "failed", "pending"}),
+            {"total": 3, "success": 1, "failed": 1, "pending": 1},
+        )
+        self.assertEqual(results[200].pending, 1)
+        self.assertEqual(set(stats_repository.saved), {100, 200})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+import os
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("REGION", "us-east-1")
+os.environ.setdefault("BUILDER_QUEUE_URL", "https://example.com/queue")
+os.environ.setdefault("S3_BUCKET_NAME", "bucket")
+os.environ.setdefault("URL_SERVICE_TECH", "https://example.com")
+
+from botocore.exceptions import ClientError
+
+from src.application import product_sync_guard
+from src.application.product_sync_guard import ProductSyncGuard
+from src.domain.entity.sync_lease import LEASE_DONE, LEASE_FAILED, LEASE_RUNNING
+from src.domain.exception.sync_in_progress import SyncInProgress
+from src.domain.response.build_order import BuildOrderResponse
+from src.infrastructure.repository.sync_lease_repository_impl import SyncLeaseRepositoryImpl
+
+
+def _conditional_check_failed(operation):
+    return ClientError({"Error": {"Code": "ConditionalCheckFailedException"}}, operation)
+
+
+class FakeDynamoDBService:
+    """Avalia só as condições usadas pelo SyncLeaseRepositoryImpl."""
+
+    def __init__(self):
+        self.items = {}
+        self.lock = threading.Lock()
+
+    def put_item(self, item, table_name, condition_expression=None, expression_values=None,
+                 expression_attribute_names=None):
+        with self.lock:
+            current = self.items.get(item["lease_id"])
+            if current is not None and current["status"] == expression_values[":running"] \
+                    and current["expires_at"] > expression_values[":now"]:
+                raise _conditional_check_failed("PutItem")
+            self.items[item["lease_id"]] = dict(item)
+
+    def get_item(self, key, table_name, consistent_read=False):
+        with self.lock:
+            item = self.items.get(key["lease_id"])
+            return dict(item) if item else None
+
+    def update_item(self, key, update_expression, expression_values, table_name,
+                    expression_attribute_names=None, condition_expression=None):
+        with self.lock:
+            current = self.items.get(key["lease_id"])
+            if current is None or current["job_id"] != expression_values[":job_id"]:
+                raise _conditional_check_failed("UpdateItem")
+            for placeholder, name in expression_attribute_names.items():
+                current[name] = expression_values[f":{placeholder[1:]}"]
+
+
+def _response(quantity):
+    return BuildOrderResponse(certificate_quantity=quantity, existing_orders=[], new_orders=[quantity])
+
+
+class TestSyncLeaseRepository(unittest.TestCase):
+    def setUp(self):
+        self.dynamodb = FakeDynamoDBService()
+        self.repository = SyncLeaseRepositoryImpl(self.dynamodb)
+
+    def test_acquire_is_exclusive_until_finished(self):
+        lease = self.repository.acquire("product#1", ttl_seconds=60)
+
+        self.assertIsNotNone(lease)
+        self.assertIsNone(self.repository.acquire("product#1", ttl_seconds=60))
+        self.assertIn("ttl", self.dynamodb.items["product#1"])
+
+        self.repository.complete(lease, "{}")
+        stored = self.repository.get("product#1")
+        self.assertEqual(stored.status, LEASE_DONE)
+        self.assertEqual(stored.result, "{}")
+        self.assertIsNotNone(self.repository.acquire("product#1", ttl_seconds=60))
+
+    def test_expired_lease_can_be_taken_and_old_owner_cannot_release_it(self):
+        old = self.repository.acquire("product#1", ttl_seconds=60)
+        self.dynamodb.items["product#1"]["expires_at"] = int(time.time()) - 1
+
+        new = self.repository.acquire("product#1", ttl_seconds=60)
+        self.assertIsNotNone(new)
+
+        self.repository.fail(old)
+        stored = self.repository.get("product#1")
+        self.assertEqual(stored.job_id, new.job_id)
+        self.assertEqual(stored.status, LEASE_RUNNING)
+
+
+class TestProductSyncGuard(unittest.TestCase):
+    def setUp(self):
+        self.repository = SyncLeaseRepositoryImpl(FakeDynamoDBService())
+
+    def test_runs_operation_and_stores_result(self):
+        guard = ProductSyncGuard(self.repository, ttl_seconds=60, wait_seconds=0)
+
+        result = guard.run("1", lambda: _response(3), BuildOrderResponse)
+
+        self.assertEqual(result.certificate_quantity, 3)
+        stored = self.repository.get("product#1")
+        self.assertEqual(stored.status, LEASE_DONE)
+        self.assertEqual(BuildOrderResponse.model_validate_json(stored.result).certificate_quantity, 3)
+
+    def test_concurrent_call_without_wait_raises_sync_in_progress(self):
+        holder = self.repository.acquire("product#1", ttl_seconds=60)
+        guard = ProductSyncGuard(self.repository, ttl_seconds=60, wait_seconds=0)
+        operation = mock.Mock()
+
+        with self.assertRaises(SyncInProgress) as context:
+            guard.run("1", operation, BuildOrderResponse)
+
+        self.assertEqual(context.exception.job_id, holder.job_id)
+        operation.assert_not_called()
+
+    def test_waiter_receives_result_of_running_job(self):
+        started = threading.Event()
+        release = threading.Event()
+        results = {}
+
+        def slow_operation():
+            started.set()
+            release.wait(5)
+            return _response(7)
+
+        owner = threading.Thread(
+            target=lambda: results.setdefault("owner", ProductSyncGuard(
+                self.repository, ttl_seconds=60, wait_seconds=0
+            ).run("1", slow_operation, BuildOrderResponse))
+        )
+        owner.start()
+        started.wait(5)
+
+        operation = mock.Mock()
+        with mock.patch.object(product_sync_guard, "LEASE_POLL_SECONDS", 0.01):
+            threading.Timer(0.05, release.set).start()
+            waited = ProductSyncGuard(self.repository, ttl_seconds=60, wait_seconds=5).run(
+                "1", operation, BuildOrderResponse
+            )
+        owner.join(5)
+
+        operation.assert_not_called()
+        self.assertEqual(waited.certificate_quantity, 7)
+        self.assertEqual(results["owner"].certificate_quantity, 7)
+
+    def test_failed_operation_releases_lease(self):
+        guard = ProductSyncGuard(self.repository, ttl_seconds=60, wait_seconds=0)
+
+        with self.assertRaises(RuntimeError):
+            guard.run("1", mock.Mock(side_effect=RuntimeError("boom")), BuildOrderResponse)
+
+        self.assertEqual(self.repository.get("product#1").status, LEASE_FAILED)
+        self.assertEqual(guard.run("1", lambda: _response(1), BuildOrderResponse).certificate_quantity, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,229 @@
+import json
+import os
+import sys
+import unittest
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("REGION", "us-east-1")
+os.environ.setdefault("BUILDER_QUEUE_URL", "https://example.com/queue")
+os.environ.setdefault("S3_BUCKET_NAME", "bucket")
+os.environ.setdefault("URL_SERVICE_TECH", "https://example.com")
+
+from src.application.dto.requeue_failed_dto import RequeueFailedRequestDto
+from src.application.requeue_failed_certificates import RequeueFailedCertificates
+from src.application.send_for_build_certificate import SendForBuildCertificate
+from src.domain.entity.certificate import Certificate
+from src.domain.entity.order import Order
+from src.infrastructure.aws import sqs_service as sqs_service_module
+from src.infrastructure.serialization.json_serializer import dumps_stdlib
+
+
+def _certificate(order_id, product_id=100):
+    return Certificate(
+        id=uuid.uuid4(),
+        success=False,
+        order_id=order_id,
+        order_date="2025-01-01 10:00:00",
+        product_id=product_id,
+        product_name="Curso",
+        certificate_details="Detalhes",
+        certificate_logo="logo.png",
+        certificate_background="background.png",
+        participant_email="user@example.com",
+        participant_first_name="User",
+        participant_last_name=str(order_id),
+        participant_cpf=None,
+        participant_phone=None,
+        participant_city=None,
+    )
+
+
+class FakeCertificateRepository:
+    """Páginas fixas; a posição depois da página i é {"p": {"page": i + 1}} ({} na última)."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested = None
+        self.marked = []
+
+    def iter_unsuccessful(self, product_id=None, page_size=None, start_after=None):
+        self.requested = (product_id, page_size)
+        first = start_after["p"]["page"] if start_after else 0
+        for index in range(first, len(self.pages)):
+            position = {"p": {"page": index + 1}} if index + 1 < len(self.pages) else {}
+            yield self.pages[index], position
+
+    def mark_build_requested(self, order_ids, requested_at):
+        self.marked.append(list(order_ids))
+        for page in self.pages:
+            for certificate in page:
+                if certificate.order_id in order_ids:
+                    certificate.build_requested_at = requested_at.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _order(order_id, time_checkin=None):
+    return Order(
+        order_id=order_id, order_date="2025-01-01 10:00:00", product_id=100, product_name="Curso",
+        certificate_details="Detalhes", certificate_logo="logo.png", certificate_background="background.png",
+        checkin_latitude=f"-27.{order_id}", checkin_longitude=f"-48.{order_id}",
+        time_checkin=f"{order_id}h" if time_checkin is None else time_checkin,
+        participant_email="user@example.com", participant_first_name="User", participant_last_name=str(order_id),
+        participant_cpf="", participant_phone="", participant_city="",
+    )
+
+
+class FakeOrderRepository:
+    """Um pedido com check-in próprio para cada order_id, exceto os informados em `orders`."""
+
+    def __init__(self, orders=None):
+        self.orders = orders or {}
+        self.calls = []
+
+    def get_by_order_ids(self, order_ids):
+        order_ids = list(order_ids)
+        self.calls.append(order_ids)
+        orders = {order_id: self.orders.get(order_id, _order(order_id)) for order_id in order_ids}
+        return {order_id: order for order_id, order in orders.items() if order is not None}
+
+
+class FakeSQSService:
+    def __init__(self):
+        self.batches = []
+        self.queue_urls = []
+
+    def send_message_batch(self, messages, queue_url=None):
+        self.batches.append(messages)
+        self.queue_urls.append(queue_url)
+        return len(messages)
+
+
+class RequeueFailedCertificatesTestCase(unittest.TestCase):
+    def test_requeues_pages_up_to_limit(self):
+        repository = FakeCertificateRepository([[_certificate(1), _certificate(2)], [_certificate(3), _certificate(4)]])
+        order_repository = FakeOrderRepository()
+        sqs_service = FakeSQSService()
+        service = RequeueFailedCertificates(repository, order_repository, SendForBuildCertificate(sqs_service))
+
+        response = service.execute(RequeueFailedRequestDto(product_id=100, limit=3))
+
+        self.assertEqual(response.requeued_order_ids, [1, 2, 3])
+        self.assertTrue(response.truncated)
+        self.assertEqual(repository.requested, (100, 3))
+        # Um BatchGetItem de pedidos por página
+        self.assertEqual(order_repository.calls, [[1, 2], [3]])
+        orders = [order for batch in sqs_service.batches for message in batch for order in message]
+        self.assertEqual([order["order_id"] for order in orders], [1, 2, 3])
+        self.assertEqual([order["time_checkin"] for order in orders], ["1h", "2h", "3h"])
+        self.assertEqual(orders[1]["checkin_latitude"], "-27.2")
+        self.assertEqual(orders[0]["cpf"], "")
+        self.assertEqual(set(sqs_service.queue_urls), {None})
+
+    def test_consecutive_truncated_runs_resume_without_resending(self):
+        pages = [
+            [_certificate(1), _certificate(2), _certificate(3)],
+            [_certificate(4), _certificate(5), _certificate(6)],
+            [_certificate(7)],
+        ]
+        repository = FakeCertificateRepository(pages)
+        sqs_service = FakeSQSService()
+        service = RequeueFailedCertificates(
+            repository, FakeOrderRepository(), SendForBuildCertificate(sqs_service, repository)
+        )
+
+        first = service.execute(RequeueFailedRequestDto(limit=4))
+        second = service.execute(RequeueFailedRequestDto(limit=2, start_after=first.next_start_after))
+        third = service.execute(RequeueFailedRequestDto(limit=4, start_after=second.next_start_after))
+
+        # A primeira parou no meio da segunda página; a segunda relê essa página e ignora o 4, já enviado
+        self.assertEqual(first.requeued_order_ids, [1, 2, 3, 4])
+        self.assertTrue(first.truncated)
+        self.assertEqual(second.requeued_order_ids, [5, 6])
+        self.assertTrue(second.truncated)
+        self.assertIsNotNone(second.next_start_after)
+        self.assertEqual(third.requeued_order_ids, [7])
+        self.assertFalse(third.truncated)
+        self.assertIsNone(third.next_start_after)
+        sent = [order["order_id"] for batch in sqs_service.batches for message in batch for order in message]
+        self.assertEqual(sent, [1, 2, 3, 4, 5, 6, 7])
+
+    def test_skips_certificates_recently_sent_to_build(self):
+        recent, stale = _certificate(1), _certificate(2)
+        recent.build_requested_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        stale.build_requested_at = "2025-01-01T10:00:00.000000Z"
+        sqs_service = FakeSQSService()
+        service = RequeueFailedCertificates(
+            FakeCertificateRepository([[recent, stale]]), FakeOrderRepository(), SendForBuildCertificate(sqs_service)
+        )
+
+        response = service.execute(RequeueFailedRequestDto())
+
+        self.assertEqual(response.requeued_order_ids, [2])
+
+    def test_skips_orders_without_check_in(self):
+        sqs_service = FakeSQSService()
+        order_repository = FakeOrderRepository({2: _order(2, time_checkin=""), 3: None})
+        service = RequeueFailedCertificates(
+            FakeCertificateRepository([[_certificate(1), _certificate(2), _certificate(3)]]),
+            order_repository,
+            SendForBuildCertificate(sqs_service),
+        )
+
+        response = service.execute(RequeueFailedRequestDto())
+
+        self.assertEqual(response.requeued_order_ids, [1])
+        self.assertEqual(response.skipped_order_ids, [2, 3])
+        sent = [order["order_id"] for batch in sqs_service.batches for message in batch for order in message]
+        self.assertEqual(sent, [1])
+
+    def test_rejects_invalid_cursor(self):
+        service = RequeueFailedCertificates(
+            FakeCertificateRepository([]), FakeOrderRepository(), SendForBuildCertificate(FakeSQSService())
+        )
+
+        with self.assertRaises(ValueError):
+            service.execute(RequeueFailedRequestDto(start_after="not-a-cursor"))
+
+
+class FakeSQSClient:
+    def __init__(self):
+        self.calls = []
+
+    def send_message_batch(self, QueueUrl, Entries):
+        self.calls.append([entry["Id"] for entry in Entries])
+        # Na primeira chamada, a última entrada é recusada
+        if len(self.calls) == 1:
+            return {
+                "Successful": [{"Id": entry["Id"]} for entry in Entries[:-1]],
+                "Failed": [{"Id": Entries[-1]["Id"], "Code": "InternalError"}],
+            }
+        return {"Successful": [{"Id": entry["Id"]} for entry in Entries]}
+
+
+class SQSServiceSendBatchTestCase(unittest.TestCase):
+    def test_chunks_entries_and_retries_failed(self):
+        service = sqs_service_module.SQSService.__new__(sqs_service_module.SQSService)
+        service.aws = FakeSQSClient()
+        service.queue_url = "https://example.com/queue"
+        service.serializer = dumps_stdlib
+
+        with mock.patch.object(sqs_service_module.time, "sleep"):
+            sent = service.send_message_batch([[{"order_id": i}] for i in range(12)])
+
+        self.assertEqual(sent, 12)
+        self.assertEqual([len(ids) for ids in service.aws.calls], [10, 1, 2])
+        self.assertEqual(service.aws.calls[1], service.aws.calls[0][-1:])
+
+    def test_respects_payload_size_limit(self):
+        service = sqs_service_module.SQSService.__new__(sqs_service_module.SQSService)
+        service.serializer = dumps_stdlib
+        bodies = [json.dumps({"x": "a" * 100 * 1024})] * 3
+
+        self.assertEqual([len(batch) for batch in service._batch_entries(bodies)], [2, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import base64
+import gzip
+import json
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.infrastructure.aws import response_compression
+from src.infrastructure.aws.response_compression import compress_response, negotiate_encoding
+
+
+class ResponseCompressionTestCase(unittest.TestCase):
+    def setUp(self):
+        self.body = json.dumps([{"product_name": "Workshop de Python Avançado", "order_id": i} for i in range(200)])
+
+    def _response(self, body=None, content_type="application/json"):
+        return {
+            "statusCode": 200,
+            "body": self.body if body is None else body,
+            "isBase64Encoded": False,
+            "multiValueHeaders": {"Content-Type": [content_type]},
+        }
+
+    def test_gzip_compresses_large_json_as_base64(self):
+        with mock.patch.object(response_compression, "brotli", None):
+            response = compress_response(self._response(), "gzip, deflate", min_size=1024)
+
+        self.assertTrue(response["isBase64Encoded"])
+        self.assertEqual(response["multiValueHeaders"]["Content-Encoding"], ["gzip"])
+        self.assertEqual(response["multiValueHeaders"]["Vary"], ["Accept-Encoding"])
+        decompressed = gzip.decompress(base64.b64decode(response["body"])).decode("utf-8")
+        self.assertEqual(decompressed, self.body)
+        self.assertLess(len(response["body"]), len(self.body) / 3)
+
+    def test_skips_small_bodies_and_unsupported_clients(self):
+        small = self._response(body='{"ok": true}')
+        self.assertIs(compress_response(small, "gzip", min_size=1024), small)
+
+        response = self._response()
+        self.assertIs(compress_response(response, "identity", min_size=1024), response)
+        self.assertIs(compress_response(response, "gzip;q=0", min_size=1024), response)
+
+    def test_skips_already_encoded_and_binary_responses(self):
+        pre_gzipped = self._response()
+        pre_gzipped["multiValueHeaders"]["Content-Encoding"] = ["gzip"]
+        self.assertIs(compress_response(pre_gzipped, "gzip", min_size=0), pre_gzipped)
+
+        binary = self._response()
+        binary["isBase64Encoded"] = True
+        self.assertIs(compress_response(binary, "gzip", min_size=0), binary)
+
+        image = self._response(content_type="image/png")
+        self.assertIs(compress_response(image, "gzip", min_size=0), image)
+
+    def test_prefers_brotli_only_when_available(self):
+        with mock.patch.object(response_compression, "brotli", None):
+            self.assertEqual(negotiate_encoding("gzip, br"), "gzip")
+        with mock.patch.object(response_compression, "brotli", object()):
+            self.assertEqual(negotiate_encoding("gzip, br"), "br")
+            self.assertEqual(negotiate_encoding("gzip, br;q=0.5"), "gzip")
+            self.assertEqual(negotiate_encoding("*"), "br")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import datetime
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("REGION", "us-east-1")
+os.environ.setdefault("BUILDER_QUEUE_URL", "https://example.com/queue")
+os.environ.setdefault("S3_BUCKET_NAME", "bucket")
+os.environ.setdefault("URL_SERVICE_TECH", "https://example.com")
+
+import httpx
+from botocore.exceptions import ClientError
+
+from src.application import fetch_order_tech_floripa as fetch_module
+from src.infrastructure.retry import retry_policy
+from src.infrastructure.retry.retry_policy import RetryPolicy, attempt_timeout, is_retryable_error, request_deadline
+
+
+def _http_error(status):
+    request = httpx.Request("GET", "https://example.com/orders")
+    return httpx.HTTPStatusError("erro", request=request, response=httpx.Response(status, request=request))
+
+
+def _client_error(code, status):
+    return ClientError({"Error": {"Code": code}, "ResponseMetadata": {"HTTPStatusCode": status}}, "SendMessage")
+
+
+class FakeLambdaContext:
+    def __init__(self, remaining_ms):
+        self.remaining_ms = remaining_ms
+
+    def get_remaining_time_in_millis(self):
+        return self.remaining_ms
+
+
+class RetryableErrorTestCase(unittest.TestCase):
+    def test_classifies_throttles_and_server_errors(self):
+        self.assertTrue(is_retryable_error(_http_error(503)))
+        self.assertTrue(is_retryable_error(_http_error(429)))
+        self.assertFalse(is_retryable_error(_http_error(404)))
+        self.assertTrue(is_retryable_error(httpx.ConnectTimeout("timeout")))
+        self.assertTrue(is_retryable_error(_client_error("ThrottlingException", 400)))
+        self.assertTrue(is_retryable_error(_client_error("InternalError", 500)))
+        self.assertFalse(is_retryable_error(_client_error("AccessDenied", 403)))
+        self.assertFalse(is_retryable_error(ValueError("bug")))
+
+
+class RetryPolicyTestCase(unittest.TestCase):
+    def setUp(self):
+        sleep_patch = mock.patch.object(retry_policy.time, "sleep")
+        record_patch = mock.patch.object(RetryPolicy, "_record")
+        self.sleep = sleep_patch.start()
+        self.record = record_patch.start()
+        self.addCleanup(mock.patch.stopall)
+
+    def test_retries_transient_errors_and_records_attempts(self):
+        operation = mock.Mock(side_effect=[_http_error(503), _http_error(502), "ok"])
+
+        result = RetryPolicy("fetch", max_attempts=3, base_delay=1.0).call(operation)
+
+        self.assertEqual(result, "ok")
+        self.assertEqual(operation.call_count, 3)
+        self.assertTrue(all(0 <= call.args[0] <= 2.0 for call in self.sleep.call_args_list))
+        self.record.assert_called_once_with(3, "success")
+
+    def test_does_not_retry_client_errors(self):
+        operation = mock.Mock(side_effect=_http_error(400))
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            RetryPolicy("fetch", max_attempts=3).call(operation)
+
+        self.assertEqual(operation.call_count, 1)
+        self.record.assert_called_once_with(1, "failure")
+
+    def test_stops_when_the_lambda_deadline_is_near(self):
+        operation = mock.Mock(side_effect=_http_error(503))
+        policy = RetryPolicy("fetch", max_attempts=5, base_delay=10.0, max_delay=10.0)
+
+        with mock.patch.object(retry_policy.random, "uniform", return_value=5.0):
+            with request_deadline(FakeLambdaContext(remaining_ms=4000), margin_seconds=1.0):
+                with self.assertRaises(httpx.HTTPStatusError):
+                    policy.call(operation)
+
+        self.assertEqual(operation.call_count, 1)
+        self.sleep.assert_not_called()
+        self.assertIsNone(retry_policy.remaining_time())
+
+    def test_requires_a_minimum_attempt_budget_after_the_delay(self):
+        operation = mock.Mock(side_effect=[_http_error(503), "ok"])
+        # A espera (1s) cabe nos 3s restantes, mas sobrariam só 2s para a tentativa
+        policy = RetryPolicy("fetch", max_attempts=3, base_delay=1.0, min_attempt_seconds=2.5)
+
+        with mock.patch.object(retry_policy.random, "uniform", return_value=1.0):
+            with request_deadline(FakeLambdaContext(remaining_ms=4000), margin_seconds=1.0):
+                with self.assertRaises(httpx.HTTPStatusError):
+                    policy.call(operation)
+
+        self.assertEqual(operation.call_count, 1)
+        self.sleep.assert_not_called()
+
+
+class AttemptTimeoutTestCase(unittest.TestCase):
+    def test_caps_timeouts_at_the_remaining_time(self):
+        self.assertEqual(attempt_timeout(60.0), 60.0)
+        with request_deadline(FakeLambdaContext(remaining_ms=11000), margin_seconds=1.0):
+            self.assertLessEqual(attempt_timeout(60.0), 10.0)
+            self.assertGreater(attempt_timeout(60.0), 9.0)
+            self.assertEqual(attempt_timeout(5.0), 5.0)
+        with request_deadline(FakeLambdaContext(remaining_ms=500), margin_seconds=1.0):
+            self.assertEqual(attempt_timeout(60.0), 0.1)
+
+    def test_fetch_orders_uses_per_attempt_timeout(self):
+        response = httpx.Response(200, json=[{"order_id": 1}], request=httpx.Request("GET", "https://example.com"))
+        response.elapsed = datetime.timedelta(seconds=0.1)
+        client = mock.MagicMock()
+        client.__enter__.return_value.get.return_value = response
+
+        with mock.patch.object(fetch_module.httpx, "Client", return_value=client) as client_class:
+            with request_deadline(FakeLambdaContext(remaining_ms=21000), margin_seconds=1.0):
+                orders = fetch_module.FetchOrderTechFloripa().fetch_orders("100")
+
+        timeout = client_class.call_args.kwargs["timeout"]
+        self.assertEqual(orders, [{"order_id": 1}])
+        self.assertEqual(timeout.connect, 15.0)
+        self.assertLessEqual(timeout.read, 20.0)
+        self.assertLessEqual(timeout.pool, 20.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import os
+import sys
+import unittest
+import uuid
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("REGION", "us-east-1")
+os.environ.setdefault("BUILDER_QUEUE_URL", "https://example.com/queue")
+os.environ.setdefault("S3_BUCKET_NAME", "bucket")
+os.environ.setdefault("URL_SERVICE_TECH", "https://example.com")
+
+from src.application import send_for_build_certificate as send_for_build_module
+from src.application.mapper.tech_order import CertificateMapper
+from src.application.send_for_build_certificate import SendForBuildCertificate
+from src.domain.entity.certificate import Certificate
+
+PRIORITY_QUEUE_URL = "https://example.com/priority"
+
+
+def _orders(count):
+    return [
+        CertificateMapper.to_tech_order(
+            Certificate(
+                id=uuid.uuid4(),
+                order_id=order_id,
+                order_date="2025-01-01 10:00:00",
+                product_id=100,
+                product_name="Curso",
+                certificate_details="Detalhes",
+                certificate_logo="logo.png",
+                certificate_background="background.png",
+                participant_email="user@example.com",
+                participant_first_name="User",
+                participant_last_name=str(order_id),
+                participant_cpf=None,
+                participant_phone=None,
+                participant_city=None,
+            ),
+            None,
+        )
+        for order_id in range(1, count + 1)
+    ]
+
+
+class FakeSQSService:
+    def __init__(self):
+        self.queue_urls = []
+
+    def send_message(self, messagens, queue_url=None):
+        self.queue_urls.append(queue_url)
+
+    def send_message_batch(self, messages, queue_url=None):
+        self.queue_urls.append(queue_url)
+        return len(messages)
+
+
+class SendForBuildPriorityTestCase(unittest.TestCase):
+    def setUp(self):
+        self.sqs_service = FakeSQSService()
+        self.service = SendForBuildCertificate(self.sqs_service)
+        config_patch = mock.patch.multiple(
+            send_for_build_module.config,
+            BUILDER_PRIORITY_QUEUE_URL=PRIORITY_QUEUE_URL,
+            BUILDER_PRIORITY_MAX_ORDERS=2,
+        )
+        config_patch.start()
+        self.addCleanup(config_patch.stop)
+
+    def test_small_sends_go_to_priority_queue(self):
+        self.service.execute(_orders(2))
+        self.service.execute(_orders(3))
+
+        self.assertEqual(self.sqs_service.queue_urls, [PRIORITY_QUEUE_URL, None])
+
+    def test_priority_false_keeps_few_orders_in_default_queue(self):
+        self.service.execute(_orders(1), priority=False)
+
+        self.assertEqual(self.sqs_service.queue_urls, [None])
+
+    def test_priority_true_sends_many_orders_to_priority_queue(self):
+        self.service.execute(_orders(40), priority=True)
+
+        # 40 ordens = 2 mensagens de até 30, todas na fila prioritária
+        self.assertEqual(self.sqs_service.queue_urls, [PRIORITY_QUEUE_URL, PRIORITY_QUEUE_URL])
+
+    def test_falls_back_to_default_queue_without_priority_queue(self):
+        with mock.patch.object(send_for_build_module.config, "BUILDER_PRIORITY_QUEUE_URL", None):
+            self.service.execute(_orders(1))
+            self.service.execute(_orders(1), priority=True)
+            self.service.send_batched(_orders(1), priority=True)
+
+        self.assertEqual(self.sqs_service.queue_urls, [None, None, None])
+
+    def test_batched_sends_use_default_queue_unless_prioritized(self):
+        self.service.send_batched(_orders(1))
+        self.service.send_batched(_orders(1), priority=True)
+
+        self.assertEqual(self.sqs_service.queue_urls, [None, PRIORITY_QUEUE_URL])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+import os
+import sys
+import unittest
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("REGION", "us-east-1")
+os.environ.setdefault("BUILDER_QUEUE_URL", "https://example.com/queue")
+os.environ.setdefault("S3_BUCKET_NAME", "bucket")
+os.environ.setdefault("URL_SERVICE_TECH", "https://example.com")
+
+from src.domain.entity.certificate import Certificate
+from src.infrastructure.config.config import config
+from src.infrastructure.repository.certificate_repository_impl import CertificateRepositoryImpl
+from src.infrastructure.repository.sharding import ShardedIndex, iterate_sharded_pages, query_sharded
+
+INDEX = ShardedIndex("by_product_idx", "product_id", "by_product_shard_idx", "product_shard_key", "generated_at")
+
+
+class FakeDynamoDBService:
+    def __init__(self, partitions):
+        self.partitions = partitions
+        self.queries = []
+
+    def query_table(self, table_name, key_condition, expression_values, index_name=None,
+                    filter_expression=None, scan_index_forward=True, projection=None):
+        self.queries.append((index_name, expression_values, projection))
+        key = expression_values.get(":shard_key", expression_values.get(":shard_value"))
+        items = sorted(self.partitions.get(key, []), key=lambda item: item["generated_at"])
+        return items if scan_index_forward else items[::-1]
+
+    def iterate_query_pages(self, table_name, key_condition, expression_values, index_name=None,
+                            filter_expression=None, scan_index_forward=True, projection=None, page_size=None):
+        items = self.query_table(table_name, key_condition, expression_values, index_name,
+                                 filter_expression, scan_index_forward, projection)
+        for start in range(0, len(items), page_size or 1):
+            yield items[start:start + (page_size or 1)]
+
+    def iterate_query_pages_with_keys(self, table_name, key_condition, expression_values, index_name=None,
+                                      filter_expression=None, scan_index_forward=True, projection=None,
+                                      page_size=None, exclusive_start_key=None):
+        items = self.query_table(table_name, key_condition, expression_values, index_name,
+                                 filter_expression, scan_index_forward, projection)
+        size = page_size or 1
+        start = exclusive_start_key["offset"] if exclusive_start_key else 0
+        while True:
+            end = start + size
+            yield items[start:end], ({"offset": end} if end < len(items) else None)
+            if end >= len(items):
+                break
+            start = end
+
+
+class ShardedIndexTest(unittest.TestCase):
+    def test_key_without_configuration_uses_shard_zero(self):
+        with mock.patch.object(config, "GSI_SHARD_COUNTS", {}):
+            self.assertEqual(INDEX.key(100, 7), "100#0")
+            self.assertIsNone(INDEX.key(None, 7))
+
+    def test_key_is_derived_from_seed(self):
+        with mock.patch.object(config, "GSI_SHARD_COUNTS", {"by_product_idx": 4}):
+            self.assertEqual(INDEX.key(100, 7), "100#3")
+            self.assertEqual(INDEX.shard_keys(100), ["100#0", "100#1", "100#2", "100#3"])
+
+    def test_query_without_configuration_uses_legacy_index(self):
+        service = FakeDynamoDBService({100: [{"generated_at": "a"}]})
+        with mock.patch.object(config, "GSI_SHARD_COUNTS", {}):
+            items = query_sharded(service, "certificates", INDEX, 100)
+
+        self.assertEqual(items, [{"generated_at": "a"}])
+        self.assertEqual(service.queries[0][0], "by_product_idx")
+
+    def test_query_merges_shards_by_sort_attribute(self):
+        service = FakeDynamoDBService({
+            "100#0": [{"generated_at": "2025-01-01"}, {"generated_at": "2025-01-04"}],
+            "100#1": [{"generated_at": "2025-01-03"}],
+            "100#2": [{"generated_at": "2025-01-02"}, {"generated_at": ""}],
+        })
+        with mock.patch.object(config, "GSI_SHARD_COUNTS", {"by_product_idx": 3}):
+            items = query_sharded(service, "certificates", INDEX, 100, scan_index_forward=False, projection=["id"])
+
+        self.assertEqual(
+            [item["generated_at"] for item in items],
+            ["2025-01-04", "2025-01-03", "2025-01-02", "2025-01-01", ""],
+        )
+        self.assertEqual({query[0] for query in service.queries}, {"by_product_shard_idx"})
+        self.assertIn("generated_at", service.queries[0][2])
+
+    def test_pages_cover_every_shard(self):
+        service = FakeDynamoDBService({
+            "100#0": [{"generated_at": str(i)} for i in range(3)],
+            "100#1": [{"generated_at": "9"}],
+        })
+        with mock.patch.object(config, "GSI_SHARD_COUNTS", {"by_product_idx": 2}):
+            pages = list(iterate_sharded_pages(service, "certificates", INDEX, 100, page_size=2))
+
+        self.assertEqual(sorted(item["generated_at"] for page in pages for item in page), ["0", "1", "2", "9"])
+
+    def test_certificate_item_gets_shard_keys(self):
+        certificate = Certificate(
+            id=uuid.uuid4(),
+            success=True,
+            order_id=10,
+            order_date="2025-01-01 10:00:00",
+            product_id=100,
+            product_name="Curso",
+            certificate_details="Detalhes",
+            certificate_logo="logo.png",
+            certificate_background="background.png",
+            participant_email="user@example.com",
+            participant_first_name="User",
+            participant_last_name="Test",
+            participant_cpf=None,
+            participant_phone=None,
+            participant_city=None,
+        )
+        repository = CertificateRepositoryImpl(FakeDynamoDBService({}))
+        with mock.patch.object(config, "GSI_SHARD_COUNTS", {"certificates_by_product_idx": 4}):
+            item = repository._prepare_item(certificate)
+
+        self.assertEqual(item["product_shard_key"], "100#2")
+        self.assertEqual(item["success_shard_key"], "1#0")
+
+    def test_product_changes_are_read_from_every_updated_shard(self):
+        updated = {
+            "100#0": ["2025-01-10T12:00:03.000000Z"],
+            "100#1": ["2025-01-10T12:00:01.000000Z", "2025-01-10T12:00:02.000000Z"],
+        }
+        queries = []
+
+        def query_table(table_name, key_condition, expression_values, index_name=None, **kwargs):
+            queries.append((key_condition, index_name, expression_values))
+            return [
+                {"order_id": float(i), "updated_at": value, "product_id": 100.0}
+                for i, value in enumerate(updated[expression_values[":shard_key"]])
+            ]
+
+        service = mock.Mock(**{"query_table.side_effect": query_table})
+        repository = CertificateRepositoryImpl(service)
+        # A quantidade vem do índice por produto, que grava a mesma product_shard_key
+        with mock.patch.object(config, "GSI_SHARD_COUNTS", {"certificates_by_product_idx": 2}):
+            certificates = repository.get_by_product_id_changed_since(
+                100, datetime(2025, 1, 10, 12, 0, tzinfo=timezone.utc), projection=["order_id"]
+            )
+
+        self.assertEqual(
+            sorted(queries, key=lambda query: query[2][":shard_key"]),
+            [
+                ("product_shard_key = :shard_key AND updated_at > :since", "certificates_by_product_updated_shard_idx",
+                 {":shard_key": "100#0", ":since": "2025-01-10T12:00:00.000000Z"}),
+                ("product_shard_key = :shard_key AND updated_at > :since", "certificates_by_product_updated_shard_idx",
+                 {":shard_key": "100#1", ":since": "2025-01-10T12:00:00.000000Z"}),
+            ],
+        )
+        self.assertEqual(
+            [certificate.updated_at for certificate in certificates],
+            ["2025-01-10T12:00:01.000000Z", "2025-01-10T12:00:02.000000Z", "2025-01-10T12:00:03.000000Z"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
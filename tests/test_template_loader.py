@@ -0,0 +1,53 @@
+import gzip
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.main.presentation.template_loader import TemplateLoader, template_loader
+
+
+class TemplateLoaderTestCase(unittest.TestCase):
+    def test_renders_download_page_with_escaped_url(self):
+        url = 'https://example.com/cert.pdf?a=1&b="2"</script>'
+
+        content = template_loader.load_template("certificate_download.html", certificate_url=url)
+
+        self.assertIn('href="https://example.com/cert.pdf?a=1&amp;b=&quot;2&quot;&lt;/script&gt;"', content)
+        self.assertIn('window.location.href = "https://example.com/cert.pdf?a=1\\u0026b=\\"2\\"\\u003c/script\\u003e";', content)
+        self.assertIn("body {", content)
+
+    def test_static_pages_are_prerendered_and_pregzipped(self):
+        for name in (
+            "certificate_not_found.html",
+            "certificate_not_generated.html",
+            "certificate_uuid_invalid.html",
+            "server_error.html",
+        ):
+            self.assertTrue(template_loader.is_static(name))
+            body = template_loader.load_static_bytes(name)
+            self.assertEqual(gzip.decompress(template_loader.load_static_bytes(name, gzipped=True)), body)
+            self.assertEqual(template_loader.load_template(name), body.decode("utf-8"))
+
+        self.assertFalse(template_loader.is_static("certificate_download.html"))
+
+    def test_templates_are_read_only_once(self):
+        with tempfile.TemporaryDirectory() as directory:
+            template_path = Path(directory) / "page.html"
+            template_path.write_text("<style>p { color: red; }</style>{{ name }}", encoding="utf-8")
+            loader = TemplateLoader(Path(directory))
+            template_path.unlink()
+
+            self.assertEqual(loader.load_template("page.html", name="<b>"), "<style>p { color: red; }</style>&lt;b&gt;")
+
+    def test_missing_template_or_variable_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            template_loader.load_template("missing.html")
+        with self.assertRaises(KeyError):
+            template_loader.load_template("certificate_download.html")
+
+
+if __name__ == "__main__":
+    unittest.main()